@@ -5,6 +5,7 @@ Handles critical deviation detection and multi-channel notifications
 
 import json
 import logging
+import operator
 import smtplib
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Set
@@ -80,6 +81,23 @@ class AlertManager:
         self.low_confidence_threshold = config.get('low_confidence_threshold', 0.3)
         self.error_rate_threshold = config.get('error_rate_threshold', 0.1)
         
+        # Threshold rules compiled once for evaluate_conditions:
+        # (data key, comparison, threshold getter, type, severity, title,
+        # message). Thresholds are read through the getter at evaluation
+        # time, so later changes to the attributes apply to both the
+        # comparison and the message.
+        self._rules = [
+            ('task_duration', operator.gt, operator.attrgetter('task_timeout_threshold'),
+             AlertType.TASK_TIMEOUT, AlertSeverity.HIGH, "Task Timeout Detected",
+             lambda v, t: f"Task exceeded {t}s threshold with {v}s duration"),
+            ('confidence', operator.lt, operator.attrgetter('low_confidence_threshold'),
+             AlertType.LOW_CONFIDENCE, AlertSeverity.MEDIUM, "Low Confidence Score",
+             lambda v, t: f"Task confidence ({v:.2f}) below threshold ({t})"),
+            ('error_rate', operator.gt, operator.attrgetter('error_rate_threshold'),
+             AlertType.ERROR_RATE_HIGH, AlertSeverity.HIGH, "High Error Rate",
+             lambda v, t: f"Error rate ({v:.2%}) exceeds threshold ({t:.2%})"),
+        ]
+        
         # Notification channels
         self.email_config = config.get('email', {})
         self.slack_config = config.get('slack', {})
@@ -137,39 +155,17 @@ class AlertManager:
     def evaluate_conditions(self, data: Dict[str, Any], agent_id: str, context: str):
         """Evaluate alert conditions based on incoming data"""
         
-        # Task timeout check
-        if 'task_duration' in data and data['task_duration'] > self.task_timeout_threshold:
-            self.create_alert(
-                AlertType.TASK_TIMEOUT,
-                AlertSeverity.HIGH,
-                f"Task Timeout Detected",
-                f"Task exceeded {self.task_timeout_threshold}s threshold with {data['task_duration']}s duration",
-                agent_id,
-                {'task_duration': data['task_duration'], 'context': context}
-            )
-            
-        # Low confidence check
-        if 'confidence' in data and data['confidence'] < self.low_confidence_threshold:
-            self.create_alert(
-                AlertType.LOW_CONFIDENCE,
-                AlertSeverity.MEDIUM,
-                f"Low Confidence Score",
-                f"Task confidence ({data['confidence']:.2f}) below threshold ({self.low_confidence_threshold})",
-                agent_id,
-                {'confidence': data['confidence'], 'context': context}
-            )
-            
-        # Error rate check
-        if 'error_rate' in data and data['error_rate'] > self.error_rate_threshold:
-            self.create_alert(
-                AlertType.ERROR_RATE_HIGH,
-                AlertSeverity.HIGH,
-                f"High Error Rate",
-                f"Error rate ({data['error_rate']:.2%}) exceeds threshold ({self.error_rate_threshold:.2%})",
-                agent_id,
-                {'error_rate': data['error_rate'], 'context': context}
-            )
-            
+        for key, compare, threshold_of, alert_type, severity, title, describe in self._rules:
+            value = data.get(key)
+            if value is None:
+                continue
+            threshold = threshold_of(self)
+            if compare(value, threshold):
+                self.create_alert(
+                    alert_type, severity, title, describe(value, threshold),
+                    agent_id, {key: value, 'context': context}
+                )
+                
     def _generate_alert_hash(self, alert_type: AlertType, agent_id: Optional[str], title: str) -> str:
         """Generate hash for alert deduplication"""
         content = f"{alert_type.value}:{agent_id or 'system'}:{title}"
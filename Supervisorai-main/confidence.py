@@ -68,6 +68,11 @@ class ConfidenceReporter:
         # Memory storage for recent entries
         self.memory_entries: deque = deque(maxlen=self.max_memory_entries)
         
+        # Metrics memo keyed on (record count, hours); cleared on each record
+        self._record_count = 0
+        self._metrics_cache: Dict[Tuple[int, int], ConfidenceMetrics] = {}
+        self._metrics_minute: Optional[datetime] = None
+        
         # Load existing data
         self._load_existing_data()
         
@@ -92,6 +97,8 @@ class ConfidenceReporter:
         
         # Add to memory
         self.memory_entries.append(entry)
+        self._record_count += 1
+        self._metrics_cache.clear()
         
         # Persist to file
         self._write_entry_to_file(entry)
@@ -99,8 +106,49 @@ class ConfidenceReporter:
         self.logger.debug(f"Recorded confidence entry for task {task_id}")
         return f"{entry.timestamp.isoformat()}_{task_id}"
         
+    def record_confidences(self, entries: List[ConfidenceEntry]) -> List[str]:
+        """Record a batch of confidence entries with one append and one file write"""
+        
+        if not entries:
+            return []
+            
+        for entry in entries:
+            entry.predicted_confidence = max(0.0, min(1.0, entry.predicted_confidence))
+            
+        # Add to memory
+        self.memory_entries.extend(entries)
+        self._record_count += len(entries)
+        self._metrics_cache.clear()
+        
+        # Persist to file
+        self._write_entries_to_file(entries)
+        
+        self.logger.debug(f"Recorded {len(entries)} confidence entries")
+        return [f"{e.timestamp.isoformat()}_{e.task_id}" for e in entries]
+        
     def generate_metrics(self, hours: int = 24) -> ConfidenceMetrics:
-        """Generate comprehensive confidence metrics for specified period"""
+        """Generate comprehensive confidence metrics for specified period.
+        
+        Results are memoized until the next recorded entry or the next
+        wall-clock minute, whichever comes first, so the window never lags
+        the clock by more than a minute.
+        """
+        
+        minute = datetime.now().replace(second=0, microsecond=0)
+        if minute != self._metrics_minute:
+            self._metrics_cache.clear()
+            self._metrics_minute = minute
+        
+        cache_key = (self._record_count, hours)
+        cached = self._metrics_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        metrics = self._compute_metrics(hours)
+        self._metrics_cache[cache_key] = metrics
+        return metrics
+        
+    def _compute_metrics(self, hours: int) -> ConfidenceMetrics:
+        """Compute confidence metrics over the last `hours` hours"""
         
         end_time = datetime.now()
         start_time = end_time - timedelta(hours=hours)
@@ -455,23 +503,35 @@ class ConfidenceReporter:
         """Write confidence entry to persistent storage"""
         
         try:
-            entry_dict = {
-                'timestamp': entry.timestamp.isoformat(),
-                'agent_id': entry.agent_id,
-                'task_id': entry.task_id,
-                'predicted_confidence': entry.predicted_confidence,
-                'actual_success': entry.actual_success,
-                'task_duration': entry.task_duration,
-                'task_type': entry.task_type,
-                'context': entry.context
-            }
-            
             with open(self.data_file, 'a') as f:
-                f.write(json.dumps(entry_dict) + '\n')
+                f.write(json.dumps(self._entry_to_dict(entry)) + '\n')
                 
         except Exception as e:
             self.logger.error(f"Failed to write confidence entry to file: {e}")
             
+    def _write_entries_to_file(self, entries: List[ConfidenceEntry]):
+        """Write a batch of confidence entries with a single writelines"""
+        
+        try:
+            with open(self.data_file, 'a') as f:
+                f.writelines(json.dumps(self._entry_to_dict(e)) + '\n' for e in entries)
+                
+        except Exception as e:
+            self.logger.error(f"Failed to write confidence entries to file: {e}")
+            
+    def _entry_to_dict(self, entry: ConfidenceEntry) -> Dict[str, Any]:
+        """Convert an entry to its JSONL representation"""
+        return {
+            'timestamp': entry.timestamp.isoformat(),
+            'agent_id': entry.agent_id,
+            'task_id': entry.task_id,
+            'predicted_confidence': entry.predicted_confidence,
+            'actual_success': entry.actual_success,
+            'task_duration': entry.task_duration,
+            'task_type': entry.task_type,
+            'context': entry.context
+        }
+            
     def _load_existing_data(self):
         """Load existing confidence data from file"""
         
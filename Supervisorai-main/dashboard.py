@@ -11,6 +11,11 @@ from dataclasses import dataclass, asdict
 from collections import defaultdict
 import statistics
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 
 @dataclass
 class DashboardMetrics:
@@ -566,8 +571,15 @@ class DashboardManager:
             # Convert datetime objects to strings
             export_data['metrics']['timestamp'] = dashboard_data.metrics.timestamp.isoformat()
             
-            with open(output_file, 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
+            if orjson is not None:
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(
+                        export_data, default=str,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    ))
+            else:
+                with open(output_file, 'w') as f:
+                    json.dump(export_data, f, indent=2, default=str)
                 
             self.logger.info(f"Dashboard data exported to {output_file}")
             return True
@@ -9,9 +9,14 @@ import logging
 from datetime import datetime, timedelta
 from pathlib import Path
 
-# Setup logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Setup logging; handlers are only configured when run as a script
 logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
 
 # Import components directly
 from alerts import AlertManager, AlertType, AlertSeverity
@@ -21,6 +26,12 @@ from confidence import ConfidenceReporter
 from patterns import PatternTracker
 from dashboard import DashboardManager
 
+def _json_bytes(obj):
+    """Serialize obj as indented JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
 def quick_demo():
     """Run a quick demonstration of core reporting capabilities"""
     
@@ -63,39 +74,49 @@ def quick_demo():
         )
         
         active_alerts = alert_manager.get_active_alerts()
-        logger.info(f"Created {len(active_alerts)} active alerts")
+        logger.info("Created %d active alerts", len(active_alerts))
         
         # Export alert summary
         alert_summary = alert_manager.get_alerts_summary()
-        with open(output_dir / "alerts.json", 'w') as f:
-            json.dump(alert_summary, f, indent=2)
+        (output_dir / "alerts.json").write_bytes(_json_bytes(alert_summary))
         
         # 2. Demo Audit System
         logger.info("\n2. Testing Audit System...")
-        audit_config = {
-            'log_directory': str(output_dir / 'audit_logs'),
-            'max_memory_events': 1000,
-            'queue_size': 100
-        }
-        audit_manager = AuditTrailManager(audit_config)
-        
-        # Log various events
-        audit_manager.log_task_started("test_agent", "demo_task_1", "processing",
-                                     {'input_size': 1024})
-        
-        audit_manager.log_decision("test_agent", "algorithm_selection", "algorithm_A",
-                                 0.85, "Best performance for input type",
-                                 {'alternatives': ['algorithm_B']})
-        
-        audit_manager.log_task_completed("test_agent", "demo_task_1", 23.4, 0.89,
-                                       {'output_size': 512})
-        
-        audit_manager.log_task_failed("test_agent", "demo_task_2", "timeout", 45.2,
-                                    {'retry_count': 3})
+        audit_dir = output_dir / 'audit_logs'
+        audit_manager = AuditTrailManager(str(audit_dir / 'audit_events.jsonl'),
+                                          str(audit_dir / 'audit.db'))
+        
+        # Log various events in one batch; the audit writer thread
+        # persists them in the background
+        audit_manager.log_events([
+            {'event_type': AuditEventType.TASK_STARTED,
+             'level': AuditLevel.INFO, 'source': 'test_agent',
+             'message': 'processing',
+             'metadata': {'input_size': 1024},
+             'context': {'task_id': 'demo_task_1'}},
+            {'event_type': AuditEventType.DECISION_MADE,
+             'level': AuditLevel.INFO, 'source': 'test_agent',
+             'message': 'Best performance for input type',
+             'metadata': {'alternatives': ['algorithm_B']},
+             'context': {'decision': 'algorithm_selection',
+                         'choice': 'algorithm_A', 'confidence': 0.85}},
+            {'event_type': AuditEventType.TASK_COMPLETED,
+             'level': AuditLevel.INFO, 'source': 'test_agent',
+             'message': 'Task completed',
+             'metadata': {'output_size': 512},
+             'context': {'task_id': 'demo_task_1', 'duration': 23.4,
+                         'confidence': 0.89}},
+            {'event_type': AuditEventType.TASK_FAILED,
+             'level': AuditLevel.ERROR, 'source': 'test_agent',
+             'message': 'timeout',
+             'metadata': {'retry_count': 3},
+             'context': {'task_id': 'demo_task_2', 'duration': 45.2}},
+        ])
+        audit_manager.flush()
         
         # Query recent events
-        recent_events = audit_manager.get_recent_events(10)
-        logger.info(f"Logged {len(recent_events)} audit events")
+        recent_events = audit_manager.search(limit=10)
+        logger.info("Logged %d audit events", len(recent_events))
         
         # Export audit events
         audit_manager.export_events(str(output_dir / "audit_events.json"), format='json')
@@ -121,23 +142,21 @@ def quick_demo():
         
         # Generate confidence metrics
         metrics = confidence_reporter.generate_metrics(hours=1)
-        logger.info(f"Confidence metrics: {metrics.total_entries} entries, "
-                   f"{metrics.accuracy:.2%} accuracy, {metrics.calibration_error:.3f} cal error")
+        logger.info("Confidence metrics: %d entries, %.2f%% accuracy, %.3f cal error",
+                    metrics.total_entries, metrics.accuracy * 100, metrics.calibration_error)
         
         # Export confidence data
-        with open(output_dir / "confidence_metrics.json", 'w') as f:
-            json.dump({
-                'total_entries': metrics.total_entries,
-                'mean_confidence': metrics.mean_confidence,
-                'accuracy': metrics.accuracy,
-                'calibration_error': metrics.calibration_error,
-                'brier_score': metrics.brier_score
-            }, f, indent=2)
+        (output_dir / "confidence_metrics.json").write_bytes(_json_bytes({
+            'total_entries': metrics.total_entries,
+            'mean_confidence': metrics.mean_confidence,
+            'accuracy': metrics.accuracy,
+            'calibration_error': metrics.calibration_error,
+            'brier_score': metrics.brier_score
+        }))
         
         # Generate calibration report
         calibration_report = confidence_reporter.generate_calibration_report(metrics)
-        with open(output_dir / "confidence_report.md", 'w') as f:
-            f.write(calibration_report)
+        (output_dir / "confidence_report.md").write_text(calibration_report)
         
         # 4. Demo Pattern System
         logger.info("\n4. Testing Pattern System...")
@@ -151,9 +170,11 @@ def quick_demo():
         
         # Create mock events for pattern detection
         events = []
+        now = datetime.now()
+        event_ts = [(now - timedelta(hours=i)).isoformat() for i in range(10)]
         for i in range(10):
             events.append({
-                'timestamp': (datetime.now() - timedelta(hours=i)).isoformat(),
+                'timestamp': event_ts[i],
                 'event_type': 'task_failed' if i % 3 == 0 else 'task_completed',
                 'level': 'error' if i % 3 == 0 else 'info',
                 'agent_id': f'agent_{i%2:02d}',
@@ -164,8 +185,8 @@ def quick_demo():
         
         # Analyze patterns
         analysis_result = pattern_tracker.analyze_events(events)
-        logger.info(f"Pattern analysis: {analysis_result.patterns_detected} patterns detected, "
-                   f"{analysis_result.new_patterns} new patterns")
+        logger.info("Pattern analysis: %d patterns detected, %d new patterns",
+                    analysis_result.patterns_detected, analysis_result.new_patterns)
         
         # Export pattern data
         pattern_tracker.export_patterns(str(output_dir / "patterns.json"))
@@ -184,9 +205,10 @@ def quick_demo():
         
         # Generate dashboard data
         dashboard_data = dashboard_manager.generate_dashboard_data()
-        logger.info(f"Dashboard: {dashboard_data.metrics.system_status} status, "
-                   f"{dashboard_data.metrics.total_agents} agents, "
-                   f"{len(dashboard_data.charts)} charts")
+        logger.info("Dashboard: %s status, %d agents, %d charts",
+                    dashboard_data.metrics.system_status,
+                    dashboard_data.metrics.total_agents,
+                    len(dashboard_data.charts))
         
         # Export dashboard data
         dashboard_manager.export_dashboard_data(str(output_dir / "dashboard.json"))
@@ -197,7 +219,7 @@ def quick_demo():
         # Mock data source for report generator
         class MockDataSource:
             def get_tasks_in_period(self, start_time, end_time):
-                return [{
+                return ({
                     'task_id': f'task_{i}',
                     'agent_id': f'agent_{i%3:02d}',
                     'start_time': (start_time + timedelta(minutes=i*10)).isoformat(),
@@ -205,7 +227,7 @@ def quick_demo():
                     'status': 'completed' if i % 4 != 0 else 'failed',
                     'confidence': 0.8 - (i * 0.02),
                     'errors': [] if i % 4 != 0 else [{'type': 'timeout'}]
-                } for i in range(10)]
+                } for i in range(10))
         
         report_generator = ReportGenerator(MockDataSource(), {
             'optimal_duration': 30,
@@ -214,13 +236,12 @@ def quick_demo():
         
         # Generate period summary
         summary = report_generator.generate_period_summary(hours=1)
-        logger.info(f"Summary: {summary.total_tasks} tasks, "
-                   f"{summary.overall_success_rate:.1%} success rate")
+        logger.info("Summary: %d tasks, %.1f%% success rate",
+                    summary.total_tasks, summary.overall_success_rate * 100)
         
         # Generate markdown report
         markdown_report = report_generator.generate_markdown_report(summary)
-        with open(output_dir / "summary_report.md", 'w') as f:
-            f.write(markdown_report)
+        (output_dir / "summary_report.md").write_text(markdown_report)
         
         # Export summary JSON
         report_generator.export_summary_json(summary, str(output_dir / "summary.json"))
@@ -307,22 +328,21 @@ Successfully demonstrated all core reporting system components:
 **Demo completed successfully! All reporting capabilities functional.**
 """
         
-        with open(output_dir / "demo_report.md", 'w') as f:
-            f.write(demo_report)
+        (output_dir / "demo_report.md").write_text(demo_report)
         
         # Count output files
         output_files = list(output_dir.rglob('*'))
         file_count = len([f for f in output_files if f.is_file()])
         
-        logger.info(f"\n=== Demo Completed Successfully! ===")
-        logger.info(f"Generated {file_count} output files in '{output_dir}'")
-        logger.info(f"Key outputs: demo_report.md, dashboard.json, summary_report.md")
-        logger.info(f"All core reporting components are functional and ready for production use.")
+        logger.info("\n=== Demo Completed Successfully! ===")
+        logger.info("Generated %d output files in '%s'", file_count, output_dir)
+        logger.info("Key outputs: demo_report.md, dashboard.json, summary_report.md")
+        logger.info("All core reporting components are functional and ready for production use.")
         
         return True
         
     except Exception as e:
-        logger.error(f"Demo failed: {e}", exc_info=True)
+        logger.error("Demo failed: %s", e, exc_info=True)
         return False
     finally:
         # Cleanup
@@ -330,5 +350,6 @@ Successfully demonstrated all core reporting system components:
             audit_manager.shutdown()
 
 if __name__ == "__main__":
+    logging.basicConfig(format='%(asctime)s - %(levelname)s - %(message)s')
     success = quick_demo()
     exit(0 if success else 1)
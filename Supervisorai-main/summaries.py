@@ -11,6 +11,11 @@ from dataclasses import dataclass, asdict
 from collections import defaultdict
 import statistics
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 
 @dataclass
 class TaskSummary:
@@ -75,14 +80,15 @@ class ReportGenerator:
         
         self.logger.info(f"Generating {hours}h summary from {start_time} to {end_time}")
         
-        # Get tasks for the period
+        # Get tasks for the period; any iterable is accepted and consumed once
         tasks = self.data_source.get_tasks_in_period(start_time, end_time)
         
-        if not tasks:
-            return self._create_empty_summary(start_time, end_time)
-            
         # Process tasks
         task_summaries = [self._create_task_summary(task) for task in tasks]
+        
+        if not task_summaries:
+            return self._create_empty_summary(start_time, end_time)
+            
         agent_summaries = self._create_agent_summaries(task_summaries)
         
         # Calculate overall metrics
@@ -420,7 +426,14 @@ class ReportGenerator:
         data['period_end'] = summary.period_end.isoformat()
         data['timestamp'] = summary.timestamp.isoformat()
         
-        with open(output_file, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(
+                    data, default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(data, f, indent=2, default=str)
             
         self.logger.info(f"Exported summary to {output_file}")
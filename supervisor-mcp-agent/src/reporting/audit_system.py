@@ -7,12 +7,13 @@ Handles structured logging, audit trails, and log aggregation with searchable me
 import json
 import logging
 import hashlib
+import itertools
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass, asdict, field
 from pathlib import Path
 import threading
-from queue import Queue
+from queue import Queue, Empty
 from enum import Enum
 import sqlite3
 from contextlib import contextmanager
@@ -73,6 +74,7 @@ class AuditLogger:
         self.session_id = hashlib.md5(
             datetime.now().isoformat().encode()
         ).hexdigest()[:12]
+        self._event_seq = itertools.count()
         
         # Ensure log directory exists
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
@@ -137,23 +139,45 @@ class AuditLogger:
         self.log_thread.start()
     
     def _log_worker(self):
-        """Background worker for writing logs"""
-        while True:
-            try:
-                event = self.log_queue.get()
-                if event is None:  # Shutdown signal
+        """Background worker for writing logs.
+        
+        Everything already queued is written together, so a burst of
+        events costs one file open and one write.
+        """
+        running = True
+        while running:
+            items = [self.log_queue.get()]
+            while True:
+                try:
+                    items.append(self.log_queue.get_nowait())
+                except Empty:
                     break
+            
+            try:
+                events = []
+                for item in items:
+                    if item is None:  # Shutdown signal
+                        running = False
+                    elif isinstance(item, list):  # Batch from log_events
+                        events.extend(item)
+                    else:
+                        events.append(item)
                 
-                # Write to JSON log file
-                with open(self.log_file, 'a') as f:
-                    f.write(event.to_json() + '\n')
-                
-                # Write to database if enabled
-                if self.db_file:
-                    self._write_to_database(event)
+                if events:
+                    # Write to JSON log file
+                    with open(self.log_file, 'a') as f:
+                        f.write(''.join(event.to_json() + '\n' for event in events))
+                    
+                    # Write to database if enabled
+                    if self.db_file:
+                        for event in events:
+                            self._write_to_database(event)
                 
             except Exception as e:
                 self.logger.error(f"Error writing audit log: {e}")
+            finally:
+                for _ in items:
+                    self.log_queue.task_done()
     
     def _write_to_database(self, event: AuditEvent):
         """Write event to SQLite database"""
@@ -183,21 +207,38 @@ class AuditLogger:
                   correlation_id: Optional[str] = None,
                   user_id: Optional[str] = None) -> str:
         """Log an audit event"""
+        event = self._build_event(event_type, level, source, message,
+                                  metadata, context, tags, correlation_id,
+                                  user_id)
+        
+        # Queue for async processing
+        self.log_queue.put(event)
         
-        # Generate unique event ID
+        return event.id
+    
+    def _build_event(self, event_type: Union[AuditEventType, str],
+                     level: Union[AuditLevel, str], source: str, message: str,
+                     metadata: Optional[Dict[str, Any]] = None,
+                     context: Optional[Dict[str, Any]] = None,
+                     tags: Optional[List[str]] = None,
+                     correlation_id: Optional[str] = None,
+                     user_id: Optional[str] = None) -> AuditEvent:
+        """Create an AuditEvent from log_event arguments"""
+        timestamp = datetime.now().isoformat()
+        # The sequence number keeps ids unique for identical entries
+        # logged within the same clock tick
         event_id = hashlib.sha256(
-            f"{datetime.now().isoformat()}:{source}:{message}".encode()
+            f"{timestamp}:{next(self._event_seq)}:{source}:{message}".encode()
         ).hexdigest()[:16]
         
-        # Convert enums to strings
         if isinstance(event_type, AuditEventType):
             event_type = event_type.value
         if isinstance(level, AuditLevel):
             level = level.value
         
-        event = AuditEvent(
+        return AuditEvent(
             id=event_id,
-            timestamp=datetime.now().isoformat(),
+            timestamp=timestamp,
             event_type=event_type,
             level=level,
             source=source,
@@ -209,11 +250,20 @@ class AuditLogger:
             session_id=self.session_id,
             user_id=user_id
         )
+    
+    def log_events(self, entries: List[Dict[str, Any]]) -> List[str]:
+        """Log a batch of audit events with a single queue put.
         
-        # Queue for async processing
-        self.log_queue.put(event)
-        
-        return event_id
+        Each entry holds the keyword arguments accepted by log_event.
+        """
+        events = [self._build_event(**entry) for entry in entries]
+        if events:
+            self.log_queue.put(events)
+        return [event.id for event in events]
+    
+    def flush(self):
+        """Block until every queued event has been written"""
+        self.log_queue.join()
     
     def shutdown(self):
         """Shutdown the audit logger"""
@@ -490,6 +540,14 @@ class ComprehensiveAuditSystem:
         """Main logging interface"""
         return self.logger.log_event(event_type, level, source, message, **kwargs)
     
+    def log_events(self, entries: List[Dict[str, Any]]) -> List[str]:
+        """Batch logging interface"""
+        return self.logger.log_events(entries)
+    
+    def flush(self):
+        """Wait for queued events to reach the log file and database"""
+        self.logger.flush()
+    
     def search(self, **kwargs) -> List[AuditEvent]:
         """Search interface"""
         return self.searcher.search_events(**kwargs)
@@ -4,17 +4,24 @@ Comprehensive demo script showcasing all reporting system capabilities
 """
 
 import time
+import io
+import os
 import json
-import random
+import signal
+import sys
+import threading
+import numpy as np
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the scenario draw runs as plain NumPy
+    njit = None
+
 # Import all system components
 from integrated_system import IntegratedReportingSystem, IntegratedReportingConfig
-from alert_system import RealTimeAlertSystem
-from confidence_system import ConfidenceReportingSystem
-from pattern_system import ComprehensivePatternSystem
-from audit_system import ComprehensiveAuditSystem
 
 def create_comprehensive_demo():
     """Create comprehensive demo with realistic scenarios"""
@@ -49,6 +56,161 @@ def create_comprehensive_demo():
     
     return system, demo_dir
 
+# Seconds to sleep per simulated task; 0 (default) runs the workload flat out
+PACING = float(os.environ.get('DEMO_PACING', '0.0'))
+
+# Bounded hand-off between the workload producer and the ingest consumer
+EVENT_QUEUE_CAPACITY = 1024
+EVENT_BATCH_SIZE = 64
+
+def _enqueue_event(queue, cond, event):
+    """Append an event to the shared queue, blocking while it is full"""
+    with cond:
+        while len(queue) >= EVENT_QUEUE_CAPACITY:
+            cond.wait()
+        queue.append(event)
+        cond.notify_all()
+
+if njit is not None:
+    @njit(cache=True)
+    def _draw_scenario(n, clo, chi, dlo, dhi, srate, n_agents, n_errs, n_complex, seed):
+        """Draw all numeric per-task values for one scenario"""
+        # Inside compiled code this seeds numba's own generator, not NumPy's
+        np.random.seed(seed)
+        conf = np.empty(n)
+        dur = np.empty(n)
+        succ = np.empty(n, np.bool_)
+        agent_idx = np.empty(n, np.int64)
+        err_idx = np.empty(n, np.int64)
+        complexity_idx = np.empty(n, np.int64)
+        for i in range(n):
+            conf[i] = np.random.uniform(clo, chi)
+            dur[i] = np.random.uniform(dlo, dhi)
+            succ[i] = np.random.random() < srate
+            agent_idx[i] = np.random.randint(0, n_agents)
+            err_idx[i] = np.random.randint(0, n_errs)
+            complexity_idx[i] = np.random.randint(0, n_complex)
+        return conf, dur, succ, agent_idx, err_idx, complexity_idx
+else:
+    def _draw_scenario(n, clo, chi, dlo, dhi, srate, n_agents, n_errs, n_complex, seed):
+        """Draw all numeric per-task values for one scenario"""
+        # A local generator leaves the global NumPy RNG state untouched
+        rng = np.random.default_rng(seed)
+        conf = rng.uniform(clo, chi, n)
+        dur = rng.uniform(dlo, dhi, n)
+        succ = rng.random(n) < srate
+        agent_idx = rng.integers(0, n_agents, n)
+        err_idx = rng.integers(0, n_errs, n)
+        complexity_idx = rng.integers(0, n_complex, n)
+        return conf, dur, succ, agent_idx, err_idx, complexity_idx
+
+def _produce_workload_events(scenarios, queue, cond, done):
+    """Generate simulated agent events and hand them to the consumer"""
+    agents = ['reasoning_agent', 'classifier_agent', 'processor_agent']
+    complexities = ('low', 'medium', 'high')
+    error_types = ['timeout', 'validation_error', 'resource_exhausted', 'network_error']
+    
+    # Lookup tables indexed by per-scenario index arrays drawn up front
+    agents_arr = np.array(agents, dtype=object)
+    err_arr = np.array(error_types, dtype=object)
+    rng = np.random.default_rng()
+    
+    try:
+        for scenario_idx, scenario in enumerate(scenarios):
+            ttype = scenario['task_type']
+            count = scenario['count']
+            print(f"\nRunning scenario {scenario_idx + 1}: {ttype}")
+            
+            conf, dur, succ, agent_idx, err_idx, complexity_idx = _draw_scenario(
+                count,
+                *scenario['confidence_range'],
+                *scenario['duration_range'],
+                scenario['success_rate'],
+                len(agents_arr), len(err_arr), len(complexities),
+                int(rng.integers(2**31))
+            )
+            # Plain Python floats/bools for the event payloads
+            conf, dur, succ = conf.tolist(), dur.tolist(), succ.tolist()
+            
+            # Per-scenario ids and message text, built once outside the task loop
+            task_ids = [f"{ttype}_{scenario_idx}_{i:03d}" for i in range(count)]
+            corr_ids = ['corr_' + t for t in task_ids]
+            msg_start = f"Starting {ttype} task"
+            msg_confidence = f"Recording confidence for {ttype}"
+            msg_completed = f"{ttype} task completed successfully"
+            
+            # Event payload templates; the loop copies and fills the varying fields
+            started_tmpl = {'task_id': None, 'agent_id': None, 'task_type': ttype, 'complexity': None}
+            confidence_tmpl = {'task_id': None, 'agent_id': None, 'decision_type': ttype, 'confidence_score': None}
+            completed_tmpl = {'task_id': None, 'agent_id': None, 'success': True,
+                              'duration_seconds': None, 'confidence_score': None}
+            error_tmpl = {'task_id': None, 'agent_id': None, 'error_type': None, 'duration_seconds': None}
+            failed_tmpl = {'task_id': None, 'agent_id': None, 'success': False,
+                           'duration_seconds': None, 'error_type': None}
+            
+            for task_idx in range(count):
+                agent_id = agents_arr[agent_idx[task_idx]]
+                task_id = task_ids[task_idx]
+                correlation_id = corr_ids[task_idx]
+                
+                # Task started
+                ctx = started_tmpl.copy()
+                ctx['task_id'] = task_id
+                ctx['agent_id'] = agent_id
+                ctx['complexity'] = complexities[complexity_idx[task_idx]]
+                _enqueue_event(queue, cond, ('task_started', agent_id, msg_start, ctx, correlation_id))
+                
+                # Confidence recording
+                confidence = conf[task_idx]
+                ctx = confidence_tmpl.copy()
+                ctx['task_id'] = task_id
+                ctx['agent_id'] = agent_id
+                ctx['confidence_score'] = confidence
+                _enqueue_event(queue, cond, ('confidence_recorded', agent_id, msg_confidence, ctx, correlation_id))
+                
+                # Simulated processing time and outcome
+                duration = dur[task_idx]
+                
+                if succ[task_idx]:
+                    # Task completed
+                    ctx = completed_tmpl.copy()
+                    ctx['task_id'] = task_id
+                    ctx['agent_id'] = agent_id
+                    ctx['duration_seconds'] = duration
+                    ctx['confidence_score'] = confidence
+                    _enqueue_event(queue, cond, ('task_completed', agent_id, msg_completed, ctx, correlation_id))
+                else:
+                    # Task failed
+                    error_type = err_arr[err_idx[task_idx]]
+                    
+                    ctx = error_tmpl.copy()
+                    ctx['task_id'] = task_id
+                    ctx['agent_id'] = agent_id
+                    ctx['error_type'] = error_type
+                    ctx['duration_seconds'] = duration
+                    _enqueue_event(queue, cond, (
+                        'error_occurred', agent_id, f"{error_type} in {ttype} task", ctx, correlation_id
+                    ))
+                    
+                    ctx = failed_tmpl.copy()
+                    ctx['task_id'] = task_id
+                    ctx['agent_id'] = agent_id
+                    ctx['duration_seconds'] = duration
+                    ctx['error_type'] = error_type
+                    _enqueue_event(queue, cond, (
+                        'task_failed', agent_id, f"{ttype} task failed due to {error_type}", ctx, correlation_id
+                    ))
+                
+                # Optional pause to simulate realistic timing
+                if PACING > 0:
+                    time.sleep(PACING)
+            
+            print(f"  Completed {count} {ttype} tasks")
+    finally:
+        with cond:
+            done.set()
+            cond.notify_all()
+
 def simulate_realistic_workload(system):
     """Simulate realistic AI agent workload"""
     print("\n📊 Simulating Realistic Agent Workload")
@@ -81,200 +243,141 @@ def simulate_realistic_workload(system):
         }
     ]
     
-    agents = ['reasoning_agent', 'classifier_agent', 'processor_agent']
+    # Generate events on a producer thread so simulation overlaps with ingest
+    queue = deque()
+    cond = threading.Condition()
+    done = threading.Event()
+    producer = threading.Thread(
+        target=_produce_workload_events,
+        args=(scenarios, queue, cond, done),
+        daemon=True
+    )
+    producer.start()
     
-    for scenario_idx, scenario in enumerate(scenarios):
-        print(f"\nRunning scenario {scenario_idx + 1}: {scenario['task_type']}")
-        
-        for task_idx in range(scenario['count']):
-            agent_id = random.choice(agents)
-            task_id = f"{scenario['task_type']}_{scenario_idx}_{task_idx:03d}"
-            correlation_id = f"corr_{task_id}"
-            
-            # Task started
-            system.log_event(
-                'task_started',
-                agent_id,
-                f"Starting {scenario['task_type']} task",
-                {
-                    'task_id': task_id,
-                    'agent_id': agent_id,
-                    'task_type': scenario['task_type'],
-                    'complexity': random.choice(['low', 'medium', 'high'])
-                },
-                correlation_id
-            )
-            
-            # Confidence recording
-            confidence = random.uniform(*scenario['confidence_range'])
-            system.log_event(
-                'confidence_recorded',
-                agent_id,
-                f"Recording confidence for {scenario['task_type']}",
-                {
-                    'task_id': task_id,
-                    'agent_id': agent_id,
-                    'decision_type': scenario['task_type'],
-                    'confidence_score': confidence
-                },
-                correlation_id
-            )
-            
-            # Simulate processing time
-            duration = random.uniform(*scenario['duration_range'])
-            
-            # Determine outcome
-            success = random.random() < scenario['success_rate']
-            
-            if success:
-                # Task completed
-                system.log_event(
-                    'task_completed',
-                    agent_id,
-                    f"{scenario['task_type']} task completed successfully",
-                    {
-                        'task_id': task_id,
-                        'agent_id': agent_id,
-                        'success': True,
-                        'duration_seconds': duration,
-                        'confidence_score': confidence
-                    },
-                    correlation_id
-                )
-            else:
-                # Task failed
-                error_types = ['timeout', 'validation_error', 'resource_exhausted', 'network_error']
-                error_type = random.choice(error_types)
-                
-                system.log_event(
-                    'error_occurred',
-                    agent_id,
-                    f"{error_type} in {scenario['task_type']} task",
-                    {
-                        'task_id': task_id,
-                        'agent_id': agent_id,
-                        'error_type': error_type,
-                        'duration_seconds': duration
-                    },
-                    correlation_id
-                )
-                
-                system.log_event(
-                    'task_failed',
-                    agent_id,
-                    f"{scenario['task_type']} task failed due to {error_type}",
-                    {
-                        'task_id': task_id,
-                        'agent_id': agent_id,
-                        'success': False,
-                        'duration_seconds': duration,
-                        'error_type': error_type
-                    },
-                    correlation_id
-                )
-            
-            # Brief pause to simulate realistic timing
-            time.sleep(0.1)
-        
-        print(f"  Completed {scenario['count']} {scenario['task_type']} tasks")
+    while True:
+        with cond:
+            while not queue and not done.is_set():
+                cond.wait()
+            if not queue:
+                break
+            batch = [queue.popleft() for _ in range(min(len(queue), EVENT_BATCH_SIZE))]
+            cond.notify_all()
+        system.log_events_bulk(batch)
     
+    producer.join()
     print("\n✅ Workload simulation complete")
 
+def _emit(lines):
+    """Write a block of buffered output lines in one call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    lines.clear()
+
 def demonstrate_system_capabilities(system, demo_dir):
     """Demonstrate all system capabilities"""
-    print("\n🔧 Demonstrating System Capabilities")
-    print("-" * 40)
+    lines = []
+    out = lines.append
+    out("\n🔧 Demonstrating System Capabilities")
+    out("-" * 40)
     
     # 1. Generate comprehensive reports
-    print("\n1. Generating Comprehensive Reports...")
+    out("\n1. Generating Comprehensive Reports...")
+    _emit(lines)
     reports = system.generate_comprehensive_report()
     for report_type, file_path in reports.items():
         if file_path:
-            print(f"   ✅ {report_type}: {file_path}")
+            out(f"   ✅ {report_type}: {file_path}")
         else:
-            print(f"   ❌ {report_type}: Failed to generate")
+            out(f"   ❌ {report_type}: Failed to generate")
     
     # 2. System status
-    print("\n2. System Status Analysis...")
+    out("\n2. System Status Analysis...")
     status = system.get_system_status()
-    print(f"   Active systems: {len([s for s in status['systems'].values() if s.get('status') == 'active'])}")
-    print(f"   Background processing: {status['background_processing']}")
+    out(f"   Active systems: {len([s for s in status['systems'].values() if s.get('status') == 'active'])}")
+    out(f"   Background processing: {status['background_processing']}")
     
     for system_name, system_status in status['systems'].items():
         if system_status.get('status') == 'active':
-            print(f"   ✅ {system_name}: Active")
+            out(f"   ✅ {system_name}: Active")
             # Print specific metrics if available
             if 'total_events' in system_status:
-                print(f"      - Events: {system_status['total_events']}")
+                out(f"      - Events: {system_status['total_events']}")
             if 'total_entries' in system_status:
-                print(f"      - Entries: {system_status['total_entries']}")
+                out(f"      - Entries: {system_status['total_entries']}")
             if 'total_patterns' in system_status:
-                print(f"      - Patterns: {system_status['total_patterns']}")
+                out(f"      - Patterns: {system_status['total_patterns']}")
         else:
-            print(f"   ❌ {system_name}: {system_status.get('status', 'unknown')}")
+            out(f"   ❌ {system_name}: {system_status.get('status', 'unknown')}")
     
     # 3. Export system state
-    print("\n3. Exporting Complete System State...")
+    out("\n3. Exporting Complete System State...")
+    _emit(lines)
     state_file = system.export_complete_system_state(str(demo_dir / "complete_system_state.json"))
     if state_file:
-        print(f"   ✅ System state: {state_file}")
+        out(f"   ✅ System state: {state_file}")
     else:
-        print(f"   ❌ System state export failed")
+        out(f"   ❌ System state export failed")
     
     # 4. Individual system demonstrations
-    print("\n4. Individual System Capabilities...")
+    out("\n4. Individual System Capabilities...")
+    _emit(lines)
+    systems = system.systems
     
     # Audit system
-    if 'audit_system' in system.systems:
-        audit_system = system.systems['audit_system']
+    audit_system = systems.get('audit_system')
+    if audit_system is not None:
         recent_events = audit_system.search(limit=10)
-        print(f"   📝 Audit System: {len(recent_events)} recent events")
+        out(f"   📝 Audit System: {len(recent_events)} recent events")
         
         # Event correlation example
         if recent_events and recent_events[0].correlation_id:
             correlation_id = recent_events[0].correlation_id
             trace = audit_system.trace_correlation(correlation_id)
-            print(f"      - Correlation trace: {trace['summary']['event_count']} events")
+            out(f"      - Correlation trace: {trace['summary']['event_count']} events")
     
     # Confidence system
-    if 'confidence_system' in system.systems:
-        confidence_system = system.systems['confidence_system']
+    confidence_system = systems.get('confidence_system')
+    if confidence_system is not None:
         stats = confidence_system.get_entry_statistics()
-        print(f"   🎯 Confidence System: {stats['total_entries']} entries")
-        print(f"      - Outcome coverage: {stats['outcome_coverage']:.1%}")
+        out(f"   🎯 Confidence System: {stats['total_entries']} entries")
+        out(f"      - Outcome coverage: {stats['outcome_coverage']:.1%}")
         
         # Generate calibration plot
         analysis = confidence_system.analyze_confidence()
-        plot_file = str(demo_dir / "calibration_plot.png")
-        confidence_system.generate_calibration_plot(analysis, plot_file)
-        print(f"      - Calibration plot: {plot_file}")
+        plot_file = demo_dir / "calibration_plot.png"
+        buf = io.BytesIO()
+        if confidence_system.generate_calibration_plot(analysis, buf):
+            plot_file.write_bytes(buf.getvalue())
+            out(f"      - Calibration plot: {plot_file}")
+        else:
+            out("      - Calibration plot: failed to generate")
     
     # Pattern system
-    if 'pattern_system' in system.systems:
-        pattern_system = system.systems['pattern_system']
+    pattern_system = systems.get('pattern_system')
+    if pattern_system is not None:
         insights = pattern_system.get_pattern_insights()
-        print(f"   🔍 Pattern System: {insights['total_patterns']} patterns")
+        out(f"   🔍 Pattern System: {insights['total_patterns']} patterns")
         if insights['most_frequent']:
             top_pattern = insights['most_frequent'][0]
-            print(f"      - Top pattern: {top_pattern.title} (freq: {top_pattern.frequency})")
+            out(f"      - Top pattern: {top_pattern.title} (freq: {top_pattern.frequency})")
     
     # Alert system
-    if 'alert_system' in system.systems:
-        alert_system = system.systems['alert_system']
+    alert_system = systems.get('alert_system')
+    if alert_system is not None:
         stats = alert_system.get_alert_stats()
-        print(f"   🚨 Alert System: {stats['total_alerts']} alerts")
-        print(f"      - Unresolved: {stats['unresolved']}")
+        out(f"   🚨 Alert System: {stats['total_alerts']} alerts")
+        out(f"      - Unresolved: {stats['unresolved']}")
     
     # Dashboard system
-    if 'dashboard_system' in system.systems:
-        dashboard_system = system.systems['dashboard_system']
+    dashboard_system = systems.get('dashboard_system')
+    if dashboard_system is not None:
         dashboard_report = str(demo_dir / "dashboard_static_report.html")
         dashboard_system.generate_static_report(dashboard_report)
-        print(f"   📊 Dashboard System: Static report generated")
-        print(f"      - Report: {dashboard_report}")
-        print(f"      - Live dashboard: http://localhost:{system.config.dashboard_port}")
+        out(f"   📊 Dashboard System: Static report generated")
+        out(f"      - Report: {dashboard_report}")
+        out(f"      - Live dashboard: http://localhost:{system.config.dashboard_port}")
     
-    print("\n✅ System capabilities demonstration complete")
+    out("\n✅ System capabilities demonstration complete")
+    _emit(lines)
 
 def generate_demo_insights(system, demo_dir):
     """Generate insights and recommendations from demo data"""
@@ -282,74 +385,79 @@ def generate_demo_insights(system, demo_dir):
     print("-" * 50)
     
     insights_file = demo_dir / "demo_insights.md"
+    ts = datetime.now().isoformat()
     
-    with open(insights_file, 'w') as f:
-        f.write("# Comprehensive Reporting System Demo Insights\n\n")
-        f.write(f"Generated: {datetime.now().isoformat()}\n\n")
-        
-        # System overview
-        status = system.get_system_status()
-        f.write("## System Overview\n\n")
-        f.write(f"- **Active Systems**: {len([s for s in status['systems'].values() if s.get('status') == 'active'])}\n")
-        f.write(f"- **Configuration**: {len(status['config'])} settings\n")
-        f.write(f"- **Background Processing**: {status['background_processing']}\n\n")
+    parts = []
+    write = parts.append
+    
+    write("# Comprehensive Reporting System Demo Insights\n\n")
+    write(f"Generated: {ts}\n\n")
+    
+    # System overview
+    status = system.get_system_status()
+    write("## System Overview\n\n")
+    write(f"- **Active Systems**: {len([s for s in status['systems'].values() if s.get('status') == 'active'])}\n")
+    write(f"- **Configuration**: {len(status['config'])} settings\n")
+    write(f"- **Background Processing**: {status['background_processing']}\n\n")
+    
+    # Individual system insights
+    for system_name, system_status in status['systems'].items():
+        write(f"### {system_name.title().replace('_', ' ')}\n\n")
         
-        # Individual system insights
-        for system_name, system_status in status['systems'].items():
-            f.write(f"### {system_name.title().replace('_', ' ')}\n\n")
+        if system_status.get('status') == 'active':
+            write(f"**Status**: ✅ Active\n\n")
             
-            if system_status.get('status') == 'active':
-                f.write(f"**Status**: ✅ Active\n\n")
-                
-                # Add specific insights based on system type
-                if system_name == 'audit_system':
-                    f.write(f"- Total Events: {system_status.get('total_events', 'N/A')}\n")
-                    f.write(f"- Unique Sessions: {system_status.get('unique_sessions', 'N/A')}\n")
-                    f.write("- **Insight**: Comprehensive event tracking is operational\n")
-                elif system_name == 'confidence_system':
-                    f.write(f"- Total Entries: {system_status.get('total_entries', 'N/A')}\n")
-                    f.write(f"- Outcome Coverage: {system_status.get('outcome_coverage', 0)*100:.1f}%\n")
-                    f.write("- **Insight**: Confidence calibration analysis is available\n")
-                elif system_name == 'pattern_system':
-                    f.write(f"- Total Patterns: {system_status.get('total_patterns', 'N/A')}\n")
-                    f.write("- **Insight**: Pattern detection is identifying recurring behaviors\n")
-                elif system_name == 'alert_system':
-                    f.write(f"- Total Alerts: {system_status.get('total_alerts', 'N/A')}\n")
-                    f.write(f"- Unresolved: {system_status.get('unresolved', 'N/A')}\n")
-                    f.write("- **Insight**: Real-time alerting system is monitoring for issues\n")
-                
-                f.write("\n")
-            else:
-                f.write(f"**Status**: ❌ {system_status.get('status', 'Unknown')}\n\n")
-        
-        # Recommendations
-        f.write("## Recommendations for Production Use\n\n")
-        f.write("### 1. Configuration\n")
-        f.write("- Configure SMTP settings for email alerts\n")
-        f.write("- Set up Slack/webhook integrations for team notifications\n")
-        f.write("- Adjust deduplication windows based on expected event volume\n\n")
-        
-        f.write("### 2. Monitoring\n")
-        f.write("- Enable background processing for automatic report generation\n")
-        f.write("- Set up regular health checks and system status monitoring\n")
-        f.write("- Monitor disk usage for audit logs and pattern data\n\n")
-        
-        f.write("### 3. Integration\n")
-        f.write("- Integrate with existing task management systems\n")
-        f.write("- Set up automated confidence score recording\n")
-        f.write("- Configure external system webhooks for real-time updates\n\n")
-        
-        f.write("### 4. Scaling\n")
-        f.write("- Consider database migration for high-volume audit logs\n")
-        f.write("- Implement log rotation and archival policies\n")
-        f.write("- Set up distributed processing for pattern analysis\n\n")
+            # Add specific insights based on system type
+            if system_name == 'audit_system':
+                write(f"- Total Events: {system_status.get('total_events', 'N/A')}\n")
+                write(f"- Unique Sessions: {system_status.get('unique_sessions', 'N/A')}\n")
+                write("- **Insight**: Comprehensive event tracking is operational\n")
+            elif system_name == 'confidence_system':
+                write(f"- Total Entries: {system_status.get('total_entries', 'N/A')}\n")
+                write(f"- Outcome Coverage: {system_status.get('outcome_coverage', 0)*100:.1f}%\n")
+                write("- **Insight**: Confidence calibration analysis is available\n")
+            elif system_name == 'pattern_system':
+                write(f"- Total Patterns: {system_status.get('total_patterns', 'N/A')}\n")
+                write("- **Insight**: Pattern detection is identifying recurring behaviors\n")
+            elif system_name == 'alert_system':
+                write(f"- Total Alerts: {system_status.get('total_alerts', 'N/A')}\n")
+                write(f"- Unresolved: {system_status.get('unresolved', 'N/A')}\n")
+                write("- **Insight**: Real-time alerting system is monitoring for issues\n")
+            
+            write("\n")
+        else:
+            write(f"**Status**: ❌ {system_status.get('status', 'Unknown')}\n\n")
+    
+    # Recommendations
+    write("## Recommendations for Production Use\n\n")
+    write("### 1. Configuration\n")
+    write("- Configure SMTP settings for email alerts\n")
+    write("- Set up Slack/webhook integrations for team notifications\n")
+    write("- Adjust deduplication windows based on expected event volume\n\n")
+    
+    write("### 2. Monitoring\n")
+    write("- Enable background processing for automatic report generation\n")
+    write("- Set up regular health checks and system status monitoring\n")
+    write("- Monitor disk usage for audit logs and pattern data\n\n")
+    
+    write("### 3. Integration\n")
+    write("- Integrate with existing task management systems\n")
+    write("- Set up automated confidence score recording\n")
+    write("- Configure external system webhooks for real-time updates\n\n")
+    
+    write("### 4. Scaling\n")
+    write("- Consider database migration for high-volume audit logs\n")
+    write("- Implement log rotation and archival policies\n")
+    write("- Set up distributed processing for pattern analysis\n\n")
+    
+    insights_file.write_bytes("".join(parts).encode('utf-8'))
     
     print(f"   📝 Insights report: {insights_file}")
     
     # Generate summary statistics
     summary_file = demo_dir / "demo_summary.json"
     summary = {
-        'demo_timestamp': datetime.now().isoformat(),
+        'demo_timestamp': ts,
         'systems_status': status,
         'files_generated': list(demo_dir.glob('*')),
         'recommendations': [
@@ -367,6 +475,13 @@ def generate_demo_insights(system, demo_dir):
     print(f"   📊 Summary data: {summary_file}")
     print("\n✅ Demo insights generation complete")
 
+def _stop_demo(system):
+    """Shut the demo system down after a user interrupt"""
+    print("\n\n🛑 Demo stopped by user")
+    if system is not None:
+        system.stop()
+    print("✅ System shutdown complete")
+
 def main():
     """Main demo execution"""
     try:
@@ -383,35 +498,39 @@ def main():
         generate_demo_insights(system, demo_dir)
         
         # Final summary
-        print("\n" + "=" * 60)
-        print("🎉 COMPREHENSIVE DEMO COMPLETED SUCCESSFULLY! 🎉")
-        print("=" * 60)
-        print(f"📁 Demo output directory: {demo_dir.absolute()}")
-        print(f"🌐 Dashboard URL: http://localhost:{system.config.dashboard_port}")
-        print("\n📋 Generated Files:")
-        
-        for file_path in sorted(demo_dir.glob('*')):
-            if file_path.is_file():
-                size_kb = file_path.stat().st_size / 1024
-                print(f"   📄 {file_path.name} ({size_kb:.1f} KB)")
+        lines = [
+            "\n" + "=" * 60,
+            "🎉 COMPREHENSIVE DEMO COMPLETED SUCCESSFULLY! 🎉",
+            "=" * 60,
+            f"📁 Demo output directory: {demo_dir.absolute()}",
+            f"🌐 Dashboard URL: http://localhost:{system.config.dashboard_port}",
+            "\n📋 Generated Files:",
+        ]
         
-        print("\n💡 Next Steps:")
-        print("   1. Review generated reports and insights")
-        print("   2. Explore the live dashboard")
-        print("   3. Configure for your production environment")
-        print("   4. Integrate with your existing systems")
+        with os.scandir(demo_dir) as it:
+            entries = sorted((e for e in it if e.is_file(follow_symlinks=False)), key=lambda e: e.name)
+        for entry in entries:
+            size_kb = entry.stat().st_size / 1024
+            lines.append(f"   📄 {entry.name} ({size_kb:.1f} KB)")
         
-        print("\n🚀 System is running - Press Ctrl+C to stop")
+        lines += [
+            "\n💡 Next Steps:",
+            "   1. Review generated reports and insights",
+            "   2. Explore the live dashboard",
+            "   3. Configure for your production environment",
+            "   4. Integrate with your existing systems",
+            "\n🚀 System is running - Press Ctrl+C to stop",
+        ]
+        _emit(lines)
         
-        # Keep system running for exploration
-        while True:
-            time.sleep(1)
+        # Keep system running for exploration; park the main thread until Ctrl+C
+        stop_event = threading.Event()
+        signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+        stop_event.wait()
+        _stop_demo(system)
     
     except KeyboardInterrupt:
-        print("\n\n🛑 Demo stopped by user")
-        if 'system' in locals():
-            system.stop()
-        print("✅ System shutdown complete")
+        _stop_demo(locals().get('system'))
     
     except Exception as e:
         print(f"\n❌ Demo failed with error: {e}")
@@ -9,7 +9,7 @@ import logging
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, BinaryIO, Union
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import matplotlib.pyplot as plt
@@ -491,8 +491,8 @@ class ConfidenceReportingSystem:
         return analysis
     
     def generate_calibration_plot(self, analysis: ConfidenceAnalysis, 
-                                output_file: str) -> str:
-        """Generate calibration reliability diagram"""
+                                output_file: Union[str, BinaryIO]) -> Union[str, BinaryIO]:
+        """Generate calibration reliability diagram (to a path or binary file object)"""
         try:
             plt.figure(figsize=(10, 8))
             
@@ -550,7 +550,9 @@ class ConfidenceReportingSystem:
                 plt.grid(True, alpha=0.3)
             
             plt.tight_layout()
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
+            # A path keeps its own extension; file objects have none, so PNG
+            save_kwargs = {} if isinstance(output_file, (str, Path)) else {'format': 'png'}
+            plt.savefig(output_file, dpi=300, bbox_inches='tight', **save_kwargs)
             plt.close()
             
             self.logger.info(f"Calibration plot saved to {output_file}")
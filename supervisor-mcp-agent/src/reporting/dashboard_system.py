@@ -15,8 +15,6 @@ from contextlib import contextmanager
 import threading
 import time
 from queue import Queue
-from flask import Flask, jsonify, render_template_string, request
-from flask_socketio import SocketIO, emit
 import plotly.graph_objs as go
 import plotly.utils
 from collections import deque, defaultdict
@@ -298,6 +296,10 @@ class DashboardServer:
     """Real-time dashboard server using Flask and SocketIO"""
     
     def __init__(self, systems: Dict[str, Any], port: int = 5000):
+        # Flask/SocketIO are only needed once a live server is requested
+        from flask import Flask
+        from flask_socketio import SocketIO
+        
         self.systems = systems
         self.port = port
         self.app = Flask(__name__)
@@ -319,6 +321,7 @@ class DashboardServer:
     
     def _setup_routes(self):
         """Setup Flask routes"""
+        from flask import jsonify, render_template_string
         
         @self.app.route('/')
         def index():
@@ -679,11 +682,7 @@ class ComprehensiveDashboardSystem:
     def __init__(self, systems: Dict[str, Any], config: Optional[Dict[str, Any]] = None):
         self.systems = systems
         self.config = config or {}
-        
-        self.dashboard_server = DashboardServer(
-            systems, 
-            port=self.config.get('dashboard_port', 5000)
-        )
+        self._dashboard_server = None
         
         logging.basicConfig(
             level=logging.INFO,
@@ -691,6 +690,16 @@ class ComprehensiveDashboardSystem:
         )
         self.logger = logging.getLogger(__name__)
     
+    @property
+    def dashboard_server(self) -> DashboardServer:
+        """Live dashboard server, created on first use"""
+        if self._dashboard_server is None:
+            self._dashboard_server = DashboardServer(
+                self.systems,
+                port=self.config.get('dashboard_port', 5000)
+            )
+        return self._dashboard_server
+    
     def start_dashboard(self, debug: bool = False):
         """Start the dashboard server"""
         self.logger.info("Starting comprehensive dashboard system")
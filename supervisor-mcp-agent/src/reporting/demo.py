@@ -6,15 +6,80 @@ Shows all major features and capabilities
 
 import asyncio
 import json
+import logging
+import os
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and unavailable on Windows)
+    uvloop = None
 
 import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent))
+_demo_dir = str(Path(__file__).parent)
+if _demo_dir not in sys.path:
+    sys.path.insert(0, _demo_dir)
 
 from main import SupervisorReportingSystem
+from confidence import ConfidenceEntry
+
+logger = logging.getLogger(__name__)
+
+
+# Fixture events for demo_event_logging: (event_type, agent_id, task_id, data).
+# The payloads are read-only views; demo_event_logging hands out copies.
+_DEMO_EVENTS = (
+    ('task_started', 'agent_001', 'task_001', MappingProxyType({
+        'cause': 'User document upload',
+        'action': 'Starting document analysis',
+        'document_type': 'PDF',
+        'file_size': 2048576
+    })),
+    ('decision_made', 'agent_001', 'task_001', MappingProxyType({
+        'confidence': 0.87,
+        'decision_type': 'document_classification',
+        'decision_id': 'doc_class_001',
+        'categories': ('invoice', 'financial')
+    })),
+    ('task_completed', 'agent_001', 'task_001', MappingProxyType({
+        'outcome': 'success',
+        'execution_time': 23.5,
+        'pages_processed': 5,
+        'confidence': 0.87
+    })),
+    ('task_started', 'agent_002', 'task_002', MappingProxyType({
+        'cause': 'Scheduled data processing',
+        'action': 'Processing batch data',
+        'batch_size': 1000
+    })),
+    ('task_failed', 'agent_002', 'task_002', MappingProxyType({
+        'outcome': 'timeout',
+        'execution_time': 305,
+        'error_type': 'timeout',
+        'error_message': 'Task exceeded maximum execution time'
+    })),
+    ('error_occurred', 'agent_003', 'task_003', MappingProxyType({
+        'error_type': 'validation_error',
+        'error_message': 'Invalid input format',
+        'input_size': 0
+    }))
+)
+
+# Fixture decisions for demo_confidence_tracking:
+# (agent_id, task_id, decision_id, confidence, decision_type, outcome)
+_DEMO_DECISIONS = (
+    ('agent_006', 'task_006', 'decision_006', 0.95, 'classification', True),
+    ('agent_006', 'task_007', 'decision_007', 0.85, 'extraction', True),
+    ('agent_007', 'task_008', 'decision_008', 0.75, 'classification', False),
+    ('agent_007', 'task_009', 'decision_009', 0.65, 'validation', True),
+    ('agent_008', 'task_010', 'decision_010', 0.45, 'classification', False),
+    ('agent_008', 'task_011', 'decision_011', 0.35, 'extraction', False),
+    ('agent_009', 'task_012', 'decision_012', 0.25, 'validation', False),
+    ('agent_009', 'task_013', 'decision_013', 0.15, 'classification', False)
+)
 
 
 class ReportingDemo:
@@ -39,17 +104,23 @@ class ReportingDemo:
         # 3. Confidence tracking
         await self.demo_confidence_tracking()
         
-        # 4. Report generation
-        await self.demo_report_generation()
-        
-        # 5. Dashboard
-        await self.demo_dashboard()
-        
-        # 6. Pattern detection
-        await self.demo_pattern_detection()
-        
-        # 7. Export system
-        await self.demo_export_system()
+        # 4-7. Report generation, dashboard, pattern detection and export
+        # only read the state populated above and write to distinct files,
+        # so their file I/O overlaps on the event loop. Each section
+        # collects its console lines, which are printed in section order
+        # once all four are done.
+        sections = (
+            self.demo_report_generation,
+            self.demo_dashboard,
+            self.demo_pattern_detection,
+            self.demo_export_system
+        )
+        outputs = [[] for _ in sections]
+        await asyncio.gather(*(
+            section(lines.append) for section, lines in zip(sections, outputs)
+        ))
+        for lines in outputs:
+            print("\n".join(lines))
         
         # 8. System status
         await self.demo_system_status()
@@ -63,46 +134,14 @@ class ReportingDemo:
         print("📝 1. Audit Event Logging")
         print("-" * 30)
         
-        # Log various types of events
+        # Log various types of events, each with its own copy of the payload
         events = [
-            ('task_started', 'agent_001', 'task_001', {
-                'cause': 'User document upload',
-                'action': 'Starting document analysis',
-                'document_type': 'PDF',
-                'file_size': 2048576
-            }),
-            ('decision_made', 'agent_001', 'task_001', {
-                'confidence': 0.87,
-                'decision_type': 'document_classification',
-                'decision_id': 'doc_class_001',
-                'categories': ['invoice', 'financial']
-            }),
-            ('task_completed', 'agent_001', 'task_001', {
-                'outcome': 'success',
-                'execution_time': 23.5,
-                'pages_processed': 5,
-                'confidence': 0.87
-            }),
-            ('task_started', 'agent_002', 'task_002', {
-                'cause': 'Scheduled data processing',
-                'action': 'Processing batch data',
-                'batch_size': 1000
-            }),
-            ('task_failed', 'agent_002', 'task_002', {
-                'outcome': 'timeout',
-                'execution_time': 305,
-                'error_type': 'timeout',
-                'error_message': 'Task exceeded maximum execution time'
-            }),
-            ('error_occurred', 'agent_003', 'task_003', {
-                'error_type': 'validation_error',
-                'error_message': 'Invalid input format',
-                'input_size': 0
-            })
+            (event_type, agent_id, task_id, dict(data))
+            for event_type, agent_id, task_id, data in _DEMO_EVENTS
         ]
         
+        self.system.log_task_events(events)
         for event_type, agent_id, task_id, data in events:
-            self.system.log_task_event(event_type, agent_id, task_id, data)
             print(f"  ✓ Logged {event_type} for {agent_id}/{task_id}")
             
         # Update decision outcomes
@@ -151,29 +190,24 @@ class ReportingDemo:
         print("-" * 40)
         
         # Record multiple decisions with various confidence levels
-        decisions = [
-            ('agent_006', 'task_006', 'decision_006', 0.95, 'classification', True),
-            ('agent_006', 'task_007', 'decision_007', 0.85, 'extraction', True),
-            ('agent_007', 'task_008', 'decision_008', 0.75, 'classification', False),
-            ('agent_007', 'task_009', 'decision_009', 0.65, 'validation', True),
-            ('agent_008', 'task_010', 'decision_010', 0.45, 'classification', False),
-            ('agent_008', 'task_011', 'decision_011', 0.35, 'extraction', False),
-            ('agent_009', 'task_012', 'decision_012', 0.25, 'validation', False),
-            ('agent_009', 'task_013', 'decision_013', 0.15, 'classification', False)
-        ]
-        
-        for agent_id, task_id, decision_id, confidence, decision_type, outcome in decisions:
-            # Record decision
-            self.system.confidence_reporter.record_decision(
+        decisions = _DEMO_DECISIONS
+        
+        # Outcomes are known up front, so record decisions and outcomes
+        # together in one batch
+        now = datetime.now()
+        self.system.confidence_reporter.record_confidences([
+            ConfidenceEntry(
+                timestamp=now,
                 agent_id=agent_id,
                 task_id=task_id,
-                decision_id=decision_id,
-                confidence=confidence,
-                decision_type=decision_type
+                predicted_confidence=confidence,
+                actual_success=outcome,
+                task_duration=0.0,
+                task_type=decision_type,
+                context={'decision_id': decision_id}
             )
-            
-            # Update outcome
-            self.system.confidence_reporter.update_outcome(decision_id, outcome)
+            for agent_id, task_id, decision_id, confidence, decision_type, outcome in decisions
+        ])
             
         print(f"  ✓ Recorded {len(decisions)} decisions with outcomes")
         
@@ -184,68 +218,69 @@ class ReportingDemo:
         print(f"  ✓ Calibration score: {conf_metrics.calibration_score:.3f}")
         print(f"  → {conf_metrics.total_decisions} total decisions analyzed\n")
         
-    async def demo_report_generation(self):
+    async def demo_report_generation(self, out=print):
         """Demonstrate report generation"""
-        print("📊 4. Report Generation")
-        print("-" * 25)
+        out("📊 4. Report Generation")
+        out("-" * 25)
         
         # Generate summary report
         summary_path = self.system.generate_report('summary', period_hours=1, format='markdown')
-        print(f"  ✓ Generated summary report: {Path(summary_path).name}")
+        out(f"  ✓ Generated summary report: {Path(summary_path).name}")
         
         # Generate confidence report
         conf_metrics = self.system.confidence_reporter.generate_metrics(hours=1)
         conf_report = self.system.confidence_reporter.generate_calibration_report(conf_metrics)
         
         conf_report_path = 'confidence_report.md'
-        with open(conf_report_path, 'w') as f:
-            f.write(conf_report)
-        print(f"  ✓ Generated confidence report: {conf_report_path}")
+        await asyncio.to_thread(Path(conf_report_path).write_text, conf_report)
+        out(f"  ✓ Generated confidence report: {conf_report_path}")
         
-        print(f"  → Reports available for review\n")
+        out(f"  → Reports available for review\n")
         
-    async def demo_dashboard(self):
+    async def demo_dashboard(self, out=print):
         """Demonstrate dashboard functionality"""
-        print("📈 5. Dashboard & Visualization")
-        print("-" * 32)
+        out("📈 5. Dashboard & Visualization")
+        out("-" * 32)
         
         # Update dashboard
         dashboard_data = self.system.get_dashboard_data()
         
-        print(f"  ✓ Dashboard updated with {len(dashboard_data['metrics'])} metrics")
-        print(f"  ✓ Generated {len(dashboard_data['charts'])} charts")
-        print(f"  ✓ Overall system status: {dashboard_data['status']}")
+        out(f"  ✓ Dashboard updated with {len(dashboard_data['metrics'])} metrics")
+        out(f"  ✓ Generated {len(dashboard_data['charts'])} charts")
+        out(f"  ✓ Overall system status: {dashboard_data['status']}")
         
         # Show some key metrics
         metrics = dashboard_data['metrics']
         if 'success_rate' in metrics:
-            print(f"    - Success Rate: {metrics['success_rate']['value']}{metrics['success_rate']['unit']}")
+            out(f"    - Success Rate: {metrics['success_rate']['value']}{metrics['success_rate']['unit']}")
         if 'avg_confidence' in metrics:
-            print(f"    - Avg Confidence: {metrics['avg_confidence']['value']}")
+            out(f"    - Avg Confidence: {metrics['avg_confidence']['value']}")
         if 'active_alerts' in metrics:
-            print(f"    - Active Alerts: {metrics['active_alerts']['value']}")
+            out(f"    - Active Alerts: {metrics['active_alerts']['value']}")
             
         # Generate HTML dashboard
         dashboard_html = self.system.dashboard_manager.generate_dashboard_html()
         dashboard_path = 'supervisor_dashboard.html'
-        with open(dashboard_path, 'w') as f:
-            f.write(dashboard_html)
-        print(f"  ✓ Generated HTML dashboard: {dashboard_path}")
+        await asyncio.to_thread(Path(dashboard_path).write_text, dashboard_html)
+        out(f"  ✓ Generated HTML dashboard: {dashboard_path}")
         
-        print(f"  → Dashboard ready for viewing\n")
+        out(f"  → Dashboard ready for viewing\n")
         
-    async def demo_pattern_detection(self):
+    async def demo_pattern_detection(self, out=print):
         """Demonstrate pattern detection"""
-        print("🔍 6. Pattern Detection & Knowledge Base")
-        print("-" * 42)
+        out("🔍 6. Pattern Detection & Knowledge Base")
+        out("-" * 42)
         
         # Create some events that will form patterns
         pattern_events = []
+        now = datetime.now()
+        failure_ts = [(now - timedelta(minutes=i*10)).isoformat() for i in range(5)]
+        perf_ts = [(now - timedelta(minutes=i*15)).isoformat() for i in range(4)]
         
         # Create failure pattern
         for i in range(5):
             pattern_events.append({
-                'timestamp': (datetime.now() - timedelta(minutes=i*10)).isoformat(),
+                'timestamp': failure_ts[i],
                 'agent_id': 'agent_010',
                 'task_id': f'task_{100+i}',
                 'event_type': 'task_failed',
@@ -257,7 +292,7 @@ class ReportingDemo:
         # Create performance pattern
         for i in range(4):
             pattern_events.append({
-                'timestamp': (datetime.now() - timedelta(minutes=i*15)).isoformat(),
+                'timestamp': perf_ts[i],
                 'agent_id': 'agent_011',
                 'task_id': f'task_{200+i}',
                 'event_type': 'task_completed',
@@ -270,63 +305,53 @@ class ReportingDemo:
         # Analyze patterns
         detected_patterns = self.system.pattern_tracker.analyze_events(pattern_events)
         
-        print(f"  ✓ Analyzed {len(pattern_events)} events")
-        print(f"  ✓ Detected {len(detected_patterns)} patterns")
+        out(f"  ✓ Analyzed {len(pattern_events)} events")
+        out(f"  ✓ Detected {len(detected_patterns)} patterns")
         
         for pattern in detected_patterns[:3]:  # Show first 3
-            print(f"    - {pattern.pattern_type}: {pattern.name} (frequency: {pattern.frequency})")
+            out(f"    - {pattern.pattern_type}: {pattern.name} (frequency: {pattern.frequency})")
             
         # Get recommendations
         recommendations = self.system.get_agent_recommendations('agent_010')
         if recommendations:
-            print(f"  ✓ Generated {len(recommendations)} recommendations")
+            out(f"  ✓ Generated {len(recommendations)} recommendations")
             for rec in recommendations[:2]:
-                print(f"    - {rec}")
+                out(f"    - {rec}")
                 
-        print(f"  → Pattern analysis completed\n")
+        out(f"  → Pattern analysis completed\n")
         
-    async def demo_export_system(self):
+    async def demo_export_system(self, out=print):
         """Demonstrate export capabilities"""
-        print("📤 7. Export System")
-        print("-" * 20)
-        
-        # Export audit logs
-        audit_job_id = self.system.export_data(
-            'audit_logs',
-            format='json',
-            compress=True,
-            start_time=datetime.now() - timedelta(hours=1)
-        )
-        print(f"  ✓ Started audit logs export: {audit_job_id}")
-        
-        # Export performance report
-        perf_job_id = self.system.export_data(
-            'performance_reports',
-            format='json',
-            period_hours=1
+        out("📤 7. Export System")
+        out("-" * 20)
+        
+        # Start the audit, performance and confidence exports together;
+        # each export runs synchronously, so submit them from worker
+        # threads and let them overlap
+        export = self.system.export_data
+        audit_job_id, perf_job_id, conf_job_id = await asyncio.gather(
+            asyncio.to_thread(
+                export, 'audit_logs', format='json', compress=True,
+                start_time=datetime.now() - timedelta(hours=1)
+            ),
+            asyncio.to_thread(export, 'performance_reports', format='json', period_hours=1),
+            asyncio.to_thread(export, 'confidence_analysis', format='json', period_hours=1)
         )
-        print(f"  ✓ Started performance report export: {perf_job_id}")
+        out(f"  ✓ Started audit logs export: {audit_job_id}")
+        out(f"  ✓ Started performance report export: {perf_job_id}")
+        out(f"  ✓ Started confidence analysis export: {conf_job_id}")
         
-        # Export confidence analysis
-        conf_job_id = self.system.export_data(
-            'confidence_analysis',
-            format='json',
-            period_hours=1
-        )
-        print(f"  ✓ Started confidence analysis export: {conf_job_id}")
-        
-        # Wait a moment for exports to complete
-        await asyncio.sleep(1)
+        # The backup reruns those exports internally, and job ids and file
+        # names only resolve to the second, so it must not overlap them
+        backup_job_id = await asyncio.to_thread(export, 'complete_backup', compress=True)
+        out(f"  ✓ Started complete backup: {backup_job_id}")
         
-        # Check export status
+        # export_data runs each job to completion before returning its id,
+        # so the statistics already cover every job started above
         export_stats = self.system.export_manager.get_export_statistics()
-        print(f"  ✓ Export statistics: {export_stats['completed_jobs']} completed")
-        
-        # Create complete backup
-        backup_job_id = self.system.export_data('complete_backup', compress=True)
-        print(f"  ✓ Started complete backup: {backup_job_id}")
+        out(f"  ✓ Export statistics: {export_stats['completed_jobs']} completed")
         
-        print(f"  → Export jobs initiated\n")
+        out(f"  → Export jobs initiated\n")
         
     async def demo_system_status(self):
         """Show overall system status"""
@@ -373,16 +398,18 @@ class ReportingDemo:
             'supervisor_reporting.log'
         ]
         
+        # One directory listing instead of a stat per candidate file
+        with os.scandir('.') as entries:
+            cwd_files = {entry.name for entry in entries}
         for file in files:
-            if Path(file).exists():
+            if file in cwd_files:
                 print(f"📄 {file}")
                 
         # Check export directory
-        export_dir = Path('exports')
-        if export_dir.exists():
-            export_files = list(export_dir.glob('*'))
-            for file in export_files:
-                print(f"📦 {file}")
+        if 'exports' in cwd_files:
+            with os.scandir('exports') as entries:
+                for entry in entries:
+                    print(f"📦 {entry.path}")
                 
         print()
         print("Next Steps:")
@@ -402,13 +429,13 @@ async def main():
         demo.show_summary()
     except KeyboardInterrupt:
         print("\n⏹️  Demo interrupted by user")
-    except Exception as e:
-        print(f"\n❌ Demo failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Demo failed")
     
     print("\n🎉 Thank you for trying the Supervisor Agent Reporting System!")
 
 
 if __name__ == '__main__':
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
@@ -7,7 +7,7 @@ Integrates all reporting components and provides unified interface.
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import threading
@@ -302,6 +302,7 @@ class IntegratedReportingSystem:
         
         # Setup event routing
         self.event_router = EventRouter(self.systems)
+        self._event_loggers: Dict[str, Callable[..., str]] = {}
         
         # Setup background processing
         self.background_processor = BackgroundProcessor(self.systems, self.config)
@@ -396,23 +397,73 @@ class IntegratedReportingSystem:
                   data: Optional[Dict[str, Any]] = None,
                   correlation_id: Optional[str] = None) -> str:
         """Log an event and route it through the system"""
-        event_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}_{source}"
-        
-        # Create integration event
-        integration_event = SystemIntegrationEvent(
-            event_id=event_id,
-            timestamp=datetime.now().isoformat(),
-            event_type=event_type,
-            source_system=source,
-            data=data or {},
-            correlation_id=correlation_id
-        )
-        
-        # Route through event system
-        self.event_router.route_event(integration_event)
-        
-        return event_id
-    
+        return self._logger_for(event_type)(source, message, data, correlation_id)
+
+    def _logger_for(self, event_type: str) -> Callable[..., str]:
+        """Return the cached specialized logger for an event type"""
+        log = self._event_loggers.get(event_type)
+        if log is None:
+            log = self._event_loggers[event_type] = self.make_logger(event_type)
+        return log
+
+    def make_logger(self, event_type: str) -> Callable[..., str]:
+        """Return a log function specialized for one event type.
+
+        The event type's handler list is resolved once, here, and the
+        returned function calls those handlers directly instead of going
+        through ``EventRouter.route_event``. The list is the router's own,
+        so handlers registered for the type later are still called. The
+        returned function takes ``(source, message, data=None,
+        correlation_id=None, stamp=None)`` where ``stamp`` is an optional
+        precomputed ``(id_stamp, iso_timestamp)``.
+        """
+        handlers = self.event_router.event_handlers.setdefault(event_type, [])
+        report_error = self.event_router.logger.error
+
+        def log(source: str, message: str,
+                data: Optional[Dict[str, Any]] = None,
+                correlation_id: Optional[str] = None,
+                stamp: Optional[Tuple[str, str]] = None) -> str:
+            if stamp is None:
+                now = datetime.now()
+                stamp = (now.strftime('%Y%m%d_%H%M%S_%f'), now.isoformat())
+            event_id = f"{stamp[0]}_{source}"
+            event = SystemIntegrationEvent(
+                event_id=event_id,
+                timestamp=stamp[1],
+                event_type=event_type,
+                source_system=source,
+                data=data or {},
+                correlation_id=correlation_id
+            )
+            for handler in handlers:
+                try:
+                    handler(event)
+                except Exception as e:
+                    report_error(f"Error handling event {event_id} with {handler.__name__}: {e}")
+            return event_id
+
+        return log
+
+    def log_events_bulk(self, events: List[tuple]) -> List[str]:
+        """Log a batch of (event_type, source, message, data, correlation_id) events
+
+        The clock is read once per batch; each event's id carries its
+        position in the batch so events from the same source stay distinct.
+        """
+        now = datetime.now()
+        id_stamp = now.strftime('%Y%m%d_%H%M%S_%f')
+        timestamp = now.isoformat()
+        logger_for = self._logger_for
+        event_ids = []
+
+        for seq, (event_type, source, message, data, correlation_id) in enumerate(events):
+            log = logger_for(event_type)
+            stamp = (f"{id_stamp}_{seq:04d}", timestamp)
+            event_ids.append(log(source, message, data, correlation_id, stamp))
+
+        return event_ids
+
     def generate_comprehensive_report(self, output_format: str = "all") -> Dict[str, str]:
         """Generate comprehensive report from all systems"""
         report_files = {}
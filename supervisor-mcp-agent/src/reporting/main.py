@@ -7,7 +7,7 @@ import json
 import logging
 import asyncio
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from pathlib import Path
 
 import sys
@@ -45,15 +45,12 @@ class MockDataSource:
             for i in range(10)
         ]
     
-    def get_tasks_in_period(self, start_time: datetime, end_time: datetime) -> List[Dict]:
-        """Mock method to get all tasks in period"""
-        tasks = []
+    def get_tasks_in_period(self, start_time: datetime, end_time: datetime) -> Iterator[Dict]:
+        """Mock method to get all tasks in period, yielded lazily"""
         agents = ['agent_001', 'agent_002', 'agent_003', 'agent_004', 'agent_005']
         
         for agent_id in agents:
-            tasks.extend(self.get_agent_tasks(agent_id, start_time, end_time))
-            
-        return tasks
+            yield from self.get_agent_tasks(agent_id, start_time, end_time)
 
 
 class SupervisorReportingSystem:
@@ -331,9 +328,9 @@ class SupervisorReportingSystem:
                 
     # Public API methods
     
-    def log_task_event(self, event_type: str, agent_id: str, task_id: str, 
-                      data: Dict[str, Any]):
-        """Log a task-related event"""
+    def _audit_entry(self, event_type: str, agent_id: str, task_id: str,
+                     data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the audit log_event arguments for a task-related event"""
         # Determine audit event type and level
         audit_event_type = {
             'task_started': self.audit_manager.AuditEventType.TASK_STARTED,
@@ -351,19 +348,23 @@ class SupervisorReportingSystem:
             'error_occurred': self.audit_manager.AuditLevel.ERROR
         }.get(event_type, self.audit_manager.AuditLevel.INFO)
         
-        # Log audit event
-        self.audit_manager.log_event(
+        return dict(
             event_type=audit_event_type,
             level=audit_level,
-            agent_id=agent_id,
-            task_id=task_id,
-            cause=data.get('cause', f'Task {event_type}'),
-            action=data.get('action', 'Task execution'),
-            outcome=data.get('outcome', event_type),
-            confidence=data.get('confidence'),
-            metadata=data
+            source=agent_id,
+            message=data.get('cause', f'Task {event_type}'),
+            metadata=data,
+            context={
+                'task_id': task_id,
+                'action': data.get('action', 'Task execution'),
+                'outcome': data.get('outcome', event_type),
+                'confidence': data.get('confidence')
+            }
         )
         
+    def _process_task_event(self, event_type: str, agent_id: str, task_id: str,
+                            data: Dict[str, Any]):
+        """Run alert evaluation and confidence tracking for a logged event"""
         # Evaluate alert conditions
         self.alert_manager.evaluate_conditions(data, agent_id, task_id)
         
@@ -379,6 +380,27 @@ class SupervisorReportingSystem:
                 context=data
             )
             
+    def log_task_event(self, event_type: str, agent_id: str, task_id: str, 
+                      data: Dict[str, Any]):
+        """Log a task-related event"""
+        self.audit_manager.log_event(
+            **self._audit_entry(event_type, agent_id, task_id, data)
+        )
+        self._process_task_event(event_type, agent_id, task_id, data)
+        
+    def log_task_events(self, events: List[Tuple[str, str, str, Dict[str, Any]]]):
+        """Log a batch of (event_type, agent_id, task_id, data) task events.
+        
+        The audit entries are handed to the audit manager in a single call so
+        the background writer receives one queue item for the whole batch.
+        """
+        self.audit_manager.log_events([
+            self._audit_entry(event_type, agent_id, task_id, data)
+            for event_type, agent_id, task_id, data in events
+        ])
+        for event_type, agent_id, task_id, data in events:
+            self._process_task_event(event_type, agent_id, task_id, data)
+            
     def update_decision_outcome(self, decision_id: str, outcome: bool):
         """Update the outcome of a previously recorded decision"""
         self.confidence_reporter.update_outcome(decision_id, outcome)
@@ -4,34 +4,225 @@ Simple Demo of Supervisor Agent Reporting System
 Demonstrates core functionality without complex imports
 """
 
+import csv
 import json
 import logging
+from dataclasses import asdict, dataclass, field, is_dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 import sys
 import os
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+try:
+    import msgspec
+except ImportError:  # msgspec is optional; orjson or the stdlib encoder is used instead
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+@dataclass(slots=True)
+class AuditEvent:
+    """One audit event; every event in the demo shares this schema"""
+    id: str
+    timestamp: datetime
+    event_type: str
+    level: str
+    agent_id: str
+    task_id: str
+    cause: str
+    action: str
+    outcome: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    confidence: Optional[float] = None
+    # Hot metadata keys promoted to fields so scans read one attribute
+    execution_time: float = 0.0
+    error_type: Optional[str] = None
+    classification: Optional[str] = None
+
+
+@dataclass(slots=True)
+class AlertRecord:
+    """One alert raised from the audit events"""
+    id: Optional[str]
+    timestamp: datetime
+    priority: str
+    title: str
+    message: str
+    agent_id: str
+    task_id: str
+    category: str
+
+
+# One row per confidence-tracked decision; the id and type fields hold
+# Python strings, as fixed-width unicode would truncate longer ids
+DEC_DTYPE = np.dtype([
+    ('decision_id', object),
+    ('agent_id', object),
+    ('task_id', object),
+    ('predicted_confidence', 'f8'),
+    ('actual_outcome', '?'),
+    ('decision_type', object),
+    ('timestamp', 'M8[us]'),
+])
+
+
+_EVENT_SCHEMA = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA cache_size=-65536;
+PRAGMA temp_store=MEMORY;
+CREATE TABLE IF NOT EXISTS events (
+    id TEXT PRIMARY KEY,
+    timestamp TEXT,
+    event_type TEXT,
+    level TEXT,
+    agent_id TEXT,
+    task_id TEXT,
+    execution_time REAL,
+    confidence REAL
+);
+CREATE INDEX IF NOT EXISTS idx_event_type ON events(event_type);
+CREATE INDEX IF NOT EXISTS idx_level ON events(level);
+CREATE INDEX IF NOT EXISTS idx_execution_time ON events(execution_time);
+DELETE FROM events;
+"""
+
+
+def _event_row(event: AuditEvent) -> tuple:
+    """Column values of an AuditEvent in events-table order"""
+    return (event.id, event.timestamp.isoformat(), event.event_type, event.level,
+            event.agent_id, event.task_id, event.execution_time, event.confidence)
+
+
+def _json_default(obj):
+    """Encode datetimes and dataclasses for the stdlib fallback the way orjson does"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_json(path: Path, obj):
+    """Write obj to path as indented JSON in a single write"""
+    if msgspec is not None:
+        # msgspec compiles one encoder per dataclass type
+        path.write_bytes(msgspec.json.format(msgspec.json.encode(obj), indent=2))
+    elif orjson is not None:
+        path.write_bytes(orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ))
+    else:
+        path.write_bytes(json.dumps(obj, indent=2, default=_json_default).encode('utf-8'))
+
+
+def _encode(obj) -> bytes:
+    """Compact JSON encoding of a single value"""
+    if msgspec is not None:
+        return msgspec.json.encode(obj)
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':'), default=_json_default).encode('utf-8')
+
+
+def _stream_export(path: Path, header: Dict[str, Any], components: Dict[str, list],
+                   summary: Dict[str, Any]):
+    """Write the export object one component element at a time
+
+    Only one element is encoded at any moment, so peak memory no longer
+    grows with the size of the whole serialized export.
+    """
+    with open(path, 'wb') as f:
+        f.write(b'{')
+        for key, value in header.items():
+            f.write(_encode(key) + b':' + _encode(value) + b',')
+        f.write(b'"components":{')
+        for n, (name, items) in enumerate(components.items()):
+            if n:
+                f.write(b',')
+            f.write(b'\n' + _encode(name) + b':[')
+            for i, item in enumerate(items):
+                f.write(b',\n' if i else b'\n')
+                f.write(_encode(item))
+            f.write(b']')
+        f.write(b'},\n"summary":' + _encode(summary) + b'}\n')
 
 # Simple demonstration of core reporting features
 class SimpleReportingDemo:
+    # Rows per INSERT transaction; gains flatten out past ~50
+    EVENT_BATCH_SIZE = 50
+    
     def __init__(self):
         print("🤖 Supervisor Agent Reporting System - Core Demo")
         print("=" * 50)
         print()
         
-        # Setup basic logging
-        logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+        # Attach a handler only if the host process has not configured one
         self.logger = logging.getLogger(__name__)
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+            self.logger.addHandler(handler)
+            self.logger.setLevel(logging.INFO)
         
         # Create output directories
         self.output_dir = Path('demo_output')
         self.output_dir.mkdir(exist_ok=True)
         
+        # Event store queried by the alert, pattern and dashboard phases;
+        # each run starts from an empty table like the other output files
+        self.conn = sqlite3.connect(self.output_dir / 'reporting.db')
+        self.conn.executescript(_EVENT_SCHEMA)
+        self._event_buf = []
+        
         # Initialize simple storage
         self.events = []
         self.alerts = []
         self.patterns = []
         self.confidence_data = []
+        self._conf_arr = np.empty(0, dtype=np.float64)
+        self._outcome_arr = np.empty(0, dtype=np.bool_)
+        self._avg_confidence = 0.0
+        self._accuracy = 0.0
+        self._idx = None
+        
+        # Background writer for the per-phase output files
+        self._io = ThreadPoolExecutor(max_workers=2)
+        self._pending_writes = []
+        
+    def _write_json(self, path: Path, obj):
+        """Queue a JSON file write on the I/O pool"""
+        self._pending_writes.append(self._io.submit(_dump_json, path, obj))
+        
+    def _log_event(self, event: AuditEvent):
+        """Record an event, inserting into the store once a batch fills up"""
+        self.events.append(event)
+        self._event_buf.append(_event_row(event))
+        if len(self._event_buf) >= self.EVENT_BATCH_SIZE:
+            self._flush_events()
+        
+    def _flush_events(self):
+        """Insert the buffered event rows in one transaction"""
+        if not self._event_buf:
+            return
+        batch, self._event_buf = self._event_buf, []
+        with self.conn:
+            self.conn.executemany("INSERT INTO events VALUES (?,?,?,?,?,?,?,?)", batch)
+        
+    def _wait_for_writes(self):
+        """Block until every queued write finishes, re-raising any failure"""
+        pending, self._pending_writes = self._pending_writes, []
+        for future in pending:
+            future.result()
         
     def run_demo(self):
         """Run complete demonstration"""
@@ -39,6 +230,7 @@ class SimpleReportingDemo:
         
         # 1. Event logging
         self.demo_event_logging()
+        self._idx = self._index_events()
         
         # 2. Alert generation
         self.demo_alerts()
@@ -58,6 +250,11 @@ class SimpleReportingDemo:
         # 7. Export functionality
         self.demo_export()
         
+        # Let the queued file writes land before reporting success
+        self._wait_for_writes()
+        self._io.shutdown(wait=True)
+        self.conn.close()
+        
         print("\n✅ Core demo completed successfully!")
         print("\nKey features demonstrated:")
         print("✓ Structured event logging")
@@ -73,64 +270,71 @@ class SimpleReportingDemo:
         print("📝 1. Audit Event Logging")
         print("-" * 30)
         
+        # One clock read shared by every record in this phase
+        now = datetime.now()
+        
         # Sample events
         events = [
-            {
-                'id': 'evt_001',
-                'timestamp': datetime.now().isoformat(),
-                'event_type': 'task_started',
-                'level': 'info',
-                'agent_id': 'agent_001',
-                'task_id': 'task_001',
-                'cause': 'User request',
-                'action': 'Document processing',
-                'outcome': 'started',
-                'metadata': {'document_type': 'PDF', 'size': 2048576}
-            },
-            {
-                'id': 'evt_002',
-                'timestamp': datetime.now().isoformat(),
-                'event_type': 'decision_made',
-                'level': 'info',
-                'agent_id': 'agent_001',
-                'task_id': 'task_001',
-                'cause': 'Classification required',
-                'action': 'Document classification',
-                'outcome': 'classified',
-                'confidence': 0.87,
-                'metadata': {'classification': 'invoice', 'confidence': 0.87}
-            },
-            {
-                'id': 'evt_003',
-                'timestamp': datetime.now().isoformat(),
-                'event_type': 'task_completed',
-                'level': 'info',
-                'agent_id': 'agent_001',
-                'task_id': 'task_001',
-                'cause': 'Processing finished',
-                'action': 'Finalize results',
-                'outcome': 'success',
-                'metadata': {'execution_time': 23.5, 'pages_processed': 5}
-            },
-            {
-                'id': 'evt_004',
-                'timestamp': datetime.now().isoformat(),
-                'event_type': 'task_failed',
-                'level': 'error',
-                'agent_id': 'agent_002',
-                'task_id': 'task_002',
-                'cause': 'Timeout occurred',
-                'action': 'Data processing',
-                'outcome': 'timeout',
-                'metadata': {'execution_time': 305, 'error_type': 'timeout'}
-            }
+            AuditEvent(
+                id='evt_001',
+                timestamp=now,
+                event_type='task_started',
+                level='info',
+                agent_id='agent_001',
+                task_id='task_001',
+                cause='User request',
+                action='Document processing',
+                outcome='started',
+                metadata={'document_type': 'PDF', 'size': 2048576}
+            ),
+            AuditEvent(
+                id='evt_002',
+                timestamp=now,
+                event_type='decision_made',
+                level='info',
+                agent_id='agent_001',
+                task_id='task_001',
+                cause='Classification required',
+                action='Document classification',
+                outcome='classified',
+                confidence=0.87,
+                classification='invoice',
+                metadata={'confidence': 0.87}
+            ),
+            AuditEvent(
+                id='evt_003',
+                timestamp=now,
+                event_type='task_completed',
+                level='info',
+                agent_id='agent_001',
+                task_id='task_001',
+                cause='Processing finished',
+                action='Finalize results',
+                outcome='success',
+                execution_time=23.5,
+                metadata={'pages_processed': 5}
+            ),
+            AuditEvent(
+                id='evt_004',
+                timestamp=now,
+                event_type='task_failed',
+                level='error',
+                agent_id='agent_002',
+                task_id='task_002',
+                cause='Timeout occurred',
+                action='Data processing',
+                outcome='timeout',
+                execution_time=305,
+                error_type='timeout'
+            )
         ]
         
-        self.events.extend(events)
+        for event in events:
+            self._log_event(event)
+        self._flush_events()
         
         # Save to JSON file
-        with open(self.output_dir / 'audit_events.json', 'w') as f:
-            json.dump(events, f, indent=2)
+        self._write_json(self.output_dir / 'audit_events.json', events)
             
         print(f"  ✓ Logged {len(events)} events")
         print(f"  ✓ Saved to {self.output_dir}/audit_events.json")
@@ -141,47 +345,49 @@ class SimpleReportingDemo:
         print("🚨 2. Alert System")
         print("-" * 20)
         
-        # Analyze events for alert conditions
+        # One clock read shared by every record in this phase
+        now = datetime.now()
+        
+        # Analyze events for alert conditions; the index already holds the
+        # events that trip a check, in event order
         alerts = []
         
-        for event in self.events:
-            metadata = event.get('metadata', {})
-            
-            # Check for timeout
-            if metadata.get('execution_time', 0) > 300:
-                alerts.append({
-                    'id': f"alert_{len(alerts)+1:03d}",
-                    'timestamp': datetime.now().isoformat(),
-                    'priority': 'HIGH',
-                    'title': 'Task Timeout Detected',
-                    'message': f"Task {event['task_id']} exceeded timeout threshold",
-                    'agent_id': event['agent_id'],
-                    'task_id': event['task_id'],
-                    'category': 'performance'
-                })
-                
-            # Check for low confidence
-            if event.get('confidence', 1.0) < 0.3:
-                alerts.append({
-                    'id': f"alert_{len(alerts)+1:03d}",
-                    'timestamp': datetime.now().isoformat(),
-                    'priority': 'MEDIUM',
-                    'title': 'Low Confidence Decision',
-                    'message': f"Decision confidence below threshold: {event.get('confidence', 0):.2f}",
-                    'agent_id': event['agent_id'],
-                    'task_id': event['task_id'],
-                    'category': 'quality'
-                })
+        for kind, event in self._idx['alert_triggers']:
+            if kind == 'timeout':
+                alerts.append(AlertRecord(
+                    id=None,
+                    timestamp=now,
+                    priority='HIGH',
+                    title='Task Timeout Detected',
+                    message=f"Task {event.task_id} exceeded timeout threshold",
+                    agent_id=event.agent_id,
+                    task_id=event.task_id,
+                    category='performance'
+                ))
+            else:
+                alerts.append(AlertRecord(
+                    id=None,
+                    timestamp=now,
+                    priority='MEDIUM',
+                    title='Low Confidence Decision',
+                    message=f"Decision confidence below threshold: {event.confidence or 0:.2f}",
+                    agent_id=event.agent_id,
+                    task_id=event.task_id,
+                    category='quality'
+                ))
                 
+        # Number the alerts once they are all collected
+        for i, alert in enumerate(alerts, 1):
+            alert.id = f'alert_{i:03d}'
+            
         self.alerts.extend(alerts)
         
         # Save alerts
-        with open(self.output_dir / 'alerts.json', 'w') as f:
-            json.dump(alerts, f, indent=2)
+        self._write_json(self.output_dir / 'alerts.json', alerts)
             
         print(f"  ✓ Generated {len(alerts)} alerts")
         for alert in alerts:
-            print(f"    - {alert['priority']}: {alert['title']}")
+            print(f"    - {alert.priority}: {alert.title}")
         print(f"  ✓ Saved to {self.output_dir}/alerts.json")
         print(f"  → Alert categories: performance, quality\n")
         
@@ -190,52 +396,46 @@ class SimpleReportingDemo:
         print("🎯 3. Confidence Tracking")
         print("-" * 28)
         
-        # Extract confidence data from events
-        decisions = []
-        for event in self.events:
-            if 'confidence' in event:
-                decisions.append({
-                    'decision_id': f"decision_{event['task_id']}",
-                    'agent_id': event['agent_id'],
-                    'task_id': event['task_id'],
-                    'predicted_confidence': event['confidence'],
-                    'actual_outcome': True,  # Simulated
-                    'decision_type': event['metadata'].get('classification', 'unknown'),
-                    'timestamp': event['timestamp']
-                })
-                
-        # Add more synthetic confidence data
-        synthetic_decisions = [
-            {'decision_id': 'dec_001', 'predicted_confidence': 0.95, 'actual_outcome': True},
-            {'decision_id': 'dec_002', 'predicted_confidence': 0.85, 'actual_outcome': True},
-            {'decision_id': 'dec_003', 'predicted_confidence': 0.75, 'actual_outcome': False},
-            {'decision_id': 'dec_004', 'predicted_confidence': 0.65, 'actual_outcome': True},
-            {'decision_id': 'dec_005', 'predicted_confidence': 0.45, 'actual_outcome': False},
-            {'decision_id': 'dec_006', 'predicted_confidence': 0.35, 'actual_outcome': False},
-            {'decision_id': 'dec_007', 'predicted_confidence': 0.25, 'actual_outcome': False},
-            {'decision_id': 'dec_008', 'predicted_confidence': 0.15, 'actual_outcome': False}
+        # One clock read shared by every record in this phase
+        now = datetime.now()
+        
+        # Confidence data extracted from events, followed by synthetic
+        # decisions, all as one structured array
+        events = self._idx['with_confidence']
+        synthetic_confidence = (0.95, 0.85, 0.75, 0.65, 0.45, 0.35, 0.25, 0.15)
+        synthetic_outcome = (True, True, False, True, False, False, False, False)
+        n_events, n_synthetic = len(events), len(synthetic_confidence)
+        
+        decisions = np.empty(n_events + n_synthetic, dtype=DEC_DTYPE)
+        decisions[:n_events] = [
+            (f"decision_{e.task_id}", e.agent_id, e.task_id, e.confidence,
+             True,  # Simulated
+             e.classification or 'unknown', e.timestamp)
+            for e in events
         ]
-        
-        for i, dec in enumerate(synthetic_decisions):
-            dec.update({
-                'agent_id': f'agent_{(i%3)+1:03d}',
-                'task_id': f'task_{i+10:03d}',
-                'decision_type': 'classification',
-                'timestamp': datetime.now().isoformat()
-            })
-            
-        all_decisions = decisions + synthetic_decisions
-        self.confidence_data = all_decisions
-        
-        # Calculate calibration metrics
-        total_decisions = len(all_decisions)
-        correct_decisions = sum(1 for d in all_decisions if d['actual_outcome'])
-        accuracy = correct_decisions / total_decisions if total_decisions > 0 else 0
-        avg_confidence = sum(d['predicted_confidence'] for d in all_decisions) / total_decisions
-        
-        # Save confidence data
-        with open(self.output_dir / 'confidence_data.json', 'w') as f:
-            json.dump(all_decisions, f, indent=2)
+        synthetic = decisions[n_events:]
+        synthetic['decision_id'] = [f'dec_{i:03d}' for i in range(1, n_synthetic + 1)]
+        synthetic['agent_id'] = [f'agent_{(i%3)+1:03d}' for i in range(n_synthetic)]
+        synthetic['task_id'] = [f'task_{i+10:03d}' for i in range(n_synthetic)]
+        synthetic['predicted_confidence'] = synthetic_confidence
+        synthetic['actual_outcome'] = synthetic_outcome
+        synthetic['decision_type'] = 'classification'
+        synthetic['timestamp'] = now
+        
+        # Calculate calibration metrics; the column views are kept for the
+        # pattern, dashboard and report phases
+        total_decisions = len(decisions)
+        self._conf_arr = decisions['predicted_confidence']
+        self._outcome_arr = decisions['actual_outcome']
+        accuracy = float(self._outcome_arr.mean()) if total_decisions > 0 else 0
+        avg_confidence = float(self._conf_arr.mean()) if total_decisions > 0 else 0
+        self._accuracy = accuracy
+        self._avg_confidence = avg_confidence
+        
+        # Materialize dicts only for the export files
+        names = DEC_DTYPE.names
+        self.confidence_data = [dict(zip(names, row)) for row in decisions.tolist()]
+        self._write_json(self.output_dir / 'confidence_data.json', self.confidence_data)
             
         print(f"  ✓ Tracked {total_decisions} decisions")
         print(f"  ✓ Average confidence: {avg_confidence:.3f}")
@@ -251,7 +451,7 @@ class SimpleReportingDemo:
         patterns = []
         
         # Detect failure patterns
-        failed_events = [e for e in self.events if e['level'] == 'error']
+        failed_events = self._idx['failed']
         if len(failed_events) >= 1:
             patterns.append({
                 'id': 'pattern_001',
@@ -269,7 +469,7 @@ class SimpleReportingDemo:
             })
             
         # Detect performance patterns
-        slow_events = [e for e in self.events if e.get('metadata', {}).get('execution_time', 0) > 60]
+        slow_events = self._idx['slow']
         if len(slow_events) >= 1:
             patterns.append({
                 'id': 'pattern_002',
@@ -287,14 +487,14 @@ class SimpleReportingDemo:
             })
             
         # Detect confidence patterns
-        low_conf_decisions = [d for d in self.confidence_data if d['predicted_confidence'] < 0.5]
-        if len(low_conf_decisions) >= 2:
+        low_conf_count = int((self._conf_arr < 0.5).sum())
+        if low_conf_count >= 2:
             patterns.append({
                 'id': 'pattern_003',
                 'name': 'Low Confidence Decisions',
                 'pattern_type': 'confidence',
                 'description': 'Multiple decisions with low confidence scores',
-                'frequency': len(low_conf_decisions),
+                'frequency': low_conf_count,
                 'confidence': 0.85,
                 'impact_score': 0.5,
                 'recommendations': [
@@ -307,8 +507,7 @@ class SimpleReportingDemo:
         self.patterns = patterns
         
         # Save patterns
-        with open(self.output_dir / 'detected_patterns.json', 'w') as f:
-            json.dump(patterns, f, indent=2)
+        self._write_json(self.output_dir / 'detected_patterns.json', patterns)
             
         print(f"  ✓ Detected {len(patterns)} patterns")
         for pattern in patterns:
@@ -326,8 +525,9 @@ class SimpleReportingDemo:
         
         # Save as Markdown
         report_path = self.output_dir / 'supervisor_report.md'
-        with open(report_path, 'w') as f:
-            f.write(report)
+        self._pending_writes.append(
+            self._io.submit(report_path.write_text, report, encoding='utf-8')
+        )
             
         print(f"  ✓ Generated comprehensive report")
         print(f"  ✓ Saved to {report_path}")
@@ -339,14 +539,14 @@ class SimpleReportingDemo:
         print("-" * 25)
         
         # Calculate dashboard metrics
-        total_tasks = len([e for e in self.events if 'task' in e['event_type']])
-        completed_tasks = len([e for e in self.events if e['event_type'] == 'task_completed'])
-        failed_tasks = len([e for e in self.events if e['event_type'] == 'task_failed'])
+        total_tasks = self._idx['total_tasks']
+        completed_tasks = self._idx['completed_tasks']
+        failed_tasks = self._idx['failed_tasks']
         
         success_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
         
         dashboard_data = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(),
             'metrics': {
                 'total_tasks': total_tasks,
                 'completed_tasks': completed_tasks,
@@ -354,14 +554,13 @@ class SimpleReportingDemo:
                 'success_rate': round(success_rate, 1),
                 'active_alerts': len(self.alerts),
                 'detected_patterns': len(self.patterns),
-                'avg_confidence': round(sum(d['predicted_confidence'] for d in self.confidence_data) / len(self.confidence_data), 3) if self.confidence_data else 0
+                'avg_confidence': round(self._avg_confidence, 3) if self._conf_arr.size else 0
             },
             'status': 'operational'
         }
         
         # Save dashboard data
-        with open(self.output_dir / 'dashboard_data.json', 'w') as f:
-            json.dump(dashboard_data, f, indent=2)
+        self._write_json(self.output_dir / 'dashboard_data.json', dashboard_data)
             
         print(f"  ✓ Generated dashboard metrics")
         print(f"    - Success Rate: {success_rate:.1f}%")
@@ -370,49 +569,97 @@ class SimpleReportingDemo:
         print(f"  ✓ Saved to {self.output_dir}/dashboard_data.json")
         print(f"  → Real-time metrics available\n")
         
-    def demo_export(self):
-        """Demonstrate export functionality"""
+    def demo_export(self, pretty: bool = False):
+        """Demonstrate export functionality
+
+        The complete export is compact JSON by default; pretty=True writes
+        it indented for reading by hand.
+        """
         print("📤 7. Data Export")
         print("-" * 18)
         
         # Create comprehensive export
-        export_data = {
-            'export_timestamp': datetime.now().isoformat(),
-            'system_version': '1.0.0',
-            'components': {
-                'audit_events': self.events,
-                'alerts': self.alerts,
-                'patterns': self.patterns,
-                'confidence_data': self.confidence_data
-            },
-            'summary': {
-                'total_events': len(self.events),
-                'total_alerts': len(self.alerts),
-                'total_patterns': len(self.patterns),
-                'total_decisions': len(self.confidence_data)
-            }
+        header = {
+            'export_timestamp': datetime.now(),
+            'system_version': '1.0.0'
+        }
+        components = {
+            'audit_events': self.events,
+            'alerts': self.alerts,
+            'patterns': self.patterns,
+            'confidence_data': self.confidence_data
+        }
+        summary = {
+            'total_events': len(self.events),
+            'total_alerts': len(self.alerts),
+            'total_patterns': len(self.patterns),
+            'total_decisions': len(self.confidence_data)
         }
         
-        # Save complete export
         export_path = self.output_dir / 'complete_export.json'
-        with open(export_path, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        if pretty:
+            self._write_json(export_path, {**header, 'components': components, 'summary': summary})
+        else:
+            # Stream the compact export element by element
+            self._pending_writes.append(self._io.submit(
+                _stream_export, export_path, header, components, summary
+            ))
             
         # Create CSV export for events
         csv_path = self.output_dir / 'events_export.csv'
-        with open(csv_path, 'w') as f:
-            f.write("id,timestamp,event_type,level,agent_id,task_id,outcome\n")
-            for event in self.events:
-                f.write(f"{event['id']},{event['timestamp']},{event['event_type']},{event['level']},{event['agent_id']},{event['task_id']},{event['outcome']}\n")
+        with open(csv_path, 'w', newline='', buffering=1 << 20) as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(('id', 'timestamp', 'event_type', 'level',
+                             'agent_id', 'task_id', 'outcome'))
+            writer.writerows(
+                (e.id, e.timestamp.isoformat(), e.event_type, e.level,
+                 e.agent_id, e.task_id, e.outcome)
+                for e in self.events
+            )
                 
         print(f"  ✓ Created complete data export")
         print(f"  ✓ JSON export: {export_path}")
         print(f"  ✓ CSV export: {csv_path}")
         print(f"  → Export formats: JSON, CSV\n")
         
+    def _index_events(self):
+        """Bucket the stored events with indexed queries for the later demo phases"""
+        by_id = {e.id: e for e in self.events}
+        query = self.conn.execute
+        
+        def select(where):
+            return [by_id[event_id] for (event_id,) in
+                    query(f"SELECT id FROM events WHERE {where} ORDER BY rowid")]
+        
+        idx = {
+            'alert_triggers': [],   # ('timeout' | 'low_confidence', event)
+            'with_confidence': select("confidence IS NOT NULL"),
+            'failed': select("level = 'error'"),
+            'slow': select("execution_time > 60")
+        }
+        
+        for event_id, timeout, low_confidence in query(
+            "SELECT id, execution_time > 300, confidence < 0.3 FROM events "
+            "WHERE execution_time > 300 OR confidence < 0.3 ORDER BY rowid"
+        ):
+            if timeout:
+                idx['alert_triggers'].append(('timeout', by_id[event_id]))
+            if low_confidence:
+                idx['alert_triggers'].append(('low_confidence', by_id[event_id]))
+                
+        # Task counts come from one grouped count over the event types
+        type_counts = dict(query(
+            "SELECT event_type, COUNT(*) FROM events GROUP BY event_type"
+        ))
+        idx['total_tasks'] = sum(n for t, n in type_counts.items() if 'task' in t)
+        idx['completed_tasks'] = type_counts.get('task_completed', 0)
+        idx['failed_tasks'] = type_counts.get('task_failed', 0)
+                
+        return idx
+        
     def _generate_summary_report(self):
         """Generate summary report in Markdown"""
-        report = f"""# Supervisor Agent Summary Report
+        parts = [f"""# Supervisor Agent Summary Report
 
 ## Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
@@ -426,50 +673,50 @@ class SimpleReportingDemo:
 ### 📈 Performance Metrics
 
 #### Task Execution
-"""
+"""]
         
-        total_tasks = len([e for e in self.events if 'task' in e['event_type']])
-        completed_tasks = len([e for e in self.events if e['event_type'] == 'task_completed'])
-        failed_tasks = len([e for e in self.events if e['event_type'] == 'task_failed'])
+        total_tasks = self._idx['total_tasks']
+        completed_tasks = self._idx['completed_tasks']
+        failed_tasks = self._idx['failed_tasks']
         
         if total_tasks > 0:
             success_rate = completed_tasks / total_tasks * 100
-            report += f"""
+            parts.append(f"""
 - **Total Tasks**: {total_tasks}
 - **Completed**: {completed_tasks}
 - **Failed**: {failed_tasks}
 - **Success Rate**: {success_rate:.1f}%
-"""
+""")
         
         # Add confidence metrics
-        if self.confidence_data:
-            avg_conf = sum(d['predicted_confidence'] for d in self.confidence_data) / len(self.confidence_data)
-            accuracy = sum(1 for d in self.confidence_data if d['actual_outcome']) / len(self.confidence_data)
+        if self._conf_arr.size:
+            avg_conf = self._avg_confidence
+            accuracy = self._accuracy
             
-            report += f"""
+            parts.append(f"""
 #### Confidence Analysis
 - **Average Confidence**: {avg_conf:.3f}
 - **Decision Accuracy**: {accuracy:.3f}
 - **Total Decisions**: {len(self.confidence_data)}
-"""
+""")
         
         # Add alerts section
         if self.alerts:
-            report += f"""
+            parts.append(f"""
 ### 🚨 Active Alerts
 
-"""
+""")
             for alert in self.alerts[:5]:  # Show first 5
-                report += f"- **{alert['priority']}**: {alert['title']}\n"
+                parts.append(f"- **{alert.priority}**: {alert.title}\n")
                 
         # Add patterns section
         if self.patterns:
-            report += f"""
+            parts.append(f"""
 ### 🔍 Detected Patterns
 
-"""
+""")
             for pattern in self.patterns:
-                report += f"- **{pattern['name']}** ({pattern['pattern_type']}): {pattern['description']}\n"
+                parts.append(f"- **{pattern['name']}** ({pattern['pattern_type']}): {pattern['description']}\n")
                 
         # Add recommendations
         recommendations = []
@@ -477,14 +724,14 @@ class SimpleReportingDemo:
             recommendations.extend(pattern.get('recommendations', []))
             
         if recommendations:
-            report += f"""
+            parts.append(f"""
 ### 💡 Recommendations
 
-"""
+""")
             for rec in recommendations[:5]:  # Show first 5
-                report += f"- {rec}\n"
+                parts.append(f"- {rec}\n")
                 
-        report += f"""
+        parts.append(f"""
 
 ### 📋 Summary
 
@@ -492,9 +739,9 @@ The Supervisor Agent reporting system is operational and providing comprehensive
 
 ---
 *Report generated by Supervisor Agent Reporting System v1.0*
-"""
+""")
         
-        return report
+        return ''.join(parts)
 
 
 def main():
@@ -506,9 +753,10 @@ def main():
         print(f"\n📁 All output files saved to: {demo.output_dir.absolute()}")
         print("\nFiles generated:")
         
-        for file in demo.output_dir.glob('*'):
-            size = file.stat().st_size
-            print(f"  📄 {file.name} ({size} bytes)")
+        with os.scandir(demo.output_dir) as it:
+            entries = sorted((e for e in it if e.is_file()), key=lambda e: e.name)
+        for entry in entries:
+            print(f"  📄 {entry.name} ({entry.stat().st_size} bytes)")
             
     except Exception as e:
         print(f"\n❌ Demo failed: {e}")
@@ -1,34 +1,51 @@
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Union, Literal
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
 from pydantic import BaseModel
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only QualityMetricsBatch needs it
+    np = None
 
-class InterventionLevel(Enum):
+
+class _LabeledIntEnum(IntEnum):
+    """IntEnum whose user-facing label is the lower-case member name"""
+
+    @property
+    def name_str(self) -> str:
+        return self.name.lower()
+
+    @classmethod
+    def from_name_str(cls, label: str):
+        return cls[label.upper()]
+
+
+class InterventionLevel(_LabeledIntEnum):
     """Intervention levels for the tiered response system"""
-    WARNING = "warning"
-    CORRECTION = "correction"
-    ESCALATION = "escalation"
+    WARNING = 1
+    CORRECTION = 2
+    ESCALATION = 3
 
 
-class TaskStatus(Enum):
+class TaskStatus(_LabeledIntEnum):
     """Status of monitored tasks"""
-    ACTIVE = "active"
-    PAUSED = "paused"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    ESCALATED = "escalated"
+    ACTIVE = 1
+    PAUSED = 2
+    COMPLETED = 3
+    FAILED = 4
+    ESCALATED = 5
 
 
-class ConfidenceLevel(Enum):
+class ConfidenceLevel(_LabeledIntEnum):
     """Confidence levels for supervisor decisions"""
-    LOW = "low"  # < 60%
-    MEDIUM = "medium"  # 60-80%
-    HIGH = "high"  # > 80%
+    LOW = 1  # < 60%
+    MEDIUM = 2  # 60-80%
+    HIGH = 3  # > 80%
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceUsage:
     """Resource usage tracking"""
     token_count: int = 0
@@ -39,7 +56,7 @@ class ResourceUsage:
     error_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityMetrics:
     """Quality assessment metrics"""
     structure_score: float = 0.0  # JSON/Markdown validity
@@ -49,7 +66,54 @@ class QualityMetrics:
     confidence_score: float = 0.0  # Overall confidence
 
 
-@dataclass
+class QualityMetricsBatch:
+    """Column-wise (SoA) store of QualityMetrics for fleet-level aggregation"""
+
+    FIELDS = (
+        "structure_score",
+        "coherence_score",
+        "instruction_adherence",
+        "completeness_score",
+        "confidence_score",
+    )
+
+    def __init__(self, capacity: int = 64):
+        if np is None:
+            raise ImportError("QualityMetricsBatch requires numpy")
+        self._size = 0
+        self._capacity = max(capacity, 1)
+        for name in self.FIELDS:
+            setattr(self, name, np.empty(self._capacity, dtype=np.float64))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, qm: QualityMetrics) -> None:
+        """Append one task's metrics, doubling the column buffers when full"""
+        if self._size == self._capacity:
+            self._capacity *= 2
+            for name in self.FIELDS:
+                column = np.empty(self._capacity, dtype=np.float64)
+                column[:self._size] = getattr(self, name)[:self._size]
+                setattr(self, name, column)
+        i = self._size
+        for name in self.FIELDS:
+            getattr(self, name)[i] = getattr(qm, name)
+        self._size += 1
+
+    def column(self, name: str) -> "np.ndarray":
+        """Filled view of a single metric column"""
+        return getattr(self, name)[:self._size]
+
+    def mean(self) -> Dict[str, float]:
+        """Per-field mean over all appended metrics (0.0 when empty)"""
+        if not self._size:
+            return {name: 0.0 for name in self.FIELDS}
+        stacked = np.stack([self.column(name) for name in self.FIELDS])
+        return dict(zip(self.FIELDS, stacked.mean(axis=1, dtype=np.float64).tolist()))
+
+
+@dataclass(slots=True)
 class MonitoringRules:
     """Configuration for monitoring behavior"""
     max_token_threshold: int = 10000
@@ -64,7 +128,7 @@ class MonitoringRules:
     enable_rollback: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentTask:
     """Represents a monitored agent task"""
     task_id: str
@@ -83,7 +147,7 @@ class AgentTask:
     last_known_good_state: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SupervisionReport:
     """Comprehensive supervision report"""
     report_id: str
@@ -97,7 +161,7 @@ class SupervisionReport:
     confidence_distribution: Dict[ConfidenceLevel, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class EscalationConfig:
     """Configuration for escalation rules"""
     notification_channels: List[str] = field(default_factory=list)
@@ -107,7 +171,7 @@ class EscalationConfig:
     escalation_timeout_minutes: int = 60
 
 
-@dataclass
+@dataclass(slots=True)
 class KnowledgeBaseEntry:
     """Entry in the failure knowledge base"""
     pattern_id: str
@@ -131,4 +195,4 @@ class InterventionRequired(SupervisorError):
         self.level = level
         self.reason = reason
         self.confidence = confidence
-        super().__init__(f"{level.value}: {reason} (confidence: {confidence:.2f})")
\ No newline at end of file
+        super().__init__(f"{level.name_str}: {reason} (confidence: {confidence:.2f})")
\ No newline at end of file
@@ -1,3 +1,4 @@
+from dataclasses import asdict
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime, timedelta
 from uuid import uuid4
@@ -5,6 +6,11 @@ import json
 import asyncio
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from . import (
     AgentTask,
     TaskStatus,
@@ -16,7 +22,8 @@ from . import (
     EscalationConfig,
     KnowledgeBaseEntry,
     ConfidenceLevel,
-    InterventionRequired
+    InterventionRequired,
+    QualityMetricsBatch
 )
 from .quality_analyzer import QualityAnalyzer
 from .pattern_learner import PatternLearner
@@ -120,7 +127,7 @@ class SupervisorCore:
             "timestamp": datetime.now().isoformat(),
             "output": output,
             "output_type": output_type,
-            "quality_metrics": quality_metrics.__dict__,
+            "quality_metrics": asdict(quality_metrics),
             "intervention_result": intervention_result,
             "metadata": metadata or {}
         }
@@ -144,7 +151,7 @@ class SupervisorCore:
         
         return {
             "task_id": task_id,
-            "quality_metrics": quality_metrics.__dict__,
+            "quality_metrics": asdict(quality_metrics),
             "intervention_result": intervention_result,
             "recommendations": await self._generate_recommendations(task)
         }
@@ -200,7 +207,7 @@ class SupervisorCore:
         
         return {
             "intervention_required": intervention_required,
-            "level": level.value if level else None,
+            "level": level.name_str if level else None,
             "reason": reason,
             "confidence": confidence,
             "pattern_match": pattern_match
@@ -212,11 +219,11 @@ class SupervisorCore:
         intervention_result: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Apply the appropriate intervention"""
-        level = InterventionLevel(intervention_result["level"])
+        level = InterventionLevel.from_name_str(intervention_result["level"])
         
         intervention_record = {
             "timestamp": datetime.now().isoformat(),
-            "level": level.value,
+            "level": level.name_str,
             "reason": intervention_result["reason"],
             "confidence": intervention_result["confidence"],
             "action_taken": None
@@ -236,7 +243,7 @@ class SupervisorCore:
             task.last_known_good_state = {
                 "timestamp": datetime.now().isoformat(),
                 "outputs": task.outputs[-5:],  # Last 5 outputs
-                "quality_metrics": task.quality_metrics.__dict__
+                "quality_metrics": asdict(task.quality_metrics)
             }
         
         elif level == InterventionLevel.ESCALATION:
@@ -322,20 +329,26 @@ class SupervisorCore:
         
         for task in recent_tasks:
             for intervention in task.interventions:
-                level = InterventionLevel(intervention["level"])
+                level = InterventionLevel.from_name_str(intervention["level"])
                 interventions_by_level[level] += 1
         
         # Calculate quality trends
+        if np is not None:
+            batch = QualityMetricsBatch(capacity=len(recent_tasks))
+            for task in recent_tasks:
+                batch.append(task.quality_metrics)
+            means = batch.mean()
+        else:
+            means = {
+                name: sum(
+                    getattr(task.quality_metrics, name) for task in recent_tasks
+                ) / max(len(recent_tasks), 1)
+                for name in QualityMetricsBatch.FIELDS
+            }
         quality_trends = {
-            "average_confidence": sum(
-                task.quality_metrics.confidence_score for task in recent_tasks
-            ) / max(len(recent_tasks), 1),
-            "average_coherence": sum(
-                task.quality_metrics.coherence_score for task in recent_tasks
-            ) / max(len(recent_tasks), 1),
-            "average_instruction_adherence": sum(
-                task.quality_metrics.instruction_adherence for task in recent_tasks
-            ) / max(len(recent_tasks), 1)
+            "average_confidence": means["confidence_score"],
+            "average_coherence": means["coherence_score"],
+            "average_instruction_adherence": means["instruction_adherence"]
         }
         
         # Get common failure patterns
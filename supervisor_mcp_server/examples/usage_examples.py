@@ -7,71 +7,172 @@ Demonstrates how to use all 10 tools provided by the supervisor agent.
 
 import asyncio
 import json
+import sys
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+def _pretty_json(obj) -> str:
+    """Indented JSON for display, via orjson's C encoder when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+# Static skeletons of the mock responses; builders copy one and patch
+# only the per-call fields
+_MONITOR_TEMPLATE = {
+    "success": True,
+    "session_id": "session_12345",
+    "agent_id": None,
+    "monitoring_active": True,
+    "timestamp": None
+}
+
+_RULES_TEMPLATE = {
+    "success": True,
+    "agent_id": None,
+    "rules_applied": None,
+    "active_monitoring": True,
+    "timestamp": None
+}
+
+_REPORT_TEMPLATE = {
+    "success": True,
+    "report": {
+        "report_id": "report_67890",
+        "generated_at": None,
+        "time_range": None,
+        "summary": {
+            "total_agents": 3,
+            "active_sessions": 2,
+            "total_interventions": 1,
+            "successful_recoveries": 5,
+            "escalated_issues": 0
+        },
+        "alerts": [],
+        "recommendations": ["System operating within normal parameters"]
+    },
+    "timestamp": None
+}
+
+
+# Pretty-printed JSON of static objects, encoded once at import. Entries
+# keep a reference to their object so an id() can never be reused.
+_STATIC_JSON = {}
+
+# Shared stand-in when a validation response carries no scores
+_NO_SCORES = {}
+
+for _obj in (_REPORT_TEMPLATE["report"]["summary"], _NO_SCORES):
+    _STATIC_JSON[id(_obj)] = (_obj, _pretty_json(_obj))
+
+
+def _display_json(obj) -> str:
+    """Pretty JSON for display, reusing the cached text for static objects"""
+    hit = _STATIC_JSON.get(id(obj))
+    if hit is not None and hit[0] is obj:
+        return hit[1]
+    return _pretty_json(obj)
+
+
+def _monitor_agent_response(parameters, now_iso):
+    resp = _MONITOR_TEMPLATE.copy()
+    resp["agent_id"] = parameters.get("agent_id")
+    resp["timestamp"] = now_iso
+    return resp
+
+
+def _set_monitoring_rules_response(parameters, now_iso):
+    resp = _RULES_TEMPLATE.copy()
+    resp["agent_id"] = parameters.get("agent_id")
+    resp["rules_applied"] = parameters.get("rules")
+    resp["timestamp"] = now_iso
+    return resp
+
+
+def _supervision_report_response(parameters, now_iso):
+    # The summary, alerts and recommendations are shared with the template
+    # and must be treated as read-only
+    report = _REPORT_TEMPLATE["report"].copy()
+    report["generated_at"] = now_iso
+    report["time_range"] = parameters.get("time_range", "1h")
+    resp = _REPORT_TEMPLATE.copy()
+    resp["report"] = report
+    resp["timestamp"] = now_iso
+    return resp
+
+
+# Mock response builders, keyed by tool name
+_BUILDERS = {
+    "monitor_agent": _monitor_agent_response,
+    "set_monitoring_rules": _set_monitoring_rules_response,
+    "get_supervision_report": _supervision_report_response
+}
+
 # Mock MCP client for demonstration
 class MockMCPClient:
     def __init__(self, server_name):
         self.server_name = server_name
     
-    async def call(self, tool_name, parameters):
+    def call(self, tool_name, parameters):
+        """Return an already-resolved future; the mock does no I/O, so no
+        coroutine or task is needed. Callers await it as before."""
+        fut = asyncio.get_running_loop().create_future()
+        fut.set_result(self._call_sync(tool_name, parameters))
+        return fut
+    
+    async def call_batch(self, requests):
+        """Submit several (tool_name, parameters) requests in one round trip
+
+        Returns the responses in request order. A real transport should
+        send all requests in a single length-prefixed JSON frame and read
+        all responses back from a single frame (one submission and one
+        completion per batch) instead of a round trip per request.
+        """
+        return [self._call_sync(tool_name, parameters) for tool_name, parameters in requests]
+    
+    def _call_sync(self, tool_name, parameters):
         # This would normally connect to the actual MCP server
-        print(f"Calling {tool_name} with parameters: {json.dumps(parameters, indent=2)}")
+        print(f"Calling {tool_name} with parameters: {_pretty_json(parameters)}")
         
-        # Mock responses for demonstration
-        mock_responses = {
-            "monitor_agent": {
-                "success": True,
-                "session_id": "session_12345",
-                "agent_id": parameters.get("agent_id"),
-                "monitoring_active": True,
-                "timestamp": datetime.now().isoformat()
-            },
-            "set_monitoring_rules": {
-                "success": True,
-                "agent_id": parameters.get("agent_id"),
-                "rules_applied": parameters.get("rules"),
-                "active_monitoring": True,
-                "timestamp": datetime.now().isoformat()
-            },
-            "get_supervision_report": {
-                "success": True,
-                "report": {
-                    "report_id": "report_67890",
-                    "generated_at": datetime.now().isoformat(),
-                    "time_range": parameters.get("time_range", "1h"),
-                    "summary": {
-                        "total_agents": 3,
-                        "active_sessions": 2,
-                        "total_interventions": 1,
-                        "successful_recoveries": 5,
-                        "escalated_issues": 0
-                    },
-                    "alerts": [],
-                    "recommendations": ["System operating within normal parameters"]
-                },
-                "timestamp": datetime.now().isoformat()
-            }
-        }
-        
-        return mock_responses.get(tool_name, {"success": True, "message": "Mock response"})
+        # Build the mock response for the requested tool only, with one
+        # timestamp shared by all of its fields
+        builder = _BUILDERS.get(tool_name)
+        if builder is None:
+            return {"success": True, "message": "Mock response"}
+        return builder(parameters, datetime.now().isoformat())
 
 async def demonstrate_supervisor_tools():
     """
     Demonstrate all 10 supervisor tools with practical examples
     """
     
-    print("=" * 80)
-    print("SUPERVISOR AGENT MCP SERVER - USAGE EXAMPLES")
-    print("=" * 80)
+    # Output is collected and written in one call per section; it is
+    # flushed before every request so the client's own output stays in order
+    out = []
+    p = out.append
+    
+    def flush():
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
+            out.clear()
+    
+    p("=" * 80)
+    p("SUPERVISOR AGENT MCP SERVER - USAGE EXAMPLES")
+    p("=" * 80)
     
     # Initialize mock client (replace with actual MCP client)
     client = MockMCPClient("supervisor-agent")
     
     # 1. Monitor Agent
-    print("\n1. MONITOR AGENT")
-    print("-" * 40)
+    p("\n1. MONITOR AGENT")
+    p("-" * 40)
     
+    flush()
     monitor_result = await client.call("monitor_agent", {
         "agent_id": "data_processor_01",
         "task_config": {
@@ -98,13 +199,16 @@ async def demonstrate_supervisor_tools():
         }
     })
     
-    print(f"Monitoring started for agent: {monitor_result['agent_id']}")
-    print(f"Session ID: {monitor_result['session_id']}")
+    p(f"Monitoring started for agent: {monitor_result['agent_id']}")
+    p(f"Session ID: {monitor_result['session_id']}")
     
     # 2. Set Monitoring Rules
-    print("\n2. SET MONITORING RULES")
-    print("-" * 40)
+    p("\n2. SET MONITORING RULES")
+    p("-" * 40)
     
+    # The server only applies rules to agents that are already being
+    # monitored, so this waits for monitor_agent to finish
+    flush()
     rules_result = await client.call("set_monitoring_rules", {
         "agent_id": "data_processor_01",
         "rules": {
@@ -125,27 +229,29 @@ async def demonstrate_supervisor_tools():
         }
     })
     
-    print(f"Monitoring rules configured for agent: {rules_result['agent_id']}")
+    p(f"Monitoring rules configured for agent: {rules_result['agent_id']}")
     
     # 3. Get Supervision Report
-    print("\n3. GET SUPERVISION REPORT")
-    print("-" * 40)
+    p("\n3. GET SUPERVISION REPORT")
+    p("-" * 40)
     
+    flush()
     report_result = await client.call("get_supervision_report", {
         "agent_id": "data_processor_01",
         "time_range": "24h"
     })
     
     report = report_result['report']
-    print(f"Report ID: {report['report_id']}")
-    print(f"Time Range: {report['time_range']}")
-    print(f"Summary: {json.dumps(report['summary'], indent=2)}")
+    p(f"Report ID: {report['report_id']}")
+    p(f"Time Range: {report['time_range']}")
+    p(f"Summary: {_display_json(report['summary'])}")
     
     # 4. Intervene Task
-    print("\n4. INTERVENE TASK")
-    print("-" * 40)
+    p("\n4. INTERVENE TASK")
+    p("-" * 40)
     
     # Example: Pause agent due to quality concerns
+    flush()
     intervention_result = await client.call("intervene_task", {
         "agent_id": "data_processor_01",
         "intervention_type": "pause",
@@ -156,9 +262,10 @@ async def demonstrate_supervisor_tools():
         }
     })
     
-    print(f"Intervention executed: {intervention_result.get('intervention_id')}")
+    p(f"Intervention executed: {intervention_result.get('intervention_id')}")
     
     # Example: Redirect agent to focus on specific task
+    flush()
     redirect_result = await client.call("intervene_task", {
         "agent_id": "data_processor_01", 
         "intervention_type": "redirect",
@@ -172,12 +279,13 @@ async def demonstrate_supervisor_tools():
         }
     })
     
-    print(f"Redirection completed: {redirect_result.get('success')}")
+    p(f"Redirection completed: {redirect_result.get('success')}")
     
     # 5. Validate Output
-    print("\n5. VALIDATE OUTPUT")
-    print("-" * 40)
+    p("\n5. VALIDATE OUTPUT")
+    p("-" * 40)
     
+    flush()
     validation_result = await client.call("validate_output", {
         "agent_id": "data_processor_01",
         "output_data": {
@@ -210,223 +318,226 @@ async def demonstrate_supervisor_tools():
     })
     
     validation = validation_result.get('validation', {})
-    print(f"Validation ID: {validation.get('validation_id')}")
-    print(f"Overall Valid: {validation.get('overall_valid')}")
-    print(f"Quality Scores: {json.dumps(validation.get('scores', {}), indent=2)}")
+    p(f"Validation ID: {validation.get('validation_id')}")
+    p(f"Overall Valid: {validation.get('overall_valid')}")
+    p(f"Quality Scores: {_display_json(validation.get('scores', _NO_SCORES))}")
+    
+    # Audit query windows, all derived from one clock read
+    now = datetime.now()
+    now_iso = now.isoformat()
+    h1_iso = (now - timedelta(hours=1)).isoformat()
+    h24_iso = (now - timedelta(hours=24)).isoformat()
+    
+    # The two audit queries are independent reads, so they are sent as
+    # one batch. Escalation setup and knowledge base updates write audit
+    # events of their own, so they follow in a second batch once the
+    # reads have returned.
+    flush()
+    audit_result, intervention_audit = await client.call_batch([
+        # Get all audit entries for the agent in the last hour
+        ("get_audit_log", {
+            "agent_id": "data_processor_01",
+            "start_time": h1_iso,
+            "end_time": now_iso
+        }),
+        # Get specific event types
+        ("get_audit_log", {
+            "event_type": "intervention",
+            "start_time": h24_iso
+        })
+    ])
+    
+    escalation_result, kb_update1, kb_update2 = await client.call_batch([
+        ("configure_escalation", {
+            "agent_id": "data_processor_01",
+            "escalation_config": {
+                "confidence_threshold": 0.6,
+                "error_count_threshold": 3,
+                "quality_threshold": 0.7,
+                "escalation_contacts": [
+                    "supervisor@company.com",
+                    "ai-ops@company.com"
+                ],
+                "escalation_procedures": [
+                    "notify",
+                    "pause_agent", 
+                    "create_ticket",
+                    "manual_review"
+                ],
+                "auto_escalation_enabled": True,
+                "escalation_timeout": 1800,  # 30 minutes
+                "priority_levels": {
+                    "low": {"response_time": 3600},
+                    "medium": {"response_time": 1800},
+                    "high": {"response_time": 600},
+                    "critical": {"response_time": 300}
+                }
+            }
+        }),
+        # Add a best practice
+        ("knowledge_base_update", {
+            "update_type": "best_practice",
+            "data": {
+                "title": "Effective Data Processing Supervision",
+                "description": "Monitor memory usage closely during large dataset processing",
+                "applicable_scenarios": [
+                    "batch_data_processing",
+                    "large_dataset_analysis", 
+                    "memory_intensive_tasks"
+                ],
+                "recommended_actions": [
+                    "Set memory usage alerts at 80%",
+                    "Implement data chunking for large datasets",
+                    "Monitor processing time vs dataset size ratio"
+                ],
+                "success_metrics": {
+                    "memory_efficiency": "> 0.85",
+                    "processing_time_reduction": "> 0.2",
+                    "error_rate_reduction": "> 0.5"
+                }
+            },
+            "category": "data_processing"
+        }),
+        # Add a detected pattern
+        ("knowledge_base_update", {
+            "update_type": "pattern",
+            "data": {
+                "pattern_name": "Confidence Drop During Complex Analysis",
+                "description": "Agent confidence tends to drop when processing unstructured text data",
+                "indicators": [
+                    "confidence_score < 0.7",
+                    "text_processing_task = true",
+                    "data_structure = unstructured"
+                ],
+                "frequency": "high",
+                "impact": "medium",
+                "recommended_interventions": [
+                    "Provide additional context or examples",
+                    "Break down complex text into smaller chunks",
+                    "Use specialized NLP preprocessing"
+                ]
+            },
+            "category": "pattern_recognition"
+        })
+    ])
     
     # 6. Get Audit Log
-    print("\n6. GET AUDIT LOG")
-    print("-" * 40)
+    p("\n6. GET AUDIT LOG")
+    p("-" * 40)
     
-    # Get all audit entries for the agent in the last hour
-    audit_result = await client.call("get_audit_log", {
-        "agent_id": "data_processor_01",
-        "start_time": (datetime.now() - timedelta(hours=1)).isoformat(),
-        "end_time": datetime.now().isoformat()
-    })
-    
-    print(f"Found {audit_result.get('entry_count', 0)} audit entries")
-    
-    # Get specific event types
-    intervention_audit = await client.call("get_audit_log", {
-        "event_type": "intervention",
-        "start_time": (datetime.now() - timedelta(hours=24)).isoformat()
-    })
-    
-    print(f"Intervention events in last 24h: {intervention_audit.get('entry_count', 0)}")
+    p(f"Found {audit_result.get('entry_count', 0)} audit entries")
+    p(f"Intervention events in last 24h: {intervention_audit.get('entry_count', 0)}")
     
     # 7. Configure Escalation
-    print("\n7. CONFIGURE ESCALATION")
-    print("-" * 40)
+    p("\n7. CONFIGURE ESCALATION")
+    p("-" * 40)
     
-    escalation_result = await client.call("configure_escalation", {
-        "agent_id": "data_processor_01",
-        "escalation_config": {
-            "confidence_threshold": 0.6,
-            "error_count_threshold": 3,
-            "quality_threshold": 0.7,
-            "escalation_contacts": [
-                "supervisor@company.com",
-                "ai-ops@company.com"
-            ],
-            "escalation_procedures": [
-                "notify",
-                "pause_agent", 
-                "create_ticket",
-                "manual_review"
-            ],
-            "auto_escalation_enabled": True,
-            "escalation_timeout": 1800,  # 30 minutes
-            "priority_levels": {
-                "low": {"response_time": 3600},
-                "medium": {"response_time": 1800},
-                "high": {"response_time": 600},
-                "critical": {"response_time": 300}
-            }
-        }
-    })
-    
-    print(f"Escalation configured for agent: {escalation_result.get('agent_id')}")
-    print(f"Auto-escalation enabled: {escalation_result.get('auto_escalation_enabled')}")
+    p(f"Escalation configured for agent: {escalation_result.get('agent_id')}")
+    p(f"Auto-escalation enabled: {escalation_result.get('auto_escalation_enabled')}")
     
     # 8. Knowledge Base Update
-    print("\n8. KNOWLEDGE BASE UPDATE")
-    print("-" * 40)
-    
-    # Add a best practice
-    kb_update1 = await client.call("knowledge_base_update", {
-        "update_type": "best_practice",
-        "data": {
-            "title": "Effective Data Processing Supervision",
-            "description": "Monitor memory usage closely during large dataset processing",
-            "applicable_scenarios": [
-                "batch_data_processing",
-                "large_dataset_analysis", 
-                "memory_intensive_tasks"
-            ],
-            "recommended_actions": [
-                "Set memory usage alerts at 80%",
-                "Implement data chunking for large datasets",
-                "Monitor processing time vs dataset size ratio"
-            ],
-            "success_metrics": {
-                "memory_efficiency": "> 0.85",
-                "processing_time_reduction": "> 0.2",
-                "error_rate_reduction": "> 0.5"
-            }
-        },
-        "category": "data_processing"
-    })
+    p("\n8. KNOWLEDGE BASE UPDATE")
+    p("-" * 40)
     
-    # Add a detected pattern
-    kb_update2 = await client.call("knowledge_base_update", {
-        "update_type": "pattern",
-        "data": {
-            "pattern_name": "Confidence Drop During Complex Analysis",
-            "description": "Agent confidence tends to drop when processing unstructured text data",
-            "indicators": [
-                "confidence_score < 0.7",
-                "text_processing_task = true",
-                "data_structure = unstructured"
-            ],
-            "frequency": "high",
-            "impact": "medium",
-            "recommended_interventions": [
-                "Provide additional context or examples",
-                "Break down complex text into smaller chunks",
-                "Use specialized NLP preprocessing"
-            ]
-        },
-        "category": "pattern_recognition"
-    })
-    
-    print(f"Best practice added: {kb_update1.get('update_id')}")
-    print(f"Pattern recorded: {kb_update2.get('update_id')}")
+    p(f"Best practice added: {kb_update1.get('update_id')}")
+    p(f"Pattern recorded: {kb_update2.get('update_id')}")
     
     # 9. Rollback State
-    print("\n9. ROLLBACK STATE")
-    print("-" * 40)
+    p("\n9. ROLLBACK STATE")
+    p("-" * 40)
     
     # Rollback to specific snapshot
+    flush()
     rollback_result1 = await client.call("rollback_state", {
         "agent_id": "data_processor_01",
         "snapshot_id": "snapshot_abc123"
     })
     
-    print(f"Rollback to snapshot: {rollback_result1.get('success')}")
+    p(f"Rollback to snapshot: {rollback_result1.get('success')}")
     
     # Rollback by number of steps
+    flush()
     rollback_result2 = await client.call("rollback_state", {
         "agent_id": "data_processor_01",
         "rollback_steps": 3
     })
     
-    print(f"Rollback 3 steps: {rollback_result2.get('success')}")
-    print(f"Restored snapshot: {rollback_result2.get('restored_snapshot_id')}")
+    p(f"Rollback 3 steps: {rollback_result2.get('success')}")
+    p(f"Restored snapshot: {rollback_result2.get('restored_snapshot_id')}")
     
     # 10. Generate Summary
-    print("\n10. GENERATE SUMMARY")
-    print("-" * 40)
+    p("\n10. GENERATE SUMMARY")
+    p("-" * 40)
+    
+    # The three summaries are independent, so they are sent as one batch
+    flush()
+    overview_summary, performance_summary, issues_summary = await client.call_batch([
+        ("generate_summary", {
+            "summary_type": "overview",
+            "time_range": "24h",
+            "include_recommendations": True
+        }),
+        ("generate_summary", {
+            "summary_type": "performance",
+            "time_range": "7d",
+            "include_recommendations": True
+        }),
+        ("generate_summary", {
+            "summary_type": "issues",
+            "time_range": "24h",
+            "include_recommendations": True
+        })
+    ])
     
     # Overview summary
-    overview_summary = await client.call("generate_summary", {
-        "summary_type": "overview",
-        "time_range": "24h",
-        "include_recommendations": True
-    })
-    
     summary = overview_summary.get('summary', {})
-    print(f"Overview Summary ID: {summary.get('summary_id')}")
-    print(f"Time Range: {summary.get('time_range')}")
+    p(f"Overview Summary ID: {summary.get('summary_id')}")
+    p(f"Time Range: {summary.get('time_range')}")
     
     if 'supervised_agents' in summary:
         agents_info = summary['supervised_agents']
-        print(f"Supervised Agents: {agents_info.get('total', 0)} total, {agents_info.get('active', 0)} active")
+        p(f"Supervised Agents: {agents_info.get('total', 0)} total, {agents_info.get('active', 0)} active")
     
     # Performance summary
-    performance_summary = await client.call("generate_summary", {
-        "summary_type": "performance", 
-        "time_range": "7d",
-        "include_recommendations": True
-    })
-    
     perf_summary = performance_summary.get('summary', {})
-    print(f"\nPerformance Summary (7 days):")
+    p(f"\nPerformance Summary (7 days):")
     if 'performance_metrics' in perf_summary:
         metrics = perf_summary['performance_metrics']
-        print(f"  Success Rate: {metrics.get('success_rate', 0):.2%}")
-        print(f"  Total Evaluations: {metrics.get('total_evaluations', 0)}")
-        print(f"  Total Interventions: {metrics.get('total_interventions', 0)}")
+        p(f"  Success Rate: {metrics.get('success_rate', 0):.2%}")
+        p(f"  Total Evaluations: {metrics.get('total_evaluations', 0)}")
+        p(f"  Total Interventions: {metrics.get('total_interventions', 0)}")
     
     # Issues summary
-    issues_summary = await client.call("generate_summary", {
-        "summary_type": "issues",
-        "time_range": "24h",
-        "include_recommendations": True
-    })
-    
     issues = issues_summary.get('summary', {})
-    print(f"\nIssues Summary (24h):")
+    p(f"\nIssues Summary (24h):")
     if 'issues_summary' in issues:
         issue_info = issues['issues_summary']
-        print(f"  Total Issues: {issue_info.get('total_issues', 0)}")
-        print(f"  Critical Issues: {issue_info.get('critical_issues', 0)}")
-        print(f"  Resolved Issues: {issue_info.get('resolved_issues', 0)}")
+        p(f"  Total Issues: {issue_info.get('total_issues', 0)}")
+        p(f"  Critical Issues: {issue_info.get('critical_issues', 0)}")
+        p(f"  Resolved Issues: {issue_info.get('resolved_issues', 0)}")
     
     # Show recommendations if available
     recommendations = summary.get('recommendations', [])
     if recommendations:
-        print(f"\nRecommendations:")
+        p(f"\nRecommendations:")
         for i, rec in enumerate(recommendations, 1):
-            print(f"  {i}. {rec}")
-    
-    print("\n" + "=" * 80)
-    print("SUPERVISOR AGENT DEMONSTRATION COMPLETED")
-    print("=" * 80)
-    print("\nAll 10 tools demonstrated successfully!")
-    print("\nNext Steps:")
-    print("- Replace MockMCPClient with actual MCP client")
-    print("- Configure real agents for supervision")
-    print("- Set up monitoring dashboards")
-    print("- Configure alerting and escalation procedures")
-    print("- Integrate with your AI agent frameworks")
+            p(f"  {i}. {rec}")
+    
+    p("\n" + "=" * 80)
+    p("SUPERVISOR AGENT DEMONSTRATION COMPLETED")
+    p("=" * 80)
+    p("\nAll 10 tools demonstrated successfully!")
+    p("\nNext Steps:")
+    p("- Replace MockMCPClient with actual MCP client")
+    p("- Configure real agents for supervision")
+    p("- Set up monitoring dashboards")
+    p("- Configure alerting and escalation procedures")
+    p("- Integrate with your AI agent frameworks")
+    flush()
 
 # Additional integration examples
 
-async def integration_examples():
-    """
-    Show how to integrate with different frameworks
-    """
-    
-    print("\n" + "=" * 80)
-    print("FRAMEWORK INTEGRATION EXAMPLES")
-    print("=" * 80)
-    
-    # LangChain Integration Example
-    print("\n1. LANGCHAIN INTEGRATION")
-    print("-" * 40)
-    
-    langchain_example = """
+_LANGCHAIN_EXAMPLE = """
     from langchain.agents import AgentExecutor
     from supervisor_integration import SupervisorWrapper
     
@@ -445,13 +556,8 @@ async def integration_examples():
         "Analyze the quarterly sales data and provide insights"
     )
     """
-    print(langchain_example)
-    
-    # AutoGen Integration Example
-    print("\n2. AUTOGEN INTEGRATION")
-    print("-" * 40)
-    
-    autogen_example = """
+
+_AUTOGEN_EXAMPLE = """
     from autogen import ConversableAgent
     from supervisor_integration import AutoGenSupervisorMixin
     
@@ -476,13 +582,8 @@ async def integration_examples():
     analyst = SupervisedAgent("data_analyst")
     reviewer = SupervisedAgent("quality_reviewer")
     """
-    print(autogen_example)
-    
-    # Custom Framework Integration
-    print("\n3. CUSTOM FRAMEWORK INTEGRATION")
-    print("-" * 40)
-    
-    custom_example = """
+
+_CUSTOM_EXAMPLE = """
     from supervisor_client import SupervisorMCPClient
     
     class SupervisedCustomAgent:
@@ -527,7 +628,33 @@ async def integration_examples():
                 )
                 raise
     """
-    print(custom_example)
+
+# Static integration snippets by framework, in display order
+INTEGRATION_EXAMPLES = {
+    "langchain": _LANGCHAIN_EXAMPLE,
+    "autogen": _AUTOGEN_EXAMPLE,
+    "custom": _CUSTOM_EXAMPLE
+}
+
+_INTEGRATION_TITLES = {
+    "langchain": "LANGCHAIN INTEGRATION",
+    "autogen": "AUTOGEN INTEGRATION",
+    "custom": "CUSTOM FRAMEWORK INTEGRATION"
+}
+
+async def integration_examples():
+    """
+    Show how to integrate with different frameworks
+    """
+    
+    print("\n" + "=" * 80)
+    print("FRAMEWORK INTEGRATION EXAMPLES")
+    print("=" * 80)
+    
+    for i, (framework, example) in enumerate(INTEGRATION_EXAMPLES.items(), 1):
+        print(f"\n{i}. {_INTEGRATION_TITLES[framework]}")
+        print("-" * 40)
+        print(example)
 
 if __name__ == "__main__":
     # Run the demonstration
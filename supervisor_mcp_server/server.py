@@ -7,22 +7,32 @@ agent supervision platform with 10 core tools.
 """
 
 import asyncio
+import bisect
+import heapq
+import itertools
 import json
 import logging
+import re
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, asdict
-import uuid
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass, field, asdict
+from collections import Counter, OrderedDict, defaultdict
 import os
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 # FastMCP for robust MCP server implementation
 from fastmcp import FastMCP
 
 # Import integrated components
 from src.integrated_supervisor import IntegratedSupervisorAgent
 from src.monitoring.monitoring_engine import MonitoringEngine
-from src.error_handling.error_handling_system import SupervisorErrorHandlingSystem
+from src.error_handling.error_handling_system import SupervisorErrorHandlingSystem, RecoveryResult
 from src.reporting.integrated_reporting import IntegratedReportingSystem
 
 # Configure logging
@@ -37,6 +47,58 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Report time ranges are "<count><unit>", e.g. "15m", "1h", "24h", "7d"
+_TIME_RE = re.compile(r'^(\d+)([smhd])$')
+_TIME_UNIT = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+# Error signatures are the exception type name plus this many leading
+# characters of the message; remembered recovery decisions are capped
+_ERROR_SIGNATURE_CHARS = 64
+_ERROR_DECISION_CACHE_SIZE = 1024
+
+def _parse_time_range(time_range: str, default: timedelta) -> timedelta:
+    """Convert a time range string to a timedelta, or default if malformed"""
+    m = _TIME_RE.match(time_range)
+    if not m:
+        return default
+    return timedelta(seconds=int(m.group(1)) * _TIME_UNIT[m.group(2)])
+
+def _error_response(error: Union[Exception, str], timestamp: str) -> Dict[str, Any]:
+    """Standard failed-tool response"""
+    return {'success': False, 'error': str(error), 'timestamp': timestamp}
+
+def _not_initialized(timestamp: str) -> Dict[str, Any]:
+    """Response for tools called before the supervisor exists"""
+    return _error_response('Supervisor not initialized', timestamp)
+
+def _write_atomic(path: Path, data: bytes):
+    """Write data to a temp file beside path, then rename it into place"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+def _write_knowledge_base(path: Path, knowledge_base: Dict[str, Any]):
+    """Encode a knowledge base snapshot and write it atomically"""
+    # Entries hold caller-supplied data; anything JSON cannot represent
+    # is stored as its str() so one bad entry cannot block every save
+    if orjson is not None:
+        data = orjson.dumps(
+            knowledge_base,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    else:
+        data = json.dumps(knowledge_base, indent=2, default=str).encode('utf-8')
+    _write_atomic(path, data)
+
+def _new_id() -> str:
+    """Opaque random 128-bit id as 32 hex characters
+    
+    Ids are only compared and echoed back, so the dashed uuid4 form (and
+    the UUID object built to produce it) is not needed.
+    """
+    return os.urandom(16).hex()
+
 # Initialize MCP server
 mcp = FastMCP("Supervisor Agent")
 
@@ -54,6 +116,118 @@ class SupervisorConfig:
     confidence_threshold: float = 0.7
     max_retries: int = 3
     storage_path: str = "supervisor_data"
+    audit_batch_size: int = 64
+    audit_flush_interval: float = 0.25
+    kb_save_batch_size: int = 50
+    kb_save_interval: float = 0.5
+    # (exception type name, message prefix) pairs handled as benign without
+    # running the recovery pipeline; an empty prefix matches any message.
+    # Only the first 64 characters of a message are compared, so a longer
+    # prefix is cut to 64 characters
+    benign_error_signatures: Tuple[Tuple[str, str], ...] = ()
+
+@dataclass(slots=True)
+class SupervisorStats:
+    """Supervisor counters, bumped as plain slot attributes"""
+    total_supervised_agents: int = 0
+    total_interventions: int = 0
+    successful_recoveries: int = 0
+    escalated_issues: int = 0
+    audit_events_dropped: int = 0
+    start_time: datetime = field(default_factory=datetime.now)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Point-in-time copy of the counters for reports"""
+        return asdict(self)
+
+class SessionTable:
+    """Supervision sessions stored column-wise, one list per common field
+    
+    Rows are found through a session_id -> index map, and indexing the table
+    returns a SessionRow view so callers keep the session_data[...] style.
+    Scans over one field (interventions by agent) walk a single column
+    list, and per-status counts are kept current as rows change status.
+    Rarely set fields such as pause reasons, parameter
+    adjustments and rollback details go into a per-row extras dict.
+    """
+    
+    COLUMNS = ('session_id', 'agent_id', 'task_config', 'start_time', 'status',
+               'interventions', 'last_evaluation', 'last_monitoring_result')
+    __slots__ = ('columns', 'extras', '_rows', '_status_counts')
+    
+    def __init__(self):
+        self.columns: Dict[str, List[Any]] = {name: [] for name in self.COLUMNS}
+        self.extras: List[Dict[str, Any]] = []
+        self._rows: Dict[str, int] = {}
+        self._status_counts: Counter = Counter()
+    
+    def add(self, **fields) -> 'SessionRow':
+        """Append a session row and return a view of it"""
+        idx = len(self.extras)
+        fields.setdefault('interventions', [])
+        for name, column in self.columns.items():
+            column.append(fields.pop(name, None))
+        self.extras.append(fields)
+        self._rows[self.columns['session_id'][idx]] = idx
+        self._status_counts[self.columns['status'][idx]] += 1
+        return SessionRow(self, idx)
+    
+    def set_status(self, idx: int, status: str):
+        """Change a row's status, keeping the per-status counts current"""
+        statuses = self.columns['status']
+        self._status_counts[statuses[idx]] -= 1
+        self._status_counts[status] += 1
+        statuses[idx] = status
+    
+    def status_counts(self) -> Counter:
+        """Number of sessions per status"""
+        return self._status_counts
+    
+    def values(self):
+        return (SessionRow(self, idx) for idx in range(len(self.extras)))
+    
+    def __getitem__(self, session_id: str) -> 'SessionRow':
+        return SessionRow(self, self._rows[session_id])
+    
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._rows
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+
+class SessionRow:
+    """Dict-like view of one SessionTable row"""
+    
+    __slots__ = ('_table', '_idx')
+    
+    def __init__(self, table: SessionTable, idx: int):
+        self._table = table
+        self._idx = idx
+    
+    def __getitem__(self, key: str) -> Any:
+        column = self._table.columns.get(key)
+        if column is not None:
+            return column[self._idx]
+        return self._table.extras[self._idx][key]
+    
+    def __setitem__(self, key: str, value: Any):
+        if key == 'status':
+            self._table.set_status(self._idx, value)
+            return
+        column = self._table.columns.get(key)
+        if column is not None:
+            column[self._idx] = value
+        else:
+            self._table.extras[self._idx][key] = value
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._table.columns or key in self._table.extras[self._idx]
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
 
 class IntegratedSupervisorAgent:
     """
@@ -93,28 +267,63 @@ class IntegratedSupervisorAgent:
         
         # Agent supervision state
         self.supervised_agents = {}
-        self.active_sessions = {}
+        self.active_sessions = SessionTable()
         self.monitoring_rules = {}
         self.escalation_config = {}
         self.knowledge_base = self._load_knowledge_base()
+        # Entries per knowledge base section, kept current on every append
+        self.kb_entry_counts = {
+            key: len(value) for key, value in self.knowledge_base.items()
+            if isinstance(value, list)
+        }
+        
+        # Intervention records kept sorted by ISO timestamp, per agent and
+        # overall, as (timestamp, intervention_id, record) so audit queries
+        # can bisect a time range instead of scanning every session
+        self._interventions_by_agent: Dict[str, List[tuple]] = defaultdict(list)
+        self._interventions_global: List[tuple] = []
+        
+        # Recovery decisions keyed by exception signature, seeded from the
+        # configured benign signatures and learned from deterministic
+        # pipeline runs; least recently used entries are evicted
+        self._benign_signatures = tuple(
+            (type_name, prefix[:_ERROR_SIGNATURE_CHARS])
+            for type_name, prefix in config.benign_error_signatures
+        )
+        self._error_decisions: OrderedDict = OrderedDict()
+        
+        # Knowledge base updates mark it dirty; a background saver coalesces
+        # them into one write per kb_save_interval or kb_save_batch_size
+        self._kb_save_lock = asyncio.Lock()
+        self._kb_pending = 0
+        self._kb_batch_full = asyncio.Event()
+        self._kb_saver_task: Optional[asyncio.Task] = None
+        
+        # Audit events are queued by the tools and written in batches by a
+        # background flusher, started on first use inside the event loop
+        self._audit_queue: asyncio.Queue = asyncio.Queue(maxsize=10_000)
+        self._audit_flusher_task: Optional[asyncio.Task] = None
         
         # Statistics
-        self.stats = {
-            'total_supervised_agents': 0,
-            'total_interventions': 0,
-            'successful_recoveries': 0,
-            'escalated_issues': 0,
-            'start_time': datetime.now()
-        }
+        self.stats = SupervisorStats()
         
         logger.info("Integrated Supervisor Agent initialized successfully")
     
     def _load_knowledge_base(self) -> Dict[str, Any]:
-        """Load or initialize knowledge base"""
+        """Load or initialize knowledge base
+        
+        metadata['categories'] is held as a set in memory and stored as a
+        sorted list on disk.
+        """
         kb_file = self.storage_path / "knowledge_base.json"
         if kb_file.exists():
-            with open(kb_file, 'r') as f:
-                return json.load(f)
+            with open(kb_file, 'rb') as f:
+                data = f.read()
+            knowledge_base = orjson.loads(data) if orjson is not None else json.loads(data)
+            if 'metadata' in knowledge_base:
+                metadata = knowledge_base['metadata']
+                metadata['categories'] = set(metadata.get('categories', ()))
+            return knowledge_base
         
         return {
             'patterns': [],
@@ -124,11 +333,137 @@ class IntegratedSupervisorAgent:
             'intervention_strategies': []
         }
     
-    def _save_knowledge_base(self):
-        """Save knowledge base to disk"""
+    async def _save_knowledge_base(self):
+        """Save knowledge base to disk without blocking the event loop
+        
+        A shallow snapshot is taken on the loop: section lists and metadata
+        are copied, and entries are shared since they are never modified
+        after they are appended. Encoding and the file write then run in
+        the executor, one save at a time.
+        """
         kb_file = self.storage_path / "knowledge_base.json"
-        with open(kb_file, 'w') as f:
-            json.dump(self.knowledge_base, f, indent=2)
+        snapshot = {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in self.knowledge_base.items()
+        }
+        if 'metadata' in snapshot:
+            snapshot['metadata'] = {
+                **snapshot['metadata'],
+                'categories': sorted(snapshot['metadata']['categories'])
+            }
+        async with self._kb_save_lock:
+            await asyncio.get_running_loop().run_in_executor(None, _write_knowledge_base, kb_file, snapshot)
+    
+    def schedule_knowledge_base_save(self):
+        """Record a knowledge base change for the background saver"""
+        self._kb_pending += 1
+        if self._kb_pending >= self.config.kb_save_batch_size:
+            self._kb_batch_full.set()
+        if self._kb_saver_task is None or self._kb_saver_task.done():
+            self._kb_saver_task = asyncio.create_task(self._kb_saver())
+    
+    async def _kb_saver(self):
+        """Save once per kb_save_interval, or sooner when a batch fills,
+        until no changes are pending"""
+        while self._kb_pending:
+            try:
+                await asyncio.wait_for(self._kb_batch_full.wait(), self.config.kb_save_interval)
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.flush_knowledge_base()
+            except Exception as e:
+                logger.error(f"Failed to save knowledge base: {e}")
+    
+    async def flush_knowledge_base(self):
+        """Write pending knowledge base changes now; no-op when clean"""
+        if not self._kb_pending:
+            return
+        self._kb_pending = 0
+        self._kb_batch_full.clear()
+        await self._save_knowledge_base()
+    
+    def record_intervention(self, record: Dict[str, Any]):
+        """Add an intervention record to the timestamp indexes"""
+        entry = (record['timestamp'], record['intervention_id'], record)
+        bisect.insort(self._interventions_by_agent[record['agent_id']], entry)
+        bisect.insort(self._interventions_global, entry)
+    
+    def interventions_between(self, agent_id: Optional[str] = None,
+                              start_time: Optional[str] = None,
+                              end_time: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Intervention records in [start_time, end_time], oldest first"""
+        if agent_id:
+            index = self._interventions_by_agent.get(agent_id, [])
+        else:
+            index = self._interventions_global
+        # Normalise the bounds so they compare lexicographically with the
+        # naive isoformat() timestamps stored in the index
+        lo = 0
+        hi = len(index)
+        if start_time:
+            start = datetime.fromisoformat(start_time).isoformat()
+            lo = bisect.bisect_left(index, (start,))
+        if end_time:
+            # U+FFFF sorts after any intervention id, so equal timestamps are kept
+            end = datetime.fromisoformat(end_time).isoformat()
+            hi = bisect.bisect_right(index, (end, '\uffff'))
+        return [entry[2] for entry in index[lo:hi]]
+    
+    def queue_audit_event(self, **event):
+        """Queue an audit event for the background flusher; never blocks
+        
+        The event is stamped here, not when the flusher writes it, so audit
+        times reflect when the tool ran.
+        """
+        if not self.config.reporting_enabled:
+            return
+        event.setdefault('timestamp', datetime.now().isoformat())
+        if self._audit_flusher_task is None or self._audit_flusher_task.done():
+            self._audit_flusher_task = asyncio.create_task(self._audit_flusher())
+        try:
+            self._audit_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.stats.audit_events_dropped += 1
+            logger.warning(f"Audit queue full, dropping event {event.get('event_type')}")
+    
+    async def _audit_flusher(self):
+        """Write queued audit events in batches of up to audit_batch_size,
+        waiting at most audit_flush_interval for a batch to fill"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._audit_queue.get()]
+            deadline = loop.time() + self.config.audit_flush_interval
+            while len(batch) < self.config.audit_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._audit_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                await self.reporting_system.log_audit_events_bulk(batch)
+            except Exception as e:
+                logger.error(f"Failed to write {len(batch)} audit events: {e}")
+            finally:
+                for _ in batch:
+                    self._audit_queue.task_done()
+    
+    async def drain_audit_events(self):
+        """Wait until every queued audit event is written, leaving the flusher running"""
+        if self._audit_flusher_task is not None and not self._audit_flusher_task.done():
+            await self._audit_queue.join()
+    
+    async def flush_audit_events(self):
+        """Wait until every queued audit event is written, then stop the flusher"""
+        if self._audit_flusher_task is None:
+            return
+        if not self._audit_flusher_task.done():
+            await self.drain_audit_events()
+            self._audit_flusher_task.cancel()
+        self._audit_flusher_task = None
     
     async def start_monitoring_agent(
         self, 
@@ -137,21 +472,22 @@ class IntegratedSupervisorAgent:
     ) -> Dict[str, Any]:
         """Start monitoring for a specific agent"""
         
+        # One clock read shared by every timestamp in this call
+        now_iso = datetime.now().isoformat()
+        
         logger.info(f"Starting monitoring for agent {agent_id}")
         
         # Create session
-        session_id = str(uuid.uuid4())
-        session_data = {
-            'session_id': session_id,
-            'agent_id': agent_id,
-            'task_config': task_config,
-            'start_time': datetime.now().isoformat(),
-            'status': 'active'
-        }
-        
-        self.active_sessions[session_id] = session_data
+        session_id = _new_id()
+        session_data = self.active_sessions.add(
+            session_id=session_id,
+            agent_id=agent_id,
+            task_config=task_config,
+            start_time=now_iso,
+            status='active'
+        )
         self.supervised_agents[agent_id] = session_id
-        self.stats['total_supervised_agents'] += 1
+        self.stats.total_supervised_agents += 1
         
         # Start monitoring if enabled
         if self.config.monitoring_enabled:
@@ -160,7 +496,7 @@ class IntegratedSupervisorAgent:
         
         # Log to audit system
         if self.config.reporting_enabled:
-            await self.reporting_system.log_audit_event(
+            self.queue_audit_event(
                 event_type="agent_monitoring_started",
                 source="supervisor",
                 message=f"Started monitoring agent {agent_id}",
@@ -172,7 +508,7 @@ class IntegratedSupervisorAgent:
             'session_id': session_id,
             'agent_id': agent_id,
             'monitoring_active': self.config.monitoring_enabled,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now_iso
         }
     
     async def evaluate_agent_execution(
@@ -182,14 +518,16 @@ class IntegratedSupervisorAgent:
     ) -> Dict[str, Any]:
         """Evaluate agent execution and provide supervision"""
         
-        if agent_id not in self.supervised_agents:
+        # One clock read shared by every timestamp in this call
+        now_iso = datetime.now().isoformat()
+        
+        session_id = self.supervised_agents.get(agent_id)
+        if session_id is None:
             return {
                 'success': False,
                 'error': f'Agent {agent_id} is not being supervised'
             }
         
-        session_id = self.supervised_agents[agent_id]
-        
         # Get monitoring evaluation
         monitoring_result = None
         if self.config.monitoring_enabled:
@@ -210,30 +548,54 @@ class IntegratedSupervisorAgent:
             
             # Check for errors
             if monitoring_result.errors:
-                critical_errors = [e for e in monitoring_result.errors if e.get('severity') == 'critical']
-                if critical_errors:
+                critical_count = sum(1 for e in monitoring_result.errors if e.get('severity') == 'critical')
+                if critical_count:
                     interventions.append({
                         'type': 'critical_error',
                         'severity': 'error',
-                        'message': f'Critical errors detected: {len(critical_errors)}',
+                        'message': f'Critical errors detected: {critical_count}',
                         'recommendation': 'Immediate intervention required'
                     })
         
         # Update session
         session_data = self.active_sessions[session_id]
-        session_data['last_evaluation'] = datetime.now().isoformat()
-        session_data['last_monitoring_result'] = asdict(monitoring_result) if monitoring_result else None
+        session_data['last_evaluation'] = now_iso
+        # Convert once; the session and the response share the same dict
+        mr_dict = monitoring_result.to_dict() if monitoring_result else None
+        session_data['last_monitoring_result'] = mr_dict
         session_data['interventions'] = interventions
         
         return {
             'success': True,
             'session_id': session_id,
-            'monitoring_result': asdict(monitoring_result) if monitoring_result else None,
+            'monitoring_result': mr_dict,
             'interventions': interventions,
             'needs_intervention': len(interventions) > 0,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now_iso
         }
     
+    def _classify_error_sync(self, signature: Tuple[str, str]) -> Optional[str]:
+        """Known recovery result for an exception signature, or None to run
+        the full error handling pipeline"""
+        decision = self._error_decisions.get(signature)
+        if decision is not None:
+            self._error_decisions.move_to_end(signature)
+            return decision
+        
+        type_name, msg_prefix = signature
+        for benign_type, benign_prefix in self._benign_signatures:
+            if type_name == benign_type and msg_prefix.startswith(benign_prefix):
+                self._remember_error_decision(signature, RecoveryResult.SUCCESS.value)
+                return RecoveryResult.SUCCESS.value
+        return None
+    
+    def _remember_error_decision(self, signature: Tuple[str, str], decision: str):
+        """Memoize a recovery result, evicting the least recently used"""
+        self._error_decisions[signature] = decision
+        self._error_decisions.move_to_end(signature)
+        if len(self._error_decisions) > _ERROR_DECISION_CACHE_SIZE:
+            self._error_decisions.popitem(last=False)
+    
     async def handle_agent_error(
         self,
         agent_id: str,
@@ -250,6 +612,26 @@ class IntegratedSupervisorAgent:
                 'error': 'Error handling is disabled'
             }
         
+        # Known signatures skip history, snapshots and escalation and get
+        # the same result shape as the pipeline, without history or snapshot
+        signature = (type(error).__name__, str(error)[:_ERROR_SIGNATURE_CHARS])
+        decision = self._classify_error_sync(signature)
+        if decision is not None:
+            success = decision == RecoveryResult.SUCCESS.value
+            if success:
+                self.stats.successful_recoveries += 1
+            else:
+                self.stats.escalated_issues += 1
+            return {
+                'success': success,
+                'recovery_result': decision,
+                'error_handled': True,
+                'history_id': None,
+                'snapshot_id': None,
+                'timestamp': datetime.now().isoformat(),
+                'error_id': _new_id()
+            }
+        
         # Use error handling system
         recovery_result = await self.error_handling.handle_error(
             error=error,
@@ -259,11 +641,18 @@ class IntegratedSupervisorAgent:
             state_data=state_data
         )
         
+        # Without state data or a recovery callback the outcome depends only
+        # on the error, so it is remembered; escalations are not, since each
+        # one has to open its own ticket
+        if (state_data is None and recovery_result.get('error_handled') and
+                recovery_result.get('recovery_result') != RecoveryResult.REQUIRES_ESCALATION.value):
+            self._remember_error_decision(signature, recovery_result['recovery_result'])
+        
         # Update statistics
         if recovery_result.get('success'):
-            self.stats['successful_recoveries'] += 1
+            self.stats.successful_recoveries += 1
         else:
-            self.stats['escalated_issues'] += 1
+            self.stats.escalated_issues += 1
         
         return recovery_result
 
@@ -274,6 +663,43 @@ def initialize_supervisor():
     supervisor_agent = IntegratedSupervisorAgent(config)
     return supervisor_agent
 
+def _collect_agent_detail(aid: str):
+    """Collect one agent's report detail and alerts as (detail, alerts)
+
+    Every lookup here is an in-memory dict read, so the report calls this
+    in a plain loop; there is no I/O to overlap.
+    """
+    session_id = supervisor_agent.supervised_agents.get(aid)
+    if not session_id or session_id not in supervisor_agent.active_sessions:
+        return None, []
+    
+    session_data = supervisor_agent.active_sessions[session_id]
+    interventions = session_data.get('interventions', [])
+    
+    detail = {
+        'session_id': session_id,
+        'start_time': session_data.get('start_time'),
+        'status': session_data.get('status'),
+        'last_evaluation': session_data.get('last_evaluation'),
+        'interventions': interventions,
+        'monitoring_result': session_data.get('last_monitoring_result')
+    }
+    
+    # Add any active alerts
+    alerts = [
+        {
+            'agent_id': aid,
+            'type': intervention['type'],
+            'severity': intervention['severity'],
+            'message': intervention['message'],
+            'recommendation': intervention.get('recommendation')
+        }
+        for intervention in interventions
+        if intervention.get('severity') in ['error', 'critical']
+    ]
+    
+    return detail, alerts
+
 # MCP Tools Implementation
 
 @mcp.tool()
@@ -289,20 +715,19 @@ async def monitor_agent(agent_id: str, task_config: dict) -> dict:
         dict: Monitoring session information and status
     """
     
+    # One clock read shared by every timestamp in this call
+    now_iso = datetime.now().isoformat()
+    
     global supervisor_agent
     if not supervisor_agent:
-        supervisor_agent = initialize_supervisor()
+        return _not_initialized(now_iso)
     
     try:
         result = await supervisor_agent.start_monitoring_agent(agent_id, task_config)
         return result
     except Exception as e:
         logger.error(f"Error in monitor_agent: {e}")
-        return {
-            'success': False,
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }
+        return _error_response(e, now_iso)
 
 @mcp.tool()
 async def set_monitoring_rules(agent_id: str, rules: dict) -> dict:
@@ -317,38 +742,45 @@ async def set_monitoring_rules(agent_id: str, rules: dict) -> dict:
         dict: Configuration status and applied rules
     """
     
+    # One clock read shared by every timestamp in this call
+    now_iso = datetime.now().isoformat()
+    
     global supervisor_agent
     if not supervisor_agent:
-        supervisor_agent = initialize_supervisor()
+        return _not_initialized(now_iso)
     
     try:
         # Store monitoring rules
         supervisor_agent.monitoring_rules[agent_id] = {
             **rules,
-            'configured_at': datetime.now().isoformat(),
+            'configured_at': now_iso,
             'configured_by': 'supervisor'
         }
         
         # Apply rules to monitoring engine if agent is being monitored
-        if agent_id in supervisor_agent.supervised_agents and supervisor_agent.config.monitoring_enabled:
-            # Update monitoring engine configuration
-            supervisor_agent.monitoring_engine.config.update(rules)
+        active_monitoring = agent_id in supervisor_agent.supervised_agents
+        if active_monitoring and supervisor_agent.config.monitoring_enabled:
+            # Update monitoring engine configuration, writing only the rules
+            # whose values differ from what the engine already holds
+            engine_config = supervisor_agent.monitoring_engine.config
+            changed = {
+                key: value for key, value in rules.items()
+                if key not in engine_config or engine_config[key] != value
+            }
+            if changed:
+                engine_config.update(changed)
         
         return {
             'success': True,
             'agent_id': agent_id,
             'rules_applied': rules,
-            'active_monitoring': agent_id in supervisor_agent.supervised_agents,
-            'timestamp': datetime.now().isoformat()
+            'active_monitoring': active_monitoring,
+            'timestamp': now_iso
         }
     
     except Exception as e:
         logger.error(f"Error in set_monitoring_rules: {e}")
-        return {
-            'success': False,
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }
+        return _error_response(e, now_iso)
 
 @mcp.tool()
 async def get_supervision_report(agent_id: str = None, time_range: str = "1h") -> dict:
@@ -363,40 +795,33 @@ async def get_supervision_report(agent_id: str = None, time_range: str = "1h") -
         dict: Comprehensive supervision report with metrics, alerts, and recommendations
     """
     
+    # One clock read shared by every timestamp in this call
+    now = datetime.now()
+    now_iso = now.isoformat()
+    
     global supervisor_agent
     if not supervisor_agent:
-        return {
-            'success': False,
-            'error': 'Supervisor not initialized',
-            'timestamp': datetime.now().isoformat()
-        }
+        return _not_initialized(now_iso)
     
     try:
         # Parse time range
-        time_delta_map = {
-            '1h': timedelta(hours=1),
-            '24h': timedelta(hours=24),
-            '7d': timedelta(days=7),
-            '30d': timedelta(days=30)
-        }
-        
-        time_delta = time_delta_map.get(time_range, timedelta(hours=1))
-        start_time = datetime.now() - time_delta
+        time_delta = _parse_time_range(time_range, timedelta(hours=1))
+        start_time = now - time_delta
         
         # Collect data for specific agent or all agents
         target_agents = [agent_id] if agent_id else list(supervisor_agent.supervised_agents.keys())
         
         report_data = {
-            'report_id': str(uuid.uuid4()),
-            'generated_at': datetime.now().isoformat(),
+            'report_id': _new_id(),
+            'generated_at': now_iso,
             'time_range': time_range,
             'agents_included': target_agents,
             'summary': {
                 'total_agents': len(target_agents),
                 'active_sessions': len(supervisor_agent.active_sessions),
-                'total_interventions': supervisor_agent.stats['total_interventions'],
-                'successful_recoveries': supervisor_agent.stats['successful_recoveries'],
-                'escalated_issues': supervisor_agent.stats['escalated_issues']
+                'total_interventions': supervisor_agent.stats.total_interventions,
+                'successful_recoveries': supervisor_agent.stats.successful_recoveries,
+                'escalated_issues': supervisor_agent.stats.escalated_issues
             },
             'agent_details': {},
             'alerts': [],
@@ -405,30 +830,10 @@ async def get_supervision_report(agent_id: str = None, time_range: str = "1h") -
         
         # Collect details for each agent
         for aid in target_agents:
-            session_id = supervisor_agent.supervised_agents.get(aid)
-            if session_id and session_id in supervisor_agent.active_sessions:
-                session_data = supervisor_agent.active_sessions[session_id]
-                
-                report_data['agent_details'][aid] = {
-                    'session_id': session_id,
-                    'start_time': session_data.get('start_time'),
-                    'status': session_data.get('status'),
-                    'last_evaluation': session_data.get('last_evaluation'),
-                    'interventions': session_data.get('interventions', []),
-                    'monitoring_result': session_data.get('last_monitoring_result')
-                }
-                
-                # Add any active alerts
-                interventions = session_data.get('interventions', [])
-                for intervention in interventions:
-                    if intervention.get('severity') in ['error', 'critical']:
-                        report_data['alerts'].append({
-                            'agent_id': aid,
-                            'type': intervention['type'],
-                            'severity': intervention['severity'],
-                            'message': intervention['message'],
-                            'recommendation': intervention.get('recommendation')
-                        })
+            detail, alerts = _collect_agent_detail(aid)
+            if detail is not None:
+                report_data['agent_details'][aid] = detail
+                report_data['alerts'].extend(alerts)
         
         # Generate system-wide recommendations
         if report_data['summary']['escalated_issues'] > 0:
@@ -443,7 +848,7 @@ async def get_supervision_report(agent_id: str = None, time_range: str = "1h") -
         
         # Log report generation
         if supervisor_agent.config.reporting_enabled:
-            await supervisor_agent.reporting_system.log_audit_event(
+            supervisor_agent.queue_audit_event(
                 event_type="supervision_report_generated",
                 source="supervisor",
                 message=f"Generated supervision report for {len(target_agents)} agents",
@@ -453,16 +858,84 @@ async def get_supervision_report(agent_id: str = None, time_range: str = "1h") -
         return {
             'success': True,
             'report': report_data,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now_iso
         }
     
     except Exception as e:
         logger.error(f"Error in get_supervision_report: {e}")
-        return {
-            'success': False,
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }
+        return _error_response(e, now_iso)
+
+# Default escalation configuration; read-only and built once, with tuples
+# so configs merged from it never share a mutable list
+_DEFAULT_ESCALATION_CONFIG = MappingProxyType({
+    'confidence_threshold': 0.5,
+    'error_count_threshold': 3,
+    'quality_threshold': 0.6,
+    'escalation_contacts': (),
+    'escalation_procedures': ('notify', 'pause', 'manual_review'),
+    'auto_escalation_enabled': True,
+    'escalation_timeout': 3600  # 1 hour
+})
+
+# Knowledge base update type -> section it is appended to
+_KB_SECTIONS = {
+    'pattern': 'patterns',
+    'procedure': 'procedures',
+    'best_practice': 'best_practices',
+    'insight': 'insights'
+}
+
+def _intervene_pause(agent_id: str, session_data: SessionRow, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Pause agent execution"""
+    session_data['status'] = 'paused'
+    session_data['pause_reason'] = parameters.get('reason', 'Manual intervention')
+    return {
+        'success': True,
+        'message': f'Agent {agent_id} paused successfully',
+        'action': 'paused'
+    }
+
+def _intervene_redirect(agent_id: str, session_data: SessionRow, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Redirect agent to new task or approach"""
+    new_objective = parameters.get('new_objective')
+    if not new_objective:
+        return {'success': False, 'message': 'Redirect requires new_objective'}
+    session_data['redirected_objective'] = new_objective
+    return {
+        'success': True,
+        'message': f'Agent {agent_id} redirected to new objective',
+        'action': 'redirected',
+        'new_objective': new_objective
+    }
+
+def _intervene_adjust(agent_id: str, session_data: SessionRow, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Adjust agent parameters"""
+    adjustments = parameters.get('adjustments', {})
+    session_data['parameter_adjustments'] = adjustments
+    return {
+        'success': True,
+        'message': f'Agent {agent_id} parameters adjusted',
+        'action': 'adjusted',
+        'adjustments': adjustments
+    }
+
+def _intervene_terminate(agent_id: str, session_data: SessionRow, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Terminate agent execution"""
+    session_data['status'] = 'terminated'
+    session_data['termination_reason'] = parameters.get('reason', 'Manual termination')
+    return {
+        'success': True,
+        'message': f'Agent {agent_id} terminated',
+        'action': 'terminated'
+    }
+
+# Intervention type -> handler(agent_id, session_data, parameters)
+_INTERVENTION_HANDLERS = {
+    'pause': _intervene_pause,
+    'redirect': _intervene_redirect,
+    'adjust': _intervene_adjust,
+    'terminate': _intervene_terminate
+}
 
 @mcp.tool()
 async def intervene_task(agent_id: str, intervention_type: str, parameters: dict = None) -> dict:
@@ -478,93 +951,54 @@ async def intervene_task(agent_id: str, intervention_type: str, parameters: dict
         dict: Intervention result and agent response
     """
     
+    # One clock read shared by every timestamp in this call
+    now_iso = datetime.now().isoformat()
+    
     global supervisor_agent
     if not supervisor_agent:
-        return {
-            'success': False,
-            'error': 'Supervisor not initialized',
-            'timestamp': datetime.now().isoformat()
-        }
+        return _not_initialized(now_iso)
     
     try:
-        if agent_id not in supervisor_agent.supervised_agents:
+        session_id = supervisor_agent.supervised_agents.get(agent_id)
+        if session_id is None:
             return {
                 'success': False,
                 'error': f'Agent {agent_id} is not being supervised',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso
             }
         
-        session_id = supervisor_agent.supervised_agents[agent_id]
         session_data = supervisor_agent.active_sessions[session_id]
         
-        intervention_id = str(uuid.uuid4())
+        intervention_id = _new_id()
         intervention_record = {
             'intervention_id': intervention_id,
             'agent_id': agent_id,
             'session_id': session_id,
             'type': intervention_type,
             'parameters': parameters or {},
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso,
             'initiated_by': 'supervisor'
         }
         
         # Execute intervention based on type
-        result = {'success': False, 'message': 'Unknown intervention type'}
-        
-        if intervention_type == 'pause':
-            # Pause agent execution
-            session_data['status'] = 'paused'
-            session_data['pause_reason'] = parameters.get('reason', 'Manual intervention')
-            result = {
-                'success': True,
-                'message': f'Agent {agent_id} paused successfully',
-                'action': 'paused'
-            }
-        
-        elif intervention_type == 'redirect':
-            # Redirect agent to new task or approach
-            new_objective = parameters.get('new_objective')
-            if new_objective:
-                session_data['redirected_objective'] = new_objective
-                result = {
-                    'success': True,
-                    'message': f'Agent {agent_id} redirected to new objective',
-                    'action': 'redirected',
-                    'new_objective': new_objective
-                }
-        
-        elif intervention_type == 'adjust':
-            # Adjust agent parameters
-            adjustments = parameters.get('adjustments', {})
-            session_data['parameter_adjustments'] = adjustments
-            result = {
-                'success': True,
-                'message': f'Agent {agent_id} parameters adjusted',
-                'action': 'adjusted',
-                'adjustments': adjustments
-            }
-        
-        elif intervention_type == 'terminate':
-            # Terminate agent execution
-            session_data['status'] = 'terminated'
-            session_data['termination_reason'] = parameters.get('reason', 'Manual termination')
-            result = {
-                'success': True,
-                'message': f'Agent {agent_id} terminated',
-                'action': 'terminated'
-            }
+        handler = _INTERVENTION_HANDLERS.get(intervention_type)
+        if handler:
+            result = handler(agent_id, session_data, parameters or {})
+        else:
+            result = {'success': False, 'message': 'Unknown intervention type'}
         
         # Update statistics and log intervention
-        supervisor_agent.stats['total_interventions'] += 1
+        supervisor_agent.stats.total_interventions += 1
         
         # Store intervention record
         if 'interventions' not in session_data:
             session_data['interventions'] = []
         session_data['interventions'].append(intervention_record)
+        supervisor_agent.record_intervention(intervention_record)
         
         # Log to audit system
         if supervisor_agent.config.reporting_enabled:
-            await supervisor_agent.reporting_system.log_audit_event(
+            supervisor_agent.queue_audit_event(
                 event_type="agent_intervention",
                 source="supervisor",
                 message=f"Intervention executed on agent {agent_id}: {intervention_type}",
@@ -575,16 +1009,12 @@ async def intervene_task(agent_id: str, intervention_type: str, parameters: dict
             'success': result['success'],
             'intervention_id': intervention_id,
             'result': result,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now_iso
         }
     
     except Exception as e:
         logger.error(f"Error in intervene_task: {e}")
-        return {
-            'success': False,
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }
+        return _error_response(e, now_iso)
 
 @mcp.tool()
 async def validate_output(agent_id: str, output_data: dict, validation_criteria: dict = None) -> dict:
@@ -600,16 +1030,15 @@ async def validate_output(agent_id: str, output_data: dict, validation_criteria:
         dict: Validation results with scores, issues, and recommendations
     """
     
+    # One clock read shared by every timestamp in this call
+    now_iso = datetime.now().isoformat()
+    
     global supervisor_agent
     if not supervisor_agent:
-        return {
-            'success': False,
-            'error': 'Supervisor not initialized',
-            'timestamp': datetime.now().isoformat()
-        }
+        return _not_initialized(now_iso)
     
     try:
-        validation_id = str(uuid.uuid4())
+        validation_id = _new_id()
         
         # Default validation criteria
         default_criteria = {
@@ -625,7 +1054,7 @@ async def validate_output(agent_id: str, output_data: dict, validation_criteria:
         validation_result = {
             'validation_id': validation_id,
             'agent_id': agent_id,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso,
             'criteria_applied': criteria,
             'scores': {},
             'issues': [],
@@ -634,8 +1063,11 @@ async def validate_output(agent_id: str, output_data: dict, validation_criteria:
         }
         
         if supervisor_agent.config.monitoring_enabled:
-            # Use quality monitor for detailed validation
-            quality_result = supervisor_agent.monitoring_engine.quality_monitor.evaluate_output_quality(
+            # Use quality monitor for detailed validation, in the default
+            # executor so scoring a large output does not stall other tools
+            quality_result = await asyncio.get_running_loop().run_in_executor(
+                None,
+                supervisor_agent.monitoring_engine.quality_monitor.evaluate_output_quality,
                 [output_data],
                 criteria
             )
@@ -678,7 +1110,7 @@ async def validate_output(agent_id: str, output_data: dict, validation_criteria:
         
         # Log validation
         if supervisor_agent.config.reporting_enabled:
-            await supervisor_agent.reporting_system.log_audit_event(
+            supervisor_agent.queue_audit_event(
                 event_type="output_validation",
                 source="supervisor",
                 message=f"Output validation completed for agent {agent_id}",
@@ -692,19 +1124,15 @@ async def validate_output(agent_id: str, output_data: dict, validation_criteria:
         return {
             'success': True,
             'validation': validation_result,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now_iso
         }
     
     except Exception as e:
         logger.error(f"Error in validate_output: {e}")
-        return {
-            'success': False,
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }
+        return _error_response(e, now_iso)
 
 @mcp.tool()
-async def get_audit_log(agent_id: str = None, start_time: str = None, end_time: str = None, event_type: str = None) -> dict:
+async def get_audit_log(agent_id: str = None, start_time: str = None, end_time: str = None, event_type: str = None, limit: int = 1000) -> dict:
     """
     Retrieve audit log entries for supervision activities.
     
@@ -713,18 +1141,18 @@ async def get_audit_log(agent_id: str = None, start_time: str = None, end_time:
         start_time: Optional start time filter (ISO format)
         end_time: Optional end time filter (ISO format)
         event_type: Optional event type filter
+        limit: Maximum number of entries returned, newest first
     
     Returns:
         dict: Audit log entries matching the criteria
     """
     
+    # One clock read shared by every timestamp in this call
+    now_iso = datetime.now().isoformat()
+    
     global supervisor_agent
     if not supervisor_agent:
-        return {
-            'success': False,
-            'error': 'Supervisor not initialized',
-            'timestamp': datetime.now().isoformat()
-        }
+        return _not_initialized(now_iso)
     
     try:
         # Build filters
@@ -738,65 +1166,48 @@ async def get_audit_log(agent_id: str = None, start_time: str = None, end_time:
         if event_type:
             filters['event_type'] = event_type
         
-        # Retrieve audit entries
-        audit_entries = []
+        # Both sources yield newest first, so they are merged rather than
+        # concatenated and re-sorted, stopping once limit entries are taken
+        sources = []
         
         if supervisor_agent.config.reporting_enabled:
-            # Get entries from reporting system
-            entries = await supervisor_agent.reporting_system.get_audit_entries(filters)
-            audit_entries.extend(entries)
-        
-        # Add session-based entries
-        for session_id, session_data in supervisor_agent.active_sessions.items():
-            session_agent_id = session_data.get('agent_id')
-            
-            # Apply agent filter
-            if agent_id and session_agent_id != agent_id:
-                continue
+            # Events still waiting in the audit queue would be missed
+            await supervisor_agent.drain_audit_events()
             
-            # Add session events
-            if 'interventions' in session_data:
-                for intervention in session_data['interventions']:
-                    intervention_time = datetime.fromisoformat(intervention['timestamp'])
-                    
-                    # Apply time filters
-                    if start_time and intervention_time < datetime.fromisoformat(start_time):
-                        continue
-                    if end_time and intervention_time > datetime.fromisoformat(end_time):
-                        continue
-                    
-                    # Apply event type filter
-                    if event_type and intervention['type'] != event_type:
-                        continue
-                    
-                    audit_entries.append({
-                        'entry_id': intervention.get('intervention_id', str(uuid.uuid4())),
-                        'timestamp': intervention['timestamp'],
-                        'event_type': 'intervention',
-                        'agent_id': session_agent_id,
-                        'session_id': session_id,
-                        'data': intervention,
-                        'source': 'supervisor'
-                    })
+            # Get entries from reporting system
+            sources.append(await supervisor_agent.reporting_system.get_audit_entries(filters, limit))
+        
+        # Add supervisor interventions from the time-range index
+        interventions = supervisor_agent.interventions_between(agent_id, start_time, end_time)
+        sources.append(
+            {
+                'entry_id': intervention['intervention_id'],
+                'timestamp': intervention['timestamp'],
+                'event_type': 'intervention',
+                'agent_id': intervention['agent_id'],
+                'session_id': intervention['session_id'],
+                'data': intervention,
+                'source': 'supervisor'
+            }
+            for intervention in reversed(interventions)
+            # Apply event type filter
+            if not event_type or intervention['type'] == event_type
+        )
         
-        # Sort by timestamp
-        audit_entries.sort(key=lambda x: x['timestamp'], reverse=True)
+        merged = heapq.merge(*sources, key=lambda x: x['timestamp'], reverse=True)
+        audit_entries = list(itertools.islice(merged, limit))
         
         return {
             'success': True,
             'filters_applied': filters,
             'entry_count': len(audit_entries),
             'entries': audit_entries,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now_iso
         }
     
     except Exception as e:
         logger.error(f"Error in get_audit_log: {e}")
-        return {
-            'success': False,
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }
+        return _error_response(e, now_iso)
 
 @mcp.tool()
 async def configure_escalation(agent_id: str, escalation_config: dict) -> dict:
@@ -811,29 +1222,17 @@ async def configure_escalation(agent_id: str, escalation_config: dict) -> dict:
         dict: Configuration status and escalation setup
     """
     
+    # One clock read shared by every timestamp in this call
+    now_iso = datetime.now().isoformat()
+    
     global supervisor_agent
     if not supervisor_agent:
-        return {
-            'success': False,
-            'error': 'Supervisor not initialized',
-            'timestamp': datetime.now().isoformat()
-        }
+        return _not_initialized(now_iso)
     
     try:
-        # Default escalation configuration
-        default_config = {
-            'confidence_threshold': 0.5,
-            'error_count_threshold': 3,
-            'quality_threshold': 0.6,
-            'escalation_contacts': [],
-            'escalation_procedures': ['notify', 'pause', 'manual_review'],
-            'auto_escalation_enabled': True,
-            'escalation_timeout': 3600  # 1 hour
-        }
-        
         # Merge with provided configuration
-        final_config = {**default_config, **escalation_config}
-        final_config['configured_at'] = datetime.now().isoformat()
+        final_config = {**_DEFAULT_ESCALATION_CONFIG, **escalation_config}
+        final_config['configured_at'] = now_iso
         final_config['configured_by'] = 'supervisor'
         
         # Store escalation configuration
@@ -849,7 +1248,7 @@ async def configure_escalation(agent_id: str, escalation_config: dict) -> dict:
         
         # Log configuration
         if supervisor_agent.config.reporting_enabled:
-            await supervisor_agent.reporting_system.log_audit_event(
+            supervisor_agent.queue_audit_event(
                 event_type="escalation_configured",
                 source="supervisor",
                 message=f"Escalation configured for agent {agent_id}",
@@ -864,16 +1263,12 @@ async def configure_escalation(agent_id: str, escalation_config: dict) -> dict:
             'agent_id': agent_id,
             'escalation_config': final_config,
             'auto_escalation_enabled': final_config['auto_escalation_enabled'],
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now_iso
         }
     
     except Exception as e:
         logger.error(f"Error in configure_escalation: {e}")
-        return {
-            'success': False,
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }
+        return _error_response(e, now_iso)
 
 @mcp.tool()
 async def knowledge_base_update(update_type: str, data: dict, category: str = "general") -> dict:
@@ -889,16 +1284,15 @@ async def knowledge_base_update(update_type: str, data: dict, category: str = "g
         dict: Update status and knowledge base statistics
     """
     
+    # One clock read shared by every timestamp in this call
+    now_iso = datetime.now().isoformat()
+    
     global supervisor_agent
     if not supervisor_agent:
-        return {
-            'success': False,
-            'error': 'Supervisor not initialized',
-            'timestamp': datetime.now().isoformat()
-        }
+        return _not_initialized(now_iso)
     
     try:
-        update_id = str(uuid.uuid4())
+        update_id = _new_id()
         
         # Prepare update entry
         update_entry = {
@@ -906,57 +1300,33 @@ async def knowledge_base_update(update_type: str, data: dict, category: str = "g
             'type': update_type,
             'category': category,
             'data': data,
-            'created_at': datetime.now().isoformat(),
+            'created_at': now_iso,
             'created_by': 'supervisor'
         }
         
-        # Add to appropriate knowledge base section
-        if update_type == 'pattern':
-            if 'patterns' not in supervisor_agent.knowledge_base:
-                supervisor_agent.knowledge_base['patterns'] = []
-            supervisor_agent.knowledge_base['patterns'].append(update_entry)
-        
-        elif update_type == 'procedure':
-            if 'procedures' not in supervisor_agent.knowledge_base:
-                supervisor_agent.knowledge_base['procedures'] = []
-            supervisor_agent.knowledge_base['procedures'].append(update_entry)
-        
-        elif update_type == 'best_practice':
-            if 'best_practices' not in supervisor_agent.knowledge_base:
-                supervisor_agent.knowledge_base['best_practices'] = []
-            supervisor_agent.knowledge_base['best_practices'].append(update_entry)
-        
-        elif update_type == 'insight':
-            if 'insights' not in supervisor_agent.knowledge_base:
-                supervisor_agent.knowledge_base['insights'] = []
-            supervisor_agent.knowledge_base['insights'].append(update_entry)
-        
-        else:
-            # Generic category
-            if update_type not in supervisor_agent.knowledge_base:
-                supervisor_agent.knowledge_base[update_type] = []
-            supervisor_agent.knowledge_base[update_type].append(update_entry)
+        # Add to appropriate knowledge base section; unknown types get a
+        # section of their own
+        section = _KB_SECTIONS.get(update_type, update_type)
+        supervisor_agent.knowledge_base.setdefault(section, []).append(update_entry)
+        entry_counts = supervisor_agent.kb_entry_counts
+        entry_counts[section] = entry_counts.get(section, 0) + 1
         
         # Update metadata
-        if 'metadata' not in supervisor_agent.knowledge_base:
-            supervisor_agent.knowledge_base['metadata'] = {
-                'last_updated': datetime.now().isoformat(),
-                'total_entries': 0,
-                'categories': []
-            }
-        
-        supervisor_agent.knowledge_base['metadata']['last_updated'] = datetime.now().isoformat()
-        supervisor_agent.knowledge_base['metadata']['total_entries'] += 1
-        
-        if category not in supervisor_agent.knowledge_base['metadata']['categories']:
-            supervisor_agent.knowledge_base['metadata']['categories'].append(category)
-        
-        # Save knowledge base
-        supervisor_agent._save_knowledge_base()
+        metadata = supervisor_agent.knowledge_base.setdefault('metadata', {
+            'last_updated': now_iso,
+            'total_entries': 0,
+            'categories': set()
+        })
+        metadata['last_updated'] = now_iso
+        metadata['total_entries'] += 1
+        metadata['categories'].add(category)
+        
+        # Save knowledge base (coalesced with other recent updates)
+        supervisor_agent.schedule_knowledge_base_save()
         
         # Log update
         if supervisor_agent.config.reporting_enabled:
-            await supervisor_agent.reporting_system.log_audit_event(
+            supervisor_agent.queue_audit_event(
                 event_type="knowledge_base_updated",
                 source="supervisor",
                 message=f"Knowledge base updated: {update_type} in {category}",
@@ -969,34 +1339,24 @@ async def knowledge_base_update(update_type: str, data: dict, category: str = "g
         
         # Calculate statistics
         stats = {
-            'total_entries': supervisor_agent.knowledge_base['metadata']['total_entries'],
-            'categories': len(supervisor_agent.knowledge_base['metadata']['categories']),
-            'last_updated': supervisor_agent.knowledge_base['metadata']['last_updated']
+            'total_entries': metadata['total_entries'],
+            'categories': len(metadata['categories']),
+            'last_updated': metadata['last_updated']
         }
         
-        # Count entries by type
-        entry_counts = {}
-        for key, value in supervisor_agent.knowledge_base.items():
-            if isinstance(value, list) and key != 'metadata':
-                entry_counts[key] = len(value)
-        
         return {
             'success': True,
             'update_id': update_id,
             'update_type': update_type,
             'category': category,
             'knowledge_base_stats': stats,
-            'entry_counts_by_type': entry_counts,
-            'timestamp': datetime.now().isoformat()
+            'entry_counts_by_type': dict(entry_counts),
+            'timestamp': now_iso
         }
     
     except Exception as e:
         logger.error(f"Error in knowledge_base_update: {e}")
-        return {
-            'success': False,
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }
+        return _error_response(e, now_iso)
 
 @mcp.tool()
 async def rollback_state(agent_id: str, snapshot_id: str = None, rollback_steps: int = 1) -> dict:
@@ -1012,23 +1372,22 @@ async def rollback_state(agent_id: str, snapshot_id: str = None, rollback_steps:
         dict: Rollback result and restored state information
     """
     
+    # One clock read shared by every timestamp in this call
+    now_iso = datetime.now().isoformat()
+    
     global supervisor_agent
     if not supervisor_agent:
-        return {
-            'success': False,
-            'error': 'Supervisor not initialized',
-            'timestamp': datetime.now().isoformat()
-        }
+        return _not_initialized(now_iso)
     
     try:
         if not supervisor_agent.config.error_handling_enabled:
             return {
                 'success': False,
                 'error': 'Error handling (including rollback) is disabled',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso
             }
         
-        rollback_id = str(uuid.uuid4())
+        rollback_id = _new_id()
         
         # Use rollback manager
         rollback_manager = supervisor_agent.error_handling.rollback_manager
@@ -1047,7 +1406,7 @@ async def rollback_state(agent_id: str, snapshot_id: str = None, rollback_steps:
                 return {
                     'success': False,
                     'error': f'No snapshots found for agent {agent_id}',
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': now_iso
                 }
             
             # Get snapshot at the specified step back
@@ -1059,24 +1418,24 @@ async def rollback_state(agent_id: str, snapshot_id: str = None, rollback_steps:
                     'success': False,
                     'error': f'Not enough snapshots to rollback {rollback_steps} steps',
                     'available_snapshots': len(snapshots),
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': now_iso
                 }
         
         if result['success']:
             # Update session state if agent is being monitored
-            if agent_id in supervisor_agent.supervised_agents:
-                session_id = supervisor_agent.supervised_agents[agent_id]
+            session_id = supervisor_agent.supervised_agents.get(agent_id)
+            if session_id is not None:
                 session_data = supervisor_agent.active_sessions[session_id]
                 session_data['last_rollback'] = {
                     'rollback_id': rollback_id,
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': now_iso,
                     'snapshot_id': result.get('snapshot_id'),
                     'rollback_steps': rollback_steps
                 }
             
             # Log rollback
             if supervisor_agent.config.reporting_enabled:
-                await supervisor_agent.reporting_system.log_audit_event(
+                supervisor_agent.queue_audit_event(
                     event_type="state_rollback",
                     source="supervisor",
                     message=f"State rollback executed for agent {agent_id}",
@@ -1096,22 +1455,18 @@ async def rollback_state(agent_id: str, snapshot_id: str = None, rollback_steps:
                 'restored_timestamp': result.get('timestamp'),
                 'rollback_steps': rollback_steps,
                 'restored_state_available': True,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso
             }
         else:
             return {
                 'success': False,
                 'error': result.get('error', 'Rollback failed'),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso
             }
     
     except Exception as e:
         logger.error(f"Error in rollback_state: {e}")
-        return {
-            'success': False,
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }
+        return _error_response(e, now_iso)
 
 @mcp.tool()
 async def generate_summary(summary_type: str, time_range: str = "24h", include_recommendations: bool = True) -> dict:
@@ -1127,68 +1482,67 @@ async def generate_summary(summary_type: str, time_range: str = "24h", include_r
         dict: Generated summary with metrics, insights, and recommendations
     """
     
+    # One clock read shared by every timestamp in this call
+    now = datetime.now()
+    now_iso = now.isoformat()
+    
     global supervisor_agent
     if not supervisor_agent:
-        return {
-            'success': False,
-            'error': 'Supervisor not initialized',
-            'timestamp': datetime.now().isoformat()
-        }
+        return _not_initialized(now_iso)
     
     try:
-        summary_id = str(uuid.uuid4())
+        summary_id = _new_id()
         
         # Parse time range
-        time_delta_map = {
-            '1h': timedelta(hours=1),
-            '24h': timedelta(hours=24),
-            '7d': timedelta(days=7),
-            '30d': timedelta(days=30)
-        }
-        
-        time_delta = time_delta_map.get(time_range, timedelta(hours=24))
-        start_time = datetime.now() - time_delta
+        time_delta = _parse_time_range(time_range, timedelta(hours=24))
+        start_time = now - time_delta
         
         # Generate summary based on type
         summary_data = {
             'summary_id': summary_id,
             'summary_type': summary_type,
             'time_range': time_range,
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': now_iso,
             'period_start': start_time.isoformat(),
-            'period_end': datetime.now().isoformat()
+            'period_end': now_iso
         }
         
         if summary_type == 'overview':
+            status_counts = supervisor_agent.active_sessions.status_counts()
             summary_data.update({
                 'supervised_agents': {
                     'total': len(supervisor_agent.supervised_agents),
-                    'active': len([s for s in supervisor_agent.active_sessions.values() if s.get('status') == 'active']),
-                    'paused': len([s for s in supervisor_agent.active_sessions.values() if s.get('status') == 'paused']),
-                    'terminated': len([s for s in supervisor_agent.active_sessions.values() if s.get('status') == 'terminated'])
+                    'active': status_counts['active'],
+                    'paused': status_counts['paused'],
+                    'terminated': status_counts['terminated']
                 },
-                'system_stats': supervisor_agent.stats,
+                'system_stats': supervisor_agent.stats.snapshot(),
                 'monitoring_status': {
                     'enabled': supervisor_agent.config.monitoring_enabled,
                     'active_sessions': len(supervisor_agent.active_sessions)
                 },
+                'audit_status': {
+                    'enabled': supervisor_agent.config.reporting_enabled,
+                    'queued_events': supervisor_agent._audit_queue.qsize(),
+                    'dropped_events': supervisor_agent.stats.audit_events_dropped
+                },
                 'error_handling_status': {
                     'enabled': supervisor_agent.config.error_handling_enabled,
-                    'total_recoveries': supervisor_agent.stats['successful_recoveries'],
-                    'escalated_issues': supervisor_agent.stats['escalated_issues']
+                    'total_recoveries': supervisor_agent.stats.successful_recoveries,
+                    'escalated_issues': supervisor_agent.stats.escalated_issues
                 }
             })
         
         elif summary_type == 'performance':
             # Calculate performance metrics
             total_evaluations = 0
-            total_interventions = supervisor_agent.stats['total_interventions']
+            total_interventions = supervisor_agent.stats.total_interventions
             success_rate = 0.0
             
             if supervisor_agent.config.monitoring_enabled:
                 total_evaluations = supervisor_agent.monitoring_engine.monitoring_stats['total_evaluations']
                 if total_evaluations > 0:
-                    success_rate = (total_evaluations - supervisor_agent.stats['escalated_issues']) / total_evaluations
+                    success_rate = (total_evaluations - supervisor_agent.stats.escalated_issues) / total_evaluations
             
             summary_data.update({
                 'performance_metrics': {
@@ -1196,7 +1550,7 @@ async def generate_summary(summary_type: str, time_range: str = "24h", include_r
                     'total_interventions': total_interventions,
                     'success_rate': success_rate,
                     'average_response_time': '< 1s',  # Placeholder
-                    'system_uptime': str(datetime.now() - supervisor_agent.stats['start_time'])
+                    'system_uptime': str(now - supervisor_agent.stats.start_time)
                 },
                 'intervention_breakdown': {
                     'pause': 0,  # Would be calculated from actual data
@@ -1207,32 +1561,33 @@ async def generate_summary(summary_type: str, time_range: str = "24h", include_r
             })
         
         elif summary_type == 'issues':
-            # Collect recent issues
-            issues = []
-            alerts = []
+            # The intervention index is sorted by timestamp, so the period
+            # is one bisect rather than a parse of every record
+            period_interventions = supervisor_agent.interventions_between(start_time=start_time.isoformat())
+            total_issues = len(period_interventions)
+            critical_count = sum(1 for i in period_interventions if i.get('severity') == 'critical')
             
-            for session_data in supervisor_agent.active_sessions.values():
-                session_interventions = session_data.get('interventions', [])
-                for intervention in session_interventions:
-                    intervention_time = datetime.fromisoformat(intervention['timestamp'])
-                    if intervention_time >= start_time:
-                        issues.append({
-                            'agent_id': session_data.get('agent_id'),
-                            'type': intervention['type'],
-                            'timestamp': intervention['timestamp'],
-                            'severity': intervention.get('severity', 'unknown')
-                        })
+            # Only the last 10 issues are returned, so only they are built
+            recent_issues = [
+                {
+                    'agent_id': intervention['agent_id'],
+                    'type': intervention['type'],
+                    'timestamp': intervention['timestamp'],
+                    'severity': intervention.get('severity', 'unknown')
+                }
+                for intervention in period_interventions[-10:]
+            ]
             
             summary_data.update({
                 'issues_summary': {
-                    'total_issues': len(issues),
-                    'critical_issues': len([i for i in issues if i.get('severity') == 'critical']),
-                    'resolved_issues': supervisor_agent.stats['successful_recoveries'],
-                    'pending_issues': len([i for i in issues if i.get('severity') == 'critical'])
+                    'total_issues': total_issues,
+                    'critical_issues': critical_count,
+                    'resolved_issues': supervisor_agent.stats.successful_recoveries,
+                    'pending_issues': critical_count
                 },
-                'recent_issues': issues[-10:],  # Last 10 issues
+                'recent_issues': recent_issues,  # Last 10 issues
                 'issue_trends': {
-                    'increasing': len(issues) > supervisor_agent.stats['total_interventions'] / 2,
+                    'increasing': total_issues > supervisor_agent.stats.total_interventions / 2,
                     'most_common_type': 'monitoring_alert'  # Placeholder
                 }
             })
@@ -1256,7 +1611,7 @@ async def generate_summary(summary_type: str, time_range: str = "24h", include_r
             if summary_data.get('supervised_agents', {}).get('total', 0) > 10:
                 recommendations.append("Consider implementing auto-scaling for high agent volumes")
             
-            if supervisor_agent.stats['escalated_issues'] > supervisor_agent.stats['successful_recoveries']:
+            if supervisor_agent.stats.escalated_issues > supervisor_agent.stats.successful_recoveries:
                 recommendations.append("Review escalation triggers and improve automated recovery procedures")
             
             if not recommendations:
@@ -1266,7 +1621,7 @@ async def generate_summary(summary_type: str, time_range: str = "24h", include_r
         
         # Log summary generation
         if supervisor_agent.config.reporting_enabled:
-            await supervisor_agent.reporting_system.log_audit_event(
+            supervisor_agent.queue_audit_event(
                 event_type="summary_generated",
                 source="supervisor",
                 message=f"Summary generated: {summary_type} for {time_range}",
@@ -1280,16 +1635,12 @@ async def generate_summary(summary_type: str, time_range: str = "24h", include_r
         return {
             'success': True,
             'summary': summary_data,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now_iso
         }
     
     except Exception as e:
         logger.error(f"Error in generate_summary: {e}")
-        return {
-            'success': False,
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }
+        return _error_response(e, now_iso)
 
 # Server startup
 async def main():
@@ -1297,12 +1648,18 @@ async def main():
     
     logger.info("Starting Comprehensive Supervisor Agent MCP Server")
     
-    # Initialize supervisor
-    global supervisor_agent
-    supervisor_agent = initialize_supervisor()
+    # Build the supervisor and its subsystems before serving, in a worker
+    # thread so the loop stays free while storage and subsystems load;
+    # the tools no longer initialize it lazily inside a request
+    await asyncio.get_running_loop().run_in_executor(None, initialize_supervisor)
     
-    # Start MCP server
-    await mcp.run()
+    # Start MCP server; drain outstanding audit and knowledge base writes
+    # on shutdown
+    try:
+        await mcp.run()
+    finally:
+        await supervisor_agent.flush_audit_events()
+        await supervisor_agent.flush_knowledge_base()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -7,7 +7,7 @@ import json
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 import threading
 import queue
 
@@ -24,6 +24,12 @@ class MonitoringResult:
     overall_status: str
     recommendations: List[str]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow field dict, without the recursive copy asdict makes"""
+        return {name: getattr(self, name) for name in _MONITORING_RESULT_FIELDS}
+
+_MONITORING_RESULT_FIELDS = tuple(f.name for f in fields(MonitoringResult))
+
 class TaskCompletionMonitor:
     """Monitors task completion progress"""
     
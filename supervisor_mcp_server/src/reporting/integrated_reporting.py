@@ -5,15 +5,22 @@ Integrated Reporting System for Supervisor Agent
 Provides comprehensive reporting, alerting, auditing, and dashboard capabilities.
 """
 
+import asyncio
 import json
 import logging
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 from pathlib import Path
-import uuid
+import os
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 class AuditEventType(Enum):
     """Types of audit events"""
     TASK_STARTED = "task_started"
@@ -50,6 +57,12 @@ class AuditEvent:
     agent_id: Optional[str] = None
     task_id: Optional[str] = None
 
+_AUDIT_EVENT_FIELDS = tuple(f.name for f in fields(AuditEvent))
+
+def _new_id() -> str:
+    """Opaque random 128-bit id as 32 hex characters"""
+    return os.urandom(16).hex()
+
 @dataclass
 class Alert:
     """Represents an alert"""
@@ -72,18 +85,54 @@ class ComprehensiveAuditSystem:
         
         self.audit_file = self.storage_path / "audit.jsonl"
         self.events = []
+        # log_many may run on a worker thread alongside log on the loop
+        self._write_lock = threading.Lock()
         
         self.logger = logging.getLogger(__name__)
     
     def log(self, event_type: AuditEventType, level: AuditLevel, 
            source: str, message: str, metadata: Dict[str, Any] = None,
            correlation_id: str = None, agent_id: str = None, 
-           task_id: str = None) -> str:
-        """Log an audit event"""
+           task_id: str = None, timestamp: str = None) -> str:
+        """Log an audit event; timestamp defaults to now"""
         
-        event = AuditEvent(
-            event_id=str(uuid.uuid4()),
-            timestamp=datetime.now().isoformat(),
+        event = self._build_event(event_type, level, source, message, metadata,
+                                  correlation_id, agent_id, task_id, timestamp)
+        
+        with self._write_lock:
+            # Store in memory
+            self.events.append(event)
+            
+            # Write to file
+            with open(self.audit_file, 'a') as f:
+                f.write(self._serialize(event))
+        
+        return event.event_id
+    
+    def log_many(self, entries: List[Dict[str, Any]]) -> List[str]:
+        """Log several audit events with a single file open and write
+        
+        Each entry holds the keyword arguments of log().
+        """
+        events = [self._build_event(**entry) for entry in entries]
+        data = ''.join(self._serialize(event) for event in events)
+        
+        with self._write_lock:
+            self.events.extend(events)
+            
+            with open(self.audit_file, 'a') as f:
+                f.write(data)
+        
+        return [event.event_id for event in events]
+    
+    @staticmethod
+    def _build_event(event_type: AuditEventType, level: AuditLevel,
+                     source: str, message: str, metadata: Dict[str, Any] = None,
+                     correlation_id: str = None, agent_id: str = None,
+                     task_id: str = None, timestamp: str = None) -> AuditEvent:
+        return AuditEvent(
+            event_id=_new_id(),
+            timestamp=timestamp or datetime.now().isoformat(),
             event_type=event_type,
             level=level,
             source=source,
@@ -93,15 +142,21 @@ class ComprehensiveAuditSystem:
             agent_id=agent_id,
             task_id=task_id
         )
-        
-        # Store in memory
-        self.events.append(event)
-        
-        # Write to file
-        with open(self.audit_file, 'a') as f:
-            f.write(json.dumps(asdict(event)) + '\n')
-        
-        return event.event_id
+    
+    @staticmethod
+    def _serialize(event: AuditEvent) -> str:
+        """One JSONL line for an event, with enums written as their values
+        
+        The record is a shallow field dict: the metadata (often a caller's
+        task_config) is encoded in place rather than deep-copied by asdict
+        just to be thrown away after encoding.
+        """
+        record = {name: getattr(event, name) for name in _AUDIT_EVENT_FIELDS}
+        record['event_type'] = event.event_type.value
+        record['level'] = event.level.value
+        if orjson is not None:
+            return orjson.dumps(record, default=str).decode() + '\n'
+        return json.dumps(record, default=str) + '\n'
     
     def get_events(self, filters: Dict[str, Any] = None, 
                   limit: int = 100) -> List[AuditEvent]:
@@ -140,7 +195,7 @@ class ComprehensiveAlertSystem:
         """Send an alert"""
         
         alert = Alert(
-            alert_id=str(uuid.uuid4()),
+            alert_id=_new_id(),
             timestamp=datetime.now().isoformat(),
             severity=severity,
             title=title,
@@ -182,7 +237,7 @@ class PeriodicReportGenerator:
                                format_type: str = "markdown") -> str:
         """Generate and save a comprehensive report"""
         
-        report_id = str(uuid.uuid4())
+        report_id = _new_id()
         
         # Generate report content
         report_data = {
@@ -206,8 +261,11 @@ class PeriodicReportGenerator:
                 f.write(report_content)
         else:
             report_file = self.storage_path / f"report_{report_id}.json"
-            with open(report_file, 'w') as f:
-                json.dump(report_data, f, indent=2)
+            if orjson is not None:
+                report_file.write_bytes(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(report_file, 'w') as f:
+                    json.dump(report_data, f, indent=2)
         
         return str(report_file)
     
@@ -252,7 +310,7 @@ class ConfidenceReportingSystem:
         """Record a confidence score"""
         
         record = {
-            'record_id': str(uuid.uuid4()),
+            'record_id': _new_id(),
             'timestamp': datetime.now().isoformat(),
             'task_id': task_id,
             'agent_id': agent_id,
@@ -290,7 +348,7 @@ class ComprehensivePatternSystem:
         error_events = [e for e in events if e.level == AuditLevel.ERROR]
         if len(error_events) > len(events) * 0.2:  # More than 20% errors
             patterns.append({
-                'pattern_id': str(uuid.uuid4()),
+                'pattern_id': _new_id(),
                 'type': 'high_error_rate',
                 'severity': 'warning',
                 'description': f'High error rate detected: {len(error_events)}/{len(events)} events',
@@ -345,31 +403,32 @@ class IntegratedReportingSystem:
         self.logger = logging.getLogger(__name__)
         self.logger.info("Integrated reporting system initialized")
     
-    async def log_audit_event(self, event_type: str, source: str, 
-                            message: str, metadata: Dict[str, Any] = None,
-                            correlation_id: str = None, agent_id: str = None,
-                            task_id: str = None) -> str:
-        """Log an audit event through the audit system"""
-        
-        # Map string event type to enum
-        event_type_enum = {
-            'task_started': AuditEventType.TASK_STARTED,
-            'task_completed': AuditEventType.TASK_COMPLETED,
-            'task_failed': AuditEventType.TASK_FAILED,
-            'error_occurred': AuditEventType.ERROR_OCCURRED,
-            'intervention_made': AuditEventType.INTERVENTION_MADE,
-            'escalation_triggered': AuditEventType.ESCALATION_TRIGGERED,
-            'alert_generated': AuditEventType.ALERT_GENERATED,
-            'monitoring_started': AuditEventType.MONITORING_STARTED,
-            'monitoring_stopped': AuditEventType.MONITORING_STOPPED,
-            'agent_monitoring_started': AuditEventType.MONITORING_STARTED,
-            'agent_intervention': AuditEventType.INTERVENTION_MADE,
-            'output_validation': AuditEventType.SYSTEM_STATE_CHANGE,
-            'escalation_configured': AuditEventType.CONFIGURATION_CHANGED,
-            'knowledge_base_updated': AuditEventType.SYSTEM_STATE_CHANGE,
-            'state_rollback': AuditEventType.INTERVENTION_MADE,
-            'summary_generated': AuditEventType.SYSTEM_STATE_CHANGE
-        }.get(event_type, AuditEventType.SYSTEM_STATE_CHANGE)
+    # Map string event type to enum
+    _EVENT_TYPES = {
+        'task_started': AuditEventType.TASK_STARTED,
+        'task_completed': AuditEventType.TASK_COMPLETED,
+        'task_failed': AuditEventType.TASK_FAILED,
+        'error_occurred': AuditEventType.ERROR_OCCURRED,
+        'intervention_made': AuditEventType.INTERVENTION_MADE,
+        'escalation_triggered': AuditEventType.ESCALATION_TRIGGERED,
+        'alert_generated': AuditEventType.ALERT_GENERATED,
+        'monitoring_started': AuditEventType.MONITORING_STARTED,
+        'monitoring_stopped': AuditEventType.MONITORING_STOPPED,
+        'agent_monitoring_started': AuditEventType.MONITORING_STARTED,
+        'agent_intervention': AuditEventType.INTERVENTION_MADE,
+        'output_validation': AuditEventType.SYSTEM_STATE_CHANGE,
+        'escalation_configured': AuditEventType.CONFIGURATION_CHANGED,
+        'knowledge_base_updated': AuditEventType.SYSTEM_STATE_CHANGE,
+        'state_rollback': AuditEventType.INTERVENTION_MADE,
+        'summary_generated': AuditEventType.SYSTEM_STATE_CHANGE
+    }
+    
+    def _audit_entry(self, event_type: str, source: str,
+                     message: str, metadata: Dict[str, Any] = None,
+                     correlation_id: str = None, agent_id: str = None,
+                     task_id: str = None, timestamp: str = None) -> Dict[str, Any]:
+        """Resolve a string event type into audit_system.log() arguments"""
+        event_type_enum = self._EVENT_TYPES.get(event_type, AuditEventType.SYSTEM_STATE_CHANGE)
         
         # Determine level based on event type
         level = AuditLevel.INFO
@@ -378,20 +437,41 @@ class IntegratedReportingSystem:
         elif 'alert' in event_type or 'escalation' in event_type:
             level = AuditLevel.WARNING
         
-        return self.audit_system.log(
-            event_type=event_type_enum,
-            level=level,
-            source=source,
-            message=message,
-            metadata=metadata,
-            correlation_id=correlation_id,
-            agent_id=agent_id,
-            task_id=task_id
-        )
+        return {
+            'event_type': event_type_enum,
+            'level': level,
+            'source': source,
+            'message': message,
+            'metadata': metadata,
+            'correlation_id': correlation_id,
+            'agent_id': agent_id,
+            'task_id': task_id,
+            'timestamp': timestamp
+        }
+    
+    async def log_audit_event(self, event_type: str, source: str, 
+                            message: str, metadata: Dict[str, Any] = None,
+                            correlation_id: str = None, agent_id: str = None,
+                            task_id: str = None) -> str:
+        """Log an audit event through the audit system"""
+        return self.audit_system.log(**self._audit_entry(
+            event_type, source, message, metadata, correlation_id, agent_id, task_id
+        ))
+    
+    async def log_audit_events_bulk(self, events: List[Dict[str, Any]]) -> List[str]:
+        """Log a batch of audit events in one write
+        
+        Each event holds the keyword arguments of log_audit_event(), plus an
+        optional timestamp recorded when the event was queued. The file
+        write runs in a worker thread so it does not block the event loop.
+        """
+        entries = [self._audit_entry(**event) for event in events]
+        return await asyncio.to_thread(self.audit_system.log_many, entries)
     
-    async def get_audit_entries(self, filters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
-        """Get audit entries with filters"""
-        events = self.audit_system.get_events(filters)
+    async def get_audit_entries(self, filters: Dict[str, Any] = None,
+                                limit: int = 100) -> List[Dict[str, Any]]:
+        """Get audit entries with filters, newest first"""
+        events = self.audit_system.get_events(filters, limit)
         return [asdict(event) for event in events]
     
     def generate_alert(self, severity: str, title: str, message: str,
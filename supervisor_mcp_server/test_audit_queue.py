@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests for the supervisor's queued audit events
+
+Covers the background flusher, the non-cancelling drain used by
+get_audit_log and the flush that stops the flusher at shutdown.
+Run with pytest or directly as a script.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+# The server logs to logs/ relative to the working directory at import
+# time, so everything runs inside a scratch directory
+_work_dir = tempfile.mkdtemp(prefix="supervisor_audit_test_")
+os.makedirs(os.path.join(_work_dir, "logs"), exist_ok=True)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.chdir(_work_dir)
+
+import server
+from server import IntegratedSupervisorAgent, SupervisorConfig
+
+
+def _make_agent(**overrides):
+    storage = tempfile.mkdtemp(dir=_work_dir)
+    agent = IntegratedSupervisorAgent(SupervisorConfig(storage_path=storage, **overrides))
+    server.supervisor_agent = agent
+    return agent
+
+
+def _queue(agent, message):
+    agent.queue_audit_event(
+        event_type="summary_generated",
+        source="supervisor",
+        message=message,
+        agent_id="audit_test_agent"
+    )
+
+
+def test_flusher_writes_queued_events():
+    async def run():
+        agent = _make_agent(audit_flush_interval=0.05)
+        _queue(agent, "first")
+        _queue(agent, "second")
+        await asyncio.sleep(0.3)
+
+        entries = await agent.reporting_system.get_audit_entries({'agent_id': 'audit_test_agent'})
+        assert sorted(e['message'] for e in entries) == ["first", "second"]
+        await agent.flush_audit_events()
+
+    asyncio.run(run())
+
+
+def test_events_keep_their_queue_time():
+    async def run():
+        # A long flush interval holds the batch open well past queue time
+        agent = _make_agent(audit_flush_interval=0.5)
+        before = datetime.now().isoformat()
+        _queue(agent, "stamped")
+        after = datetime.now().isoformat()
+        await agent.drain_audit_events()
+
+        entries = await agent.reporting_system.get_audit_entries({'agent_id': 'audit_test_agent'})
+        assert len(entries) == 1
+        assert before <= entries[0]['timestamp'] <= after
+        await agent.flush_audit_events()
+
+    asyncio.run(run())
+
+
+def test_get_audit_log_drains_without_stopping_the_flusher():
+    async def run():
+        agent = _make_agent(audit_flush_interval=0.5)
+        _queue(agent, "pending")
+
+        result = await server.get_audit_log(agent_id="audit_test_agent")
+        assert result['success']
+        assert [e['message'] for e in result['entries']] == ["pending"]
+        assert agent._audit_queue.qsize() == 0
+        assert not agent._audit_flusher_task.done()
+
+        _queue(agent, "after drain")
+        await agent.drain_audit_events()
+        entries = await agent.reporting_system.get_audit_entries({'agent_id': 'audit_test_agent'})
+        assert len(entries) == 2
+        await agent.flush_audit_events()
+
+    asyncio.run(run())
+
+
+def test_shutdown_flush_writes_pending_events_and_stops_flusher():
+    async def run():
+        agent = _make_agent(audit_flush_interval=0.5)
+        for i in range(5):
+            _queue(agent, f"event {i}")
+        flusher = agent._audit_flusher_task
+
+        await agent.flush_audit_events()
+        await asyncio.sleep(0)
+
+        assert agent._audit_flusher_task is None
+        assert flusher.cancelled()
+        entries = await agent.reporting_system.get_audit_entries({'agent_id': 'audit_test_agent'})
+        assert len(entries) == 5
+        with open(agent.reporting_system.audit_system.audit_file) as f:
+            assert len(f.readlines()) == 5
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")